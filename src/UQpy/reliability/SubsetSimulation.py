@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
 from UQpy.sampling import *
 from UQpy.utilities.Utilities import process_random_state
 from UQpy.utilities.ValidationTypes import PositiveInteger
@@ -14,6 +17,7 @@ class SubsetSimulation:
         conditional_probability: Annotated[Union[float, int], Is[lambda x: 0 <= x <= 1]] = 0.1,
         nsamples_per_subset: PositiveInteger = 1000,
         max_level: PositiveInteger = 10,
+        delayed_evaluation: bool = False,
     ):
         """
         Perform Subset Simulation to estimate probability of failure.
@@ -31,6 +35,11 @@ class SubsetSimulation:
         :param conditional_probability: Conditional probability for each conditional level. Default: :math:`0.1`
         :param nsamples_per_subset: Number of samples to draw in each conditional level. Default: :math:`1000`
         :param max_level: Maximum number of allowable conditional levels. Default: :math:`10`
+        :param delayed_evaluation: If :any:`True`, the model is evaluated in a background thread and, while it runs, the
+         next proposals of each chain are drawn for both outcomes of the evaluation (the candidate state is accepted or
+         rejected). The proposals matching the actual outcome are kept, so that the chains are unchanged in
+         distribution. This requires a sampler whose chains are propagated independently of each other, i.e.
+         :class:`.MetropolisHastings` or :class:`.ModifiedMetropolisHastings`. Default: :any:`False`
         """
         # Initialize other attributes
         self._sampling_class = sampling
@@ -40,7 +49,11 @@ class SubsetSimulation:
         self.conditional_probability = conditional_probability
         self.nsamples_per_subset = nsamples_per_subset
         self.max_level = max_level
+        self.delayed_evaluation = delayed_evaluation
         self.logger = logging.getLogger(__name__)
+        if self.delayed_evaluation and not isinstance(sampling, (MetropolisHastings, ModifiedMetropolisHastings)):
+            raise ValueError("UQpy: Delayed evaluation requires a MetropolisHastings or ModifiedMetropolisHastings "
+                             "sampler, whose chains are propagated independently.")
         self.mcmc_objects = [sampling]
 
         self.dependent_chains_CoV: float = None
@@ -92,7 +105,7 @@ class SubsetSimulation:
 
         # Run the model with initial samples, sort by their performance function, and identify the conditional level
         self.runmodel_object.run(samples=np.atleast_2d(self.samples[conditional_level]))
-        self.performance_function_per_level.append(np.squeeze(self.runmodel_object.qoi_list))
+        self.performance_function_per_level.append(np.squeeze(self.runmodel_object.latest_qoi).copy())
         g_ind = np.argsort(self.performance_function_per_level[conditional_level])
         self.performance_threshold_per_level.append(self.performance_function_per_level[conditional_level][g_ind[n_keep - 1]])
 
@@ -129,52 +142,12 @@ class SubsetSimulation:
                     "the number of MCMC chains.")
 
             # Propagate each chain n_prop times and evaluate the model to accept or reject.
-            for i in range(n_prop - 1):
-
-                # Propagate each chain
-                if i == 0:
-                    self.mcmc_objects[conditional_level].run(nsamples=2 * self.mcmc_objects[conditional_level].n_chains)
-                else:
-                    self.mcmc_objects[conditional_level].run(nsamples=self.mcmc_objects[conditional_level].n_chains)
-
-                # Decide whether a new simulation is needed for each proposed state
-                a = self.mcmc_objects[conditional_level].samples[i * n_keep : (i + 1) * n_keep, :]
-                b = self.mcmc_objects[conditional_level].samples[(i + 1) * n_keep : (i + 2) * n_keep, :]
-                test1 = np.equal(a, b)
-                test = np.logical_and(test1[:, 0], test1[:, 1])
-
-                # Pull out the indices of the false values in the test list
-                ind_false = [i for i, val in enumerate(test) if not val]
-                # Pull out the indices of the true values in the test list
-                ind_true = [i for i, val in enumerate(test) if val]
-
-                # Do not run the model for those samples where the mcmc state remains unchanged.
-                self.samples[conditional_level][[x + (i + 1) * n_keep for x in ind_true], :] = \
-                    self.mcmc_objects[conditional_level].samples[ind_true, :]
-                self.performance_function_per_level[conditional_level][[x + (i + 1) * n_keep for x in ind_true]] = \
-                    self.performance_function_per_level[conditional_level][ind_true]
-
-                # Run the model at each of the new sample points
-                x_run = self.mcmc_objects[conditional_level].samples[[x + (i + 1) * n_keep for x in ind_false], :]
-                if x_run.size != 0:
-                    self.runmodel_object.run(samples=x_run)
-
-                    # Temporarily save the latest model runs
-                    response_function_values = np.asarray(self.runmodel_object.qoi_list[-len(x_run) :])
-
-                    # Accept the states with g <= g_level
-                    ind_accept = np.where(response_function_values <= self.performance_threshold_per_level[conditional_level - 1])[0]
-                    for j in ind_accept:
-                        self.samples[conditional_level][(i + 1) * n_keep + ind_false[j]] = x_run[j]
-                        self.performance_function_per_level[conditional_level][(i + 1) * n_keep + ind_false[j]] = response_function_values[j]
-
-                    # Reject the states with g > g_level
-                    ind_reject = np.where(response_function_values > self.performance_threshold_per_level[conditional_level - 1])[0]
-                    for k in ind_reject:
-                        self.samples[conditional_level][(i + 1) * n_keep + ind_false[k]] =\
-                            self.samples[conditional_level][i * n_keep + ind_false[k]]
-                        self.performance_function_per_level[conditional_level][(i + 1) * n_keep + ind_false[k]] = \
-                            self.performance_function_per_level[conditional_level][i * n_keep + ind_false[k]]
+            samples, performance_function = self._propagate_chains(
+                self.mcmc_objects[conditional_level], self.samples[conditional_level][:n_keep],
+                self.performance_function_per_level[conditional_level][:n_keep],
+                self.performance_threshold_per_level[conditional_level - 1], n_prop)
+            self.samples[conditional_level] = samples.reshape(self.samples[conditional_level].shape)
+            self.performance_function_per_level[conditional_level] = performance_function.reshape(-1)
 
             g_ind = np.argsort(self.performance_function_per_level[conditional_level])
             self.performance_threshold_per_level.append(self.performance_function_per_level[conditional_level][g_ind[n_keep]])
@@ -194,6 +167,121 @@ class SubsetSimulation:
 
         return failure_probability, probability_cov_independent, probability_cov_dependent
 
+    def failure_probabilities(self, thresholds: Union[float, list, np.ndarray]):
+        """
+        Estimate the probability :math:`P(G < g)` that the performance function is lower than each threshold :math:`g`
+        of a grid, i.e., the failure probability for the failure domains :math:`\\{G < g\\}`, from the samples of the
+        conditional levels of the run. No additional model evaluation is needed.
+
+        For each threshold, the deepest conditional level :math:`i` whose samples are conditioned on a domain that
+        contains :math:`\\{G < g\\}` is used, and the probability is estimated as :math:`p_0^i N_i(g) / N`, where
+        :math:`N_i(g)` is the number of samples of level :math:`i` with :math:`G < g`.
+
+        :param thresholds: Threshold(s) :math:`g` of the performance function.
+        :return: :class:`numpy.ndarray` of the probabilities, of same length as `thresholds`.
+        """
+        return self._failure_probabilities(self.performance_function_per_level, self.performance_threshold_per_level,
+                                           self.conditional_probability, thresholds)
+
+    @staticmethod
+    def _failure_probabilities(performance_function_per_level: list, performance_threshold_per_level: list,
+                               conditional_probability: float, thresholds):
+        thresholds = np.atleast_1d(np.asarray(thresholds, dtype=float))
+        n_levels = len(performance_function_per_level)
+        # The samples of level i >= 1 are conditioned on G <= performance_threshold_per_level[i - 1]
+        level_thresholds = np.asarray(performance_threshold_per_level[:n_levels - 1], dtype=float)
+        levels = np.sum(level_thresholds[np.newaxis, :] >= thresholds[:, np.newaxis], axis=1)
+        probabilities = np.empty((len(thresholds),))
+        for level in np.unique(levels):
+            values = np.sort(np.ravel(performance_function_per_level[level]))
+            selected = levels == level
+            probabilities[selected] = (conditional_probability ** level
+                                       * np.searchsorted(values, thresholds[selected], side="left") / len(values))
+        return probabilities
+
+    def _propagate_chains(self, sampler: MCMC, seeds: np.ndarray, seeds_performance_function: np.ndarray,
+                          threshold: float, n_prop: int):
+        """
+        Propagate the chains of a conditional level with the Modified Metropolis algorithm.
+
+        At each step, the sampler proposes a new state for all chains with :meth:`.MCMC.run_one_iteration`. The model
+        is evaluated in a single call at the states that differ from the current ones, and a state is accepted if its
+        performance function does not exceed the threshold of the previous level. Rejected chains, and chains whose
+        state did not move, keep their current state and performance function without any model evaluation.
+
+        :return: Samples of shape ``(n_prop, n_chains, dimension)`` and performance function values of shape
+         ``(n_prop, n_chains)``
+        """
+        if sampler.evaluate_log_target is None and sampler.evaluate_log_target_marginals is None:
+            (sampler.evaluate_log_target, sampler.evaluate_log_target_marginals,) = sampler._preprocess_target(
+                pdf_=sampler.pdf_target, log_pdf_=sampler.log_pdf_target, args=sampler.args_target)
+        n_chains = len(seeds)
+        samples = np.empty((n_prop, n_chains, sampler.dimension))
+        performance_function = np.empty((n_prop, n_chains))
+        log_pdf_values = np.empty((n_prop, n_chains))
+        samples[0], performance_function[0] = seeds, seeds_performance_function
+        current_state, current_g = np.array(seeds, dtype=float), np.array(seeds_performance_function, dtype=float)
+        # The workers of the sampler evaluating the target, if any, are kept alive for the whole level, and both they
+        # and the thread running the delayed model evaluations are shut down even if a step fails
+        with sampler, ThreadPoolExecutor(max_workers=1) if self.delayed_evaluation else nullcontext() as executor:
+            current_log_pdf = np.reshape(sampler._evaluate_log_target(current_state), (n_chains,)).astype(float)
+            log_pdf_values[0] = current_log_pdf
+            n_accepted = np.zeros((n_chains,))
+
+            if n_prop > 1:
+                candidate, candidate_log_pdf = self._propose(sampler, current_state, current_log_pdf)
+            for i in range(1, n_prop):
+                moved = np.nonzero(np.any(candidate != current_state, axis=1))[0]
+                if executor is not None and i < n_prop - 1:
+                    evaluation = executor.submit(self._evaluate_performance_function, candidate[moved])
+                    # Draw the next proposals for both outcomes while the model runs
+                    next_if_accepted = self._propose(sampler, candidate, candidate_log_pdf)
+                    next_if_rejected = self._propose(sampler, current_state, current_log_pdf)
+                    candidate_g = evaluation.result()
+                else:
+                    candidate_g = self._evaluate_performance_function(candidate[moved])
+
+                accepted = moved[candidate_g <= threshold]
+                current_state[accepted] = candidate[accepted]
+                current_log_pdf[accepted] = candidate_log_pdf[accepted]
+                current_g[accepted] = candidate_g[candidate_g <= threshold]
+                n_accepted[accepted] += 1
+                samples[i], performance_function[i], log_pdf_values[i] = current_state, current_g, current_log_pdf
+
+                if i < n_prop - 1:
+                    if executor is not None:
+                        is_accepted = np.zeros((n_chains,), dtype=bool)
+                        is_accepted[accepted] = True
+                        candidate = np.where(is_accepted[:, np.newaxis], next_if_accepted[0], next_if_rejected[0])
+                        candidate_log_pdf = np.where(is_accepted, next_if_accepted[1], next_if_rejected[1])
+                    else:
+                        candidate, candidate_log_pdf = self._propose(sampler, current_state, current_log_pdf)
+
+        # Store the conditional chains in the sampler, as if they had been generated by its run method
+        sampler.samples = samples
+        sampler.log_pdf_values = log_pdf_values if sampler.save_log_pdf else None
+        sampler.nsamples_per_chain, sampler.samples_counter = n_prop, n_prop * n_chains
+        sampler.acceptance_rate = list(n_accepted / max(n_prop - 1, 1))
+        sampler.diagnostics = None
+        sampler._update_diagnostics()
+        if sampler.concatenate_chains:
+            sampler._concatenate_chains()
+        return samples, performance_function
+
+    @staticmethod
+    def _propose(sampler: MCMC, current_state: np.ndarray, current_log_pdf: np.ndarray):
+        # One iteration of the sampler with respect to the distribution of the random variables, the chain states are
+        # updated in place by the samplers, hence the copies
+        sampler.iterations_number += 1
+        candidate, candidate_log_pdf = sampler.run_one_iteration(current_state.copy(), current_log_pdf.copy())
+        return np.asarray(candidate, dtype=float), np.reshape(candidate_log_pdf, (-1,)).astype(float)
+
+    def _evaluate_performance_function(self, samples: np.ndarray):
+        if len(samples) == 0:
+            return np.empty((0,))
+        self.runmodel_object.run(samples=samples)
+        return np.reshape(np.asarray(self.runmodel_object.latest_qoi, dtype=float), (len(samples),))
+
     def _compute_intermediate_cov(self, conditional_level: int):
         """Computes the coefficient of variation of the intermediate failure probability
 
@@ -233,20 +321,20 @@ class SubsetSimulation:
         :param n_chains: Number of chains in the MCMC algorithm
         :return:
         """
-        gamma = np.zeros(n_samples_per_chain - 1)
-        r = np.zeros(n_samples_per_chain)
-
-        ii = indicator * 1
-        r_ = ii @ ii.T / n_chains - self.conditional_probability ** 2
-        for i in range(r_.shape[0]):
-            r[i] = np.sum(np.diag(r_, i)) / (r_.shape[0] - i)
+        # Lagged sums of products of the indicator along each chain, summed over all chains, computed with the FFT
+        # (they are integers, hence the rounding)
+        n_fft = 2 ** int(np.ceil(np.log2(2 * n_samples_per_chain)))
+        transform = np.fft.rfft(indicator * 1.0, n=n_fft, axis=0)
+        lagged_sums = np.rint(np.sum(np.fft.irfft(np.abs(transform) ** 2, n=n_fft, axis=0)[:n_samples_per_chain],
+                                     axis=1))
+        n_products = n_samples_per_chain - np.arange(n_samples_per_chain)
+        r = (lagged_sums / n_chains - n_products * self.conditional_probability ** 2) / n_products
 
         r0 = 0.1 * (1 - 0.1)
         r = r / r0
 
-        for i in range(n_samples_per_chain - 1):
-            gamma[i] = (1 - ((i + 1) / n_samples_per_chain)) * r[i + 1]
-        gamma = 2 * np.sum(gamma)
+        lags = np.arange(1, n_samples_per_chain)
+        gamma = 2 * np.sum((1 - lags / n_samples_per_chain) * r[lags])
 
         return gamma
 
@@ -257,12 +345,10 @@ class SubsetSimulation:
         :param conditional_level: Index :math:`i` for the intermediate subset
         :return:
         """
-        beta = 0
-        for i in range(np.shape(response_function_values)[1]):
-            for j in range(i + 1, np.shape(response_function_values)[1]):
-                if response_function_values[0, i] == response_function_values[0, j]:
-                    beta += 1
-        beta *= 2
+        # Twice the number of pairs of chains with equal values at the first step, counted by sorting
+        first_values = response_function_values[0, :]
+        _, counts = np.unique(first_values[~np.isnan(first_values)], return_counts=True)
+        beta = int(np.sum(counts * (counts - 1)))
 
         acceptance_rate = np.asarray(self.mcmc_objects[conditional_level].acceptance_rate)
         mean_acceptance_rate = np.mean(acceptance_rate)
@@ -0,0 +1,159 @@
+import copy
+import logging
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.distributions.baseclass import Distribution
+from UQpy.reliability.SubsetSimulation import SubsetSimulation
+from UQpy.run_model.RunModel import RunModel
+from UQpy.run_model.ResultsStore import ResultsStore
+from UQpy.run_model.model_execution.ThirdPartyModel import ThirdPartyModel
+from UQpy.sampling.MonteCarloSampling import MonteCarloSampling
+from UQpy.sampling.mcmc.baseclass.MCMC import MCMC
+from UQpy.utilities.ValidationTypes import *
+from UQpy.utilities.WorkerPool import WorkerPool
+
+
+def _run_worker_replicate(index, seed):
+    return SubsetSimulationReplicates._run_replicate(WorkerPool.payload(), index, seed)
+
+
+class SubsetSimulationReplicates:
+
+    @beartype
+    def __init__(
+        self,
+        runmodel_object: RunModel,
+        sampling: MCMC,
+        n_replicates: PositiveInteger,
+        distributions: Union[None, Distribution, list[Distribution]] = None,
+        conditional_probability: Annotated[Union[float, int], Is[lambda x: 0 <= x <= 1]] = 0.1,
+        nsamples_per_subset: PositiveInteger = 1000,
+        max_level: PositiveInteger = 10,
+        n_workers: Union[None, PositiveInteger] = None,
+        random_state: RandomStateType = None,
+    ):
+        """
+        Run independent replicates of :class:`.SubsetSimulation`, e.g. to estimate the coefficient of variation of the
+        probability of failure empirically.
+
+        Each replicate uses its own random number generator, seeded from an independent stream spawned from
+        `random_state` with :class:`numpy.random.SeedSequence`, for the initial samples and the :class:`.MCMC`
+        sampler. The results therefore do not depend on the number of workers.
+
+        :param runmodel_object: The computational model. It should be of type :class:`.RunModel`. Each replicate runs
+         on a copy of it with empty :py:attr:`.RunModel.results`, hence the evaluations of the replicates are not
+         stored in `runmodel_object`. A :class:`.ThirdPartyModel` is executed by each replicate from its own
+         `replicate_<index>_...` sub-directory of the model directory.
+        :param sampling: Specifies the :class:`.MCMC` algorithm. It is rebuilt for each replicate with the random
+         state of the replicate.
+        :param n_replicates: Number of independent replicates.
+        :param distributions: Distribution(s) of the random variables, used to draw independent initial samples of
+         each replicate with :class:`.MonteCarloSampling`. If not provided, the initial samples are drawn with the
+         :class:`.MCMC` sampler, see input `samples_init` of :class:`.SubsetSimulation`.
+        :param conditional_probability: Conditional probability for each conditional level. Default: :math:`0.1`
+        :param nsamples_per_subset: Number of samples to draw in each conditional level. Default: :math:`1000`
+        :param max_level: Maximum number of allowable conditional levels. Default: :math:`10`
+        :param n_workers: If provided, the replicates are run on a pool of `n_workers` processes. The workers are
+         forked from the calling process when the platform allows it, otherwise the model and the sampler must be
+         picklable. Default: :any:`None`, the replicates are run one after the other in the calling process.
+        :param random_state: Random seed from which the streams of the replicates are spawned. Default is :any:`None`.
+         If an :any:`int` is provided, the replicates are reproducible. A :class:`numpy.random.RandomState` object can
+         also be provided, from which the seed is drawn.
+        """
+        self.runmodel_object = runmodel_object
+        self.sampling = sampling
+        self.n_replicates = n_replicates
+        self.distributions = distributions
+        self.conditional_probability = conditional_probability
+        self.nsamples_per_subset = nsamples_per_subset
+        self.max_level = max_level
+        self.n_workers = n_workers
+        self.random_state = random_state
+        self.logger = logging.getLogger(__name__)
+
+        self.failure_probability_per_replicate: np.ndarray = None
+        """Probability of failure estimate of each replicate."""
+        self.failure_probability: float = None
+        """Mean of the probability of failure estimates of the replicates."""
+        self.coefficient_of_variation: float = None
+        """Empirical coefficient of variation of the probability of failure estimates of the replicates."""
+        self.independent_chains_CoV: np.ndarray = None
+        """Coefficient of variation of the probability of failure estimated by each replicate, assuming independent
+        chains."""
+        self.dependent_chains_CoV: np.ndarray = None
+        """Coefficient of variation of the probability of failure estimated by each replicate, with dependent
+        chains."""
+        self.performance_function_per_level: list = []
+        """For each replicate, the list of arrays of the performance function at the samples of each conditional
+        level, see :py:attr:`.SubsetSimulation.performance_function_per_level`."""
+        self.performance_threshold_per_level: list = []
+        """For each replicate, the list of the thresholds of the performance function of each conditional level, see
+        :py:attr:`.SubsetSimulation.performance_threshold_per_level`."""
+
+        self.logger.info("UQpy: Running " + str(n_replicates) + " replicates of Subset Simulation.")
+        self._run()
+        self.logger.info("UQpy: Subset Simulation replicates complete!")
+
+    def _run(self):
+        if isinstance(self.random_state, np.random.RandomState):
+            seed_sequence = np.random.SeedSequence(int(self.random_state.randint(2 ** 31)))
+        else:
+            seed_sequence = np.random.SeedSequence(self.random_state)
+        seeds = [int(child.generate_state(1)[0]) for child in seed_sequence.spawn(self.n_replicates)]
+        task = (self.runmodel_object, self.sampling, self.distributions,
+                {"conditional_probability": self.conditional_probability,
+                 "nsamples_per_subset": self.nsamples_per_subset, "max_level": self.max_level})
+
+        if self.n_workers is None:
+            results = [self._run_replicate(task, index, seed) for index, seed in enumerate(seeds)]
+        else:
+            with WorkerPool(task, self.n_workers) as pool:
+                results = list(pool.map(_run_worker_replicate, range(self.n_replicates), seeds))
+
+        self.failure_probability_per_replicate = np.array([result["failure_probability"] for result in results])
+        self.independent_chains_CoV = np.array([result["independent_chains_CoV"] for result in results])
+        self.dependent_chains_CoV = np.array([result["dependent_chains_CoV"] for result in results])
+        self.performance_function_per_level = [result["performance_function_per_level"] for result in results]
+        self.performance_threshold_per_level = [result["performance_threshold_per_level"] for result in results]
+        self.failure_probability = float(np.mean(self.failure_probability_per_replicate))
+        self.coefficient_of_variation = float(np.std(self.failure_probability_per_replicate, ddof=1)
+                                              / self.failure_probability) if self.n_replicates > 1 else np.nan
+
+    @staticmethod
+    def _run_replicate(task, index, seed):
+        runmodel_object, sampling, distributions, subset_simulation_inputs = task
+        # Each replicate stores its evaluations in its own results, so that the memory does not grow with the number
+        # of replicates and the calling process and the workers behave alike
+        runmodel_object = copy.copy(runmodel_object)
+        runmodel_object.results = ResultsStore()
+        if isinstance(runmodel_object.model, ThirdPartyModel):
+            # The simulation numbers of all replicates start from 0, hence each replicate needs its own run directories
+            runmodel_object.model = runmodel_object.model.copy_to_subdirectory("replicate_" + str(index) + "_")
+        sampler = sampling.__copy__(random_state=seed, nsamples=None, nsamples_per_chain=None)
+        samples_init = None
+        if distributions is not None:
+            samples_init = MonteCarloSampling(distributions=distributions,
+                                              nsamples=subset_simulation_inputs["nsamples_per_subset"],
+                                              random_state=seed).samples
+        subset_simulation = SubsetSimulation(runmodel_object=runmodel_object, sampling=sampler,
+                                             samples_init=samples_init, **subset_simulation_inputs)
+        return {"failure_probability": subset_simulation.failure_probability,
+                "independent_chains_CoV": subset_simulation.independent_chains_CoV,
+                "dependent_chains_CoV": subset_simulation.dependent_chains_CoV,
+                "performance_function_per_level": subset_simulation.performance_function_per_level,
+                "performance_threshold_per_level": subset_simulation.performance_threshold_per_level}
+
+    def failure_probabilities(self, thresholds: Union[float, list, np.ndarray]):
+        """
+        Estimate the probability :math:`P(G < g)` for each threshold :math:`g` of a grid and each replicate, from the
+        stored performance function values, see :meth:`.SubsetSimulation.failure_probabilities`.
+
+        :param thresholds: Threshold(s) :math:`g` of the performance function.
+        :return: :class:`numpy.ndarray` of shape ``(n_replicates, n_thresholds)``.
+        """
+        return np.array([SubsetSimulation._failure_probabilities(performance_function, thresholds_per_level,
+                                                                 self.conditional_probability, thresholds)
+                         for performance_function, thresholds_per_level
+                         in zip(self.performance_function_per_level, self.performance_threshold_per_level)])
@@ -1,4 +1,5 @@
 from UQpy.reliability.SubsetSimulation import SubsetSimulation
+from UQpy.reliability.SubsetSimulationReplicates import SubsetSimulationReplicates
 from UQpy.reliability.taylor_series import *
 
 from . import TaylorSeries
@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+
+import numpy as np
+from beartype import beartype
+
+from UQpy.utilities.ValidationTypes import PositiveInteger
+
+
+class EvaluationCache:
+    @beartype
+    def __init__(self, path: str = "UQpy_evaluation_cache.sqlite", max_entries: PositiveInteger = None):
+        """
+        Persistent store of model evaluations, used by :class:`.RunModel` to avoid re-evaluating a model at samples
+        for which it has already been run.
+
+        Each evaluation is stored in a local SQLite database under a key built from a hash of the bytes of the sample
+        and of the identity of the model (see :meth:`model_identity`). Since the database lives on disk, the cached
+        evaluations survive across :class:`.RunModel` objects and Python sessions, which allows interrupted studies
+        to be resumed.
+
+        :param path: Path of the SQLite database file. The special value :code:`':memory:'` creates a cache that only
+         lives as long as the object.
+        :param max_entries: Maximum number of evaluations kept in the cache. When the limit is exceeded, the least
+         recently used evaluations are discarded. Default is :any:`None`, i.e. no limit.
+        """
+        self.path = path if path == ":memory:" else os.path.abspath(path)
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+
+        self.hits: int = 0
+        """Number of evaluations retrieved from the cache."""
+        self.misses: int = 0
+        """Number of evaluations that were not found in the cache."""
+
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS evaluations "
+                                 "(key TEXT PRIMARY KEY, qoi BLOB NOT NULL, last_access INTEGER NOT NULL)")
+        self._connection.commit()
+        self._access_counter = self._connection.execute(
+            "SELECT COALESCE(MAX(last_access), 0) FROM evaluations").fetchone()[0]
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+    @staticmethod
+    def model_identity(model):
+        """
+        Return a string identifying `model`. Models may define a :code:`cache_identity` method, otherwise the name
+        of their class is used.
+        """
+        if hasattr(model, "cache_identity"):
+            return model.cache_identity()
+        return type(model).__module__ + "." + type(model).__qualname__
+
+    def keys(self, model, samples):
+        """
+        Compute the cache keys of the rows of `samples` evaluated with `model`.
+
+        :param model: Model object used by :class:`.RunModel`.
+        :param samples: Array of samples of shape ``(nsamples, ...)``.
+        """
+        identity = self.model_identity(model).encode()
+        keys = []
+        for sample in samples:
+            sample = np.asarray(sample)
+            digest = hashlib.sha256(identity)
+            if sample.dtype == object:
+                digest.update(pickle.dumps(sample))
+            else:
+                digest.update(str(sample.dtype).encode() + str(sample.shape).encode())
+                digest.update(np.ascontiguousarray(sample).tobytes())
+            keys.append(digest.hexdigest())
+        return keys
+
+    def get(self, keys):
+        """
+        Retrieve the cached quantities of interest for a list of keys.
+
+        :param keys: List of keys, as returned by :meth:`keys`.
+        :return: Dictionary mapping the keys found in the cache to their quantity of interest.
+        """
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), 500):
+            chunk = unique_keys[start:start + 500]
+            rows = self._connection.execute(
+                "SELECT key, qoi FROM evaluations WHERE key IN (" + ",".join("?" * len(chunk)) + ")", chunk)
+            found.update((key, pickle.loads(qoi)) for key, qoi in rows)
+        if found:
+            self._connection.executemany("UPDATE evaluations SET last_access = ? WHERE key = ?",
+                                         [(self._next_access(), key) for key in found])
+            self._connection.commit()
+        self.hits += sum(key in found for key in keys)
+        self.misses += sum(key not in found for key in keys)
+        return found
+
+    def put(self, keys, qoi):
+        """
+        Store quantities of interest in the cache.
+
+        :param keys: List of keys, as returned by :meth:`keys`.
+        :param qoi: Quantities of interest corresponding to `keys`.
+        """
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO evaluations (key, qoi, last_access) VALUES (?, ?, ?)",
+            [(key, pickle.dumps(value), self._next_access()) for key, value in zip(keys, qoi)])
+        if self.max_entries is not None:
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                self._connection.execute("DELETE FROM evaluations WHERE key IN "
+                                         "(SELECT key FROM evaluations ORDER BY last_access ASC LIMIT ?)", (excess,))
+        self._connection.commit()
+
+    def clear(self):
+        """
+        Delete all cached evaluations.
+        """
+        self._connection.execute("DELETE FROM evaluations")
+        self._connection.commit()
+
+    def close(self):
+        """
+        Close the connection to the database.
+        """
+        self._connection.close()
+
+    def _next_access(self):
+        self._access_counter += 1
+        return self._access_counter
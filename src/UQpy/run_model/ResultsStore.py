@@ -0,0 +1,180 @@
+import numpy as np
+
+
+class ResultsStore:
+    def __init__(self, initial_capacity: int = 16):
+        """
+        Columnar store of the samples and quantities of interest accumulated by :class:`.RunModel`.
+
+        Samples and quantities of interest are kept in preallocated :class:`numpy.ndarray` buffers whose capacity is
+        doubled whenever it is exceeded, so that appending a batch of evaluations costs :math:`O(1)` amortized per
+        sample. The stored data is exposed as views of these buffers, without copies.
+
+        Quantities of interest are stored according to their type:
+
+        * numerical outputs with a common shape are stored in a single array of shape ``(nsamples, ...)``,
+        * dictionaries are stored as named columns, one array per key (see :meth:`column`),
+        * any other output (e.g. outputs of varying shapes) is stored in an array of objects.
+
+        :param initial_capacity: Number of samples for which space is allocated on the first append.
+        """
+        self.initial_capacity = initial_capacity
+        self.clear()
+
+    def clear(self):
+        """
+        Delete all stored samples and quantities of interest.
+        """
+        self._samples = None
+        self._qoi = None
+        self._qoi_columns = None
+        self._qoi_list = None
+        self.nsamples: int = 0
+        """Number of stored samples."""
+        self.n_latest: int = 0
+        """Number of samples appended by the latest call of :meth:`append`."""
+
+    def replace(self, samples, qoi):
+        """
+        Replace all stored samples and quantities of interest.
+
+        :param samples: Array of shape ``(nsamples, ...)`` containing the samples.
+        :param qoi: List or array containing the quantity of interest of each sample, with length ``nsamples``.
+        """
+        samples = np.atleast_2d(samples) if len(samples) > 0 else samples
+        if len(qoi) != len(samples):
+            raise ValueError("\nUQpy: The number of quantities of interest must match the number of samples.\n")
+        self.clear()
+        if len(samples) > 0:
+            self.append(samples, qoi)
+
+    def append(self, samples, qoi):
+        """
+        Append a batch of samples and their corresponding quantities of interest.
+
+        :param samples: Array of shape ``(n_new, ...)`` containing the samples.
+        :param qoi: List or array containing the quantity of interest of each sample, with length ``n_new``.
+        """
+        n_new = len(samples)
+        if len(qoi) != n_new:
+            raise ValueError("\nUQpy: The number of quantities of interest must match the number of samples.\n")
+
+        self._samples = self._write_rows(self._samples, np.asarray(samples), allow_objects=False)
+        if n_new > 0 and all(isinstance(value, dict) for value in qoi):
+            self._append_columns(qoi)
+        elif self._qoi_columns is not None and n_new > 0:
+            raise ValueError("\nUQpy: Quantities of interest cannot mix dictionaries with other types.\n")
+        else:
+            self._qoi = self._write_rows(self._qoi, self._as_rows(qoi))
+
+        self.nsamples += n_new
+        self.n_latest = n_new
+        self._qoi_list = None
+
+    @property
+    def samples(self):
+        """View of all stored samples."""
+        if self._samples is None:
+            return np.atleast_2d([])
+        return self._samples[:self.nsamples]
+
+    @property
+    def latest_samples(self):
+        """View of the samples appended by the latest call of :meth:`append`."""
+        return self.samples[self.nsamples - self.n_latest:]
+
+    @property
+    def qoi(self):
+        """View of all stored quantities of interest. Dictionary outputs are returned as a dictionary of columns."""
+        if self._qoi_columns is not None:
+            return {name: values[:self.nsamples] for name, values in self._qoi_columns.items()}
+        if self._qoi is None:
+            return np.empty(0)
+        return self._qoi[:self.nsamples]
+
+    @property
+    def latest_qoi(self):
+        """View of the quantities of interest appended by the latest call of :meth:`append`."""
+        start = self.nsamples - self.n_latest
+        if self._qoi_columns is not None:
+            return {name: values[start:self.nsamples] for name, values in self._qoi_columns.items()}
+        return self.qoi[start:]
+
+    @property
+    def is_structured(self):
+        """:any:`True` if the quantities of interest are dictionaries stored as named columns."""
+        return self._qoi_columns is not None
+
+    def column(self, name):
+        """
+        View of a named column of dictionary quantities of interest.
+
+        :param name: Key of the quantity of interest.
+        """
+        if self._qoi_columns is None:
+            raise ValueError("\nUQpy: The quantities of interest are not stored as named columns.\n")
+        return self._qoi_columns[name][:self.nsamples]
+
+    def to_list(self):
+        """
+        Return the quantities of interest as a list with one entry per sample. The list is cached until the next
+        modification of the store.
+        """
+        if self._qoi_list is None:
+            if self._qoi_columns is not None:
+                columns = self.qoi
+                self._qoi_list = [{name: values[i] for name, values in columns.items()}
+                                  for i in range(self.nsamples)]
+            else:
+                self._qoi_list = list(self.qoi)
+        return self._qoi_list
+
+    def _append_columns(self, qoi):
+        names = list(qoi[0].keys())
+        if self._qoi_columns is None:
+            if self.nsamples > 0:
+                raise ValueError("\nUQpy: Quantities of interest cannot mix dictionaries with other types.\n")
+            self._qoi_columns = {name: None for name in names}
+        if any(list(value.keys()) != list(self._qoi_columns.keys()) for value in qoi):
+            raise ValueError("\nUQpy: All dictionary quantities of interest must have the same keys.\n")
+        for name in names:
+            self._qoi_columns[name] = self._write_rows(self._qoi_columns[name],
+                                                       self._as_rows([value[name] for value in qoi]))
+
+    def _write_rows(self, buffer, rows, allow_objects=True):
+        n_total = self.nsamples + len(rows)
+        if buffer is None:
+            buffer = np.empty((max(n_total, self.initial_capacity),) + rows.shape[1:], dtype=rows.dtype)
+        elif buffer.shape[1:] != rows.shape[1:] or (buffer.dtype == object) != (rows.dtype == object):
+            if not allow_objects:
+                raise ValueError("\nUQpy: All samples must have the same number of variables.\n")
+            buffer = self._to_objects(buffer[:self.nsamples], len(buffer)) if buffer.dtype != object else buffer
+            rows = self._to_objects(rows, len(rows))
+        elif buffer.dtype != rows.dtype:
+            buffer = buffer.astype(np.result_type(buffer.dtype, rows.dtype))
+
+        if n_total > len(buffer):
+            new_buffer = np.empty((max(n_total, 2 * len(buffer)),) + buffer.shape[1:], dtype=buffer.dtype)
+            new_buffer[:self.nsamples] = buffer[:self.nsamples]
+            buffer = new_buffer
+        buffer[self.nsamples:n_total] = rows
+        return buffer
+
+    @staticmethod
+    def _as_rows(values):
+        if isinstance(values, np.ndarray) and values.ndim > 0:
+            return values
+        try:
+            rows = np.asarray(values)
+            if rows.ndim > 0 and rows.dtype.kind not in "OUS":
+                return rows
+        except ValueError:
+            pass
+        return ResultsStore._to_objects(values, len(values))
+
+    @staticmethod
+    def _to_objects(values, capacity):
+        rows = np.empty(capacity, dtype=object)
+        for i, value in enumerate(values):
+            rows[i] = value
+        return rows
@@ -24,6 +24,10 @@ import numpy as np
 from beartype import beartype
 from enum import Enum, auto
 
+from UQpy.run_model.EvaluationCache import EvaluationCache
+from UQpy.run_model.ResultsStore import ResultsStore
+from UQpy.run_model.model_execution.SerialExecution import SerialExecution
+from UQpy.run_model.model_execution.baseclass.ExecutionBackend import ExecutionBackend
 from UQpy.utilities.ValidationTypes import NumpyFloatArray
 
 class RunType(Enum):
@@ -47,7 +51,9 @@ class RunModel:
             nodes: int = 1,
             resume: bool = False,
             run_type: str = 'LOCAL',
-            cluster_script: str = None
+            cluster_script: str = None,
+            execution_backend: ExecutionBackend = None,
+            cache: EvaluationCache = None
     ):
         """
         Run a computational model at specified sample points.
@@ -87,6 +93,26 @@ class RunModel:
         :param nodes: Number of nodes across which to distribute individual tasks on an HPC cluster in the third-party
          model workflow. If more than one compute node is necessary to execute individual runs in parallel, `nodes` must
          be specified.
+        :param resume: If :any:`True` and no `cache` is provided, an :class:`.EvaluationCache` stored in the file
+         :code:`'UQpy_evaluation_cache.sqlite'` of the current directory is used, so that a study restarted with the
+         same model and samples retrieves the evaluations completed before the interruption instead of repeating them.
+        :param run_type: Location of the parallel model runs, either :code:`'LOCAL'` or :code:`'CLUSTER'`.
+        :param cluster_script: User-provided script launching the model evaluations on an HPC cluster, required if
+         ``run_type='CLUSTER'``.
+        :param execution_backend: Object of a subclass of :class:`.ExecutionBackend` (e.g.
+         :class:`.ProcessPoolExecution` or :class:`.ThreadPoolExecution`) that dispatches the model evaluations. If
+         provided, it takes precedence over `ntasks`, `cores_per_task` and `nodes`. Backends holding persistent workers
+         keep them alive across :meth:`run` calls, so the model object is shipped to the workers only once.
+
+         Default is :any:`None`, in which case the model is executed serially or via `mpirun`, depending on `ntasks`,
+         `cores_per_task` and `nodes`.
+        :param cache: :class:`.EvaluationCache` storing previous model evaluations. Samples found in the cache are not
+         evaluated again, i.e. the preprocessing, execution and postprocessing steps of the model are skipped and the
+         stored quantities of interest are returned. Repeated samples within a single :meth:`run` call are evaluated
+         once. The samples missing from the cache are then executed with consecutive simulation numbers, starting at
+         :py:attr:`n_existing_simulations`, so the simulation number of a sample (e.g. the `run_<i>` directory of a
+         :class:`.ThirdPartyModel`) no longer matches its index in :py:attr:`samples`; the correspondence is given by
+         :py:attr:`evaluated_sample_indices`. Default is :any:`None`, no caching.
         """
         self.logger = logging.getLogger(__name__)
         self.model = model
@@ -101,24 +127,14 @@ class RunModel:
         self.cores_per_task = cores_per_task
 
         self.is_serial = ntasks <= 1 and cores_per_task <= 1 and nodes <= 1
+        self.execution_backend = execution_backend
+        self.cache = EvaluationCache() if cache is None and resume else cache
 
         # Initialize sample related variables
-        self.samples: NumpyFloatArray = []
-        """Internally, :class:`.RunModel` converts the input `samples` into a numpy `ndarray` with at least two 
-        dimension where the first dimension of the :class:`numpy.ndarray` corresponds to a single sample to be executed 
-        by the model."""
-        self.samples = np.atleast_2d(self.samples)
-        self.qoi_list: list = []
-        """A list containing the output quantities of interest
-
-        In the third-party model workflow, these output quantities of interest are extracted from the model output files
-        by `output_script`.
-
-        In the Python model workflow, the returned quantity of interest from the model evaluations is stored as
-        :py:attr:`qoi_list`.
-
-        This attribute is commonly used for adaptive algorithms that employ learning functions based on previous model
-        evaluations."""
+        self.results: ResultsStore = ResultsStore()
+        """Columnar store of the samples and quantities of interest of all model evaluations, see
+        :class:`.ResultsStore`. The :py:attr:`samples`, :py:attr:`qoi`, :py:attr:`latest_qoi` and :py:attr:`qoi_list`
+        attributes are read from this store."""
         self.n_existing_simulations: int = 0
         """Number of pre-existing model evaluations, prior to a new :meth:`run` method call.
 
@@ -127,6 +143,10 @@ class RunModel:
         previously existing model evaluations."""
         self.n_new_simulations: int = 0
         """Number of model evaluations to be performed, ``nsim = len(samples)``."""
+        self.evaluated_sample_indices: list = []
+        """Indices in :py:attr:`samples` of the samples evaluated by the latest :meth:`run` call, ordered by simulation
+        number: simulation ``n_existing_simulations + k`` was run for sample ``evaluated_sample_indices[k]``. Without
+        a `cache`, this is ``range(n_existing_simulations, n_existing_simulations + n_new_simulations)``."""
 
         # Check if samples are provided.
         if samples is None:
@@ -173,32 +193,118 @@ class RunModel:
 
         # If append_samples is False, a new set of samples is created, the previous ones are deleted!
         if not append_samples:
-            self.samples = []
-            self.samples = np.atleast_2d(self.samples)
-            self.qoi_list = []
-
-        # Check if samples already exist, if yes append new samples to old ones
-        # if not self.samples:  # There are currently no samples
-        if self.samples.size == 0:
-            self.n_existing_simulations = 0
-            self.samples = samples
-
-        else:  # Samples already exist in the RunModel object, append new ones
-            self.n_existing_simulations = len(self.samples)
-            self.samples = np.vstack((self.samples, samples))
+            self.results.clear()
+        self.n_existing_simulations = self.results.nsamples
 
         self.model.initialize(samples)
 
-        self.qoi_list.extend(self.serial_execution() if self.is_serial else self.parallel_execution())
+        if self.cache is None:
+            self.evaluated_sample_indices = list(range(self.n_existing_simulations,
+                                                       self.n_existing_simulations + len(samples)))
+            results = self._execute(samples)
+        else:
+            results = self._execute_with_cache(samples)
+        self.results.append(samples, results)
 
         self.model.finalize()
 
-    def parallel_execution(self):
+    def _execute(self, samples):
+        self.n_new_simulations = len(samples)
+        if self.execution_backend is not None:
+            return self.execution_backend.run(self.model, self.n_existing_simulations, self.n_new_simulations,
+                                              samples)
+        return self.serial_execution(samples) if self.is_serial else self.parallel_execution(samples)
+
+    def _execute_with_cache(self, samples):
+        keys = self.cache.keys(self.model, samples)
+        cached = self.cache.get(keys)
+        # Evaluate every sample missing from the cache once, even if it is repeated in the batch
+        first_positions = {}
+        for position, key in enumerate(keys):
+            if key not in cached and key not in first_positions:
+                first_positions[key] = position
+        # The misses are executed with consecutive simulation numbers, whatever their positions in the batch
+        self.evaluated_sample_indices = [self.n_existing_simulations + position
+                                         for position in first_positions.values()]
+        if first_positions:
+            new_keys = list(first_positions)
+            new_results = self._execute(samples[list(first_positions.values())])
+            self.cache.put(new_keys, new_results)
+            cached.update(zip(new_keys, new_results))
+        self.n_new_simulations = len(samples)
+        self.logger.info("\nUQpy: " + str(len(samples) - len(first_positions)) + " of " + str(len(samples))
+                         + " model evaluations retrieved from the cache.\n")
+        return [cached[key] for key in keys]
+
+    @property
+    def samples(self) -> NumpyFloatArray:
+        """Internally, :class:`.RunModel` converts the input `samples` into a numpy `ndarray` with at least two
+        dimension where the first dimension of the :class:`numpy.ndarray` corresponds to a single sample to be executed
+        by the model."""
+        return self.results.samples
+
+    @samples.setter
+    def samples(self, samples):
+        self._replace_results(samples, None)
+
+    @property
+    def qoi(self):
+        """Quantities of interest of all model evaluations, as a view of the :class:`numpy.ndarray` of shape
+        ``(nsamples, ...)`` held by :py:attr:`results`. If the model returns dictionaries, this is a dictionary of
+        columns, one per key."""
+        return self.results.qoi
+
+    @qoi.setter
+    def qoi(self, qoi):
+        self._replace_results(None, qoi)
+
+    @property
+    def latest_qoi(self):
+        """Quantities of interest of the model evaluations performed by the latest :meth:`run` call, as a view of the
+        array returned by :py:attr:`qoi`."""
+        return self.results.latest_qoi
+
+    @property
+    def qoi_list(self) -> list:
+        """A list containing the output quantities of interest
+
+        In the third-party model workflow, these output quantities of interest are extracted from the model output files
+        by `output_script`.
+
+        In the Python model workflow, the returned quantity of interest from the model evaluations is stored as
+        :py:attr:`qoi_list`.
+
+        This attribute is commonly used for adaptive algorithms that employ learning functions based on previous model
+        evaluations. The list is built from :py:attr:`results` and cached until the next :meth:`run` call. Algorithms
+        that only need numerical outputs should prefer the array views :py:attr:`qoi` and :py:attr:`latest_qoi`.
+
+        Assigning :py:attr:`samples`, :py:attr:`qoi` or :py:attr:`qoi_list` replaces the corresponding values in
+        :py:attr:`results`, e.g. ``run_model.qoi_list = []`` deletes all samples and quantities of interest."""
+        return self.results.to_list()
+
+    @qoi_list.setter
+    def qoi_list(self, qoi_list):
+        self._replace_results(None, qoi_list)
+
+    def _replace_results(self, samples, qoi):
+        """
+        Assign the samples or the quantities of interest of :py:attr:`results`. Since they are stored in pairs, assigning
+        an empty value deletes both, and a non-empty value must have one entry per stored sample.
+        """
+        new_values = samples if samples is not None else qoi
+        if len(new_values) == 0 or (isinstance(new_values, np.ndarray) and new_values.size == 0):
+            self.results.clear()
+        elif samples is not None:
+            self.results.replace(samples, self.results.to_list())
+        else:
+            self.results.replace(self.results.samples, qoi)
+
+    def parallel_execution(self, samples):
         # TODO: Check if files with the names used below already exist and raise error
         with open('model.pkl', 'wb') as filehandle:
             pickle.dump(self.model, filehandle)
         with open('samples.pkl', 'wb') as filehandle:
-            pickle.dump(self.samples, filehandle)
+            pickle.dump(samples, filehandle)
             
         if self.run_type is RunType.LOCAL:        
             os.system(f"mpirun python -m "
@@ -223,14 +329,5 @@ class RunModel:
         self.logger.info("\nUQpy: Parallel execution of the python model complete.\n")
         return results
 
-    def serial_execution(self):
-        results = []
-        for i in range(self.n_existing_simulations, self.n_existing_simulations + self.n_new_simulations):
-            sample = self.model.preprocess_single_sample(i, self.samples[i])
-
-            execution_output = self.model.execute_single_sample(i, sample)
-
-            results.append(self.model.postprocess_single_file(i, execution_output))
-
-        self.logger.info("\nUQpy: Serial execution of the python model complete.\n")
-        return results
+    def serial_execution(self, samples):
+        return SerialExecution().run(self.model, self.n_existing_simulations, self.n_new_simulations, samples)
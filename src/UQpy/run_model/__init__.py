@@ -1,3 +1,5 @@
 from UQpy.run_model.RunModel import RunModel
+from UQpy.run_model.ResultsStore import ResultsStore
+from UQpy.run_model.EvaluationCache import EvaluationCache
 
 from UQpy.run_model.model_execution import *
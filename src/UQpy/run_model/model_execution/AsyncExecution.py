@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from beartype import beartype
+
+import UQpy
+from UQpy.run_model.model_execution.ThirdPartyModel import ThirdPartyModel
+from UQpy.run_model.model_execution.baseclass.ExecutionBackend import ExecutionBackend
+from UQpy.utilities.ValidationTypes import PositiveInteger
+
+
+class AsyncExecution(ExecutionBackend):
+    @beartype
+    def __init__(self, max_concurrent_jobs: PositiveInteger = None):
+        """
+        Execution backend that runs each evaluation of a :class:`.ThirdPartyModel` as a separate process and keeps up
+        to `max_concurrent_jobs` of them in flight.
+
+        The scheduler is built on :py:mod:`asyncio`. The run directory and input file of a sample are written just
+        before its process is launched, and its output is collected as soon as the process finishes, so that a new
+        job is started immediately in its place. Samples therefore complete out of order when their runtimes differ,
+        while the quantities of interest are returned in the order of the samples. Each process is started directly
+        in its run directory, without changing the working directory of the calling process.
+
+        The `model_script` and `output_script` of the :class:`.ThirdPartyModel` are imported in the job process, which
+        calls the model object and the output object with the sample index. If an evaluation fails, the processes of
+        the other running evaluations are killed before the error is raised.
+
+        :param max_concurrent_jobs: Maximum number of model evaluations running at the same time. Default is the
+         number of CPUs of the machine.
+        """
+        self.max_concurrent_jobs = max_concurrent_jobs if max_concurrent_jobs is not None else os.cpu_count()
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, model, n_existing_simulations, n_new_simulations, samples):
+        if not isinstance(model, ThirdPartyModel):
+            raise TypeError("UQpy: AsyncExecution only runs a ThirdPartyModel, use SerialExecution or a pool "
+                            "execution backend for a " + type(model).__name__ + ".")
+        jobs = self._run_jobs(model, n_existing_simulations, samples[:n_new_simulations])
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            results = asyncio.run(jobs)
+        else:
+            # An event loop is already running in this thread (e.g. in a notebook), use a separate one
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results = executor.submit(asyncio.run, jobs).result()
+
+        self.logger.info("\nUQpy: Asynchronous execution of the model complete.\n")
+        return results
+
+    async def _run_jobs(self, model, first_index, samples):
+        semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        environment = os.environ.copy()
+        uqpy_path = os.path.dirname(os.path.dirname(UQpy.__file__))
+        environment["PYTHONPATH"] = os.pathsep.join(filter(None, [uqpy_path, environment.get("PYTHONPATH")]))
+        jobs = [asyncio.ensure_future(self._run_job(model, index, sample, semaphore, environment))
+                for index, sample in enumerate(samples, start=first_index)]
+        try:
+            return list(await asyncio.gather(*jobs))
+        except BaseException:
+            # Stop the other evaluations, whose processes are killed when their jobs are cancelled
+            for job in jobs:
+                job.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+            raise
+
+    async def _run_job(self, model, index, sample, semaphore, environment):
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            work_dir = await loop.run_in_executor(None, model.prepare_run_directory, index, sample)
+            process = await asyncio.create_subprocess_exec(*model.job_command(index), cwd=work_dir, env=environment)
+            try:
+                return_code = await process.wait()
+            except BaseException:
+                # A cancelled wait does not terminate the process
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                raise
+        if return_code != 0:
+            raise RuntimeError("\nUQpy: Model evaluation " + str(index) + " failed with exit code "
+                               + str(return_code) + ".\n")
+        qoi = await loop.run_in_executor(None, model.collect_job_output, index, work_dir)
+        self.logger.info("\nUQpy: Model evaluation " + str(index) + " complete.\n")
+        return qoi
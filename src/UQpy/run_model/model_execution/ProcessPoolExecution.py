@@ -0,0 +1,77 @@
+import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from beartype import beartype
+
+from UQpy.run_model.model_execution.baseclass.ExecutionBackend import ExecutionBackend
+from UQpy.utilities.ValidationTypes import PositiveInteger
+
+_worker_model = None
+
+
+def _initialize_worker(serialized_model):
+    global _worker_model
+    _worker_model = pickle.loads(serialized_model)
+
+
+def _evaluate_worker_samples(first_index, samples):
+    return ExecutionBackend._evaluate_samples(_worker_model, first_index, samples)
+
+
+class ProcessPoolExecution(ExecutionBackend):
+    @beartype
+    def __init__(self, max_workers: PositiveInteger = None, chunks_per_worker: PositiveInteger = 1,
+                 start_method: str = None):
+        """
+        Execution backend that evaluates the model on a persistent pool of worker processes.
+
+        The workers are started on the first :meth:`run` call and receive the model object once, when they are
+        initialized. Subsequent :meth:`run` calls only send the blocks of samples to the workers, which removes the
+        interpreter start-up and model serialization costs from repeated calls, e.g. inside adaptive algorithms. The
+        pool is restarted only if a different model object is passed to the backend. The model must therefore not be
+        modified after the first :meth:`run` call.
+
+        :param max_workers: Number of worker processes. Default is the number of CPUs of the machine.
+        :param chunks_per_worker: Number of sample blocks submitted per worker on each :meth:`run` call. Larger values
+         improve load balancing when the runtime varies between samples.
+        :param start_method: Start method of the worker processes (:code:`'fork'`, :code:`'spawn'` or
+         :code:`'forkserver'`). Default is the platform default of :py:mod:`multiprocessing`.
+        """
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.chunks_per_worker = chunks_per_worker
+        self.start_method = start_method
+        self.logger = logging.getLogger(__name__)
+        self._executor = None
+        self._model_id = None
+
+    def run(self, model, n_existing_simulations, n_new_simulations, samples):
+        if self._executor is None or self._model_id != id(model):
+            self._start_workers(model)
+
+        n_chunks = self.max_workers * self.chunks_per_worker
+        futures = [self._executor.submit(_evaluate_worker_samples, n_existing_simulations + start,
+                                         samples[start:stop])
+                   for start, stop in self._chunk_bounds(n_new_simulations, n_chunks)]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+        self.logger.info("\nUQpy: Process pool execution of the model complete.\n")
+        return results
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._model_id = None
+
+    def _start_workers(self, model):
+        self.shutdown()
+        context = None if self.start_method is None else multiprocessing.get_context(self.start_method)
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context,
+                                             initializer=_initialize_worker, initargs=(pickle.dumps(model),))
+        self._model_id = id(model)
+        self.logger.info("\nUQpy: Started " + str(self.max_workers) + " worker processes for model execution.\n")
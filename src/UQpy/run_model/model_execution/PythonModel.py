@@ -1,17 +1,20 @@
+import hashlib
 import logging
+import os
 import pathlib
 import platform
 
 import numpy as np
 from beartype import beartype
 
-from UQpy.utilities.ValidationTypes import Numpy2DFloatArray
+from UQpy.utilities.ValidationTypes import Numpy2DFloatArray, PositiveInteger
 
 
 class PythonModel:
     @beartype
     def __init__(self, model_script: str, model_object_name: str, var_names: list[str] = None,
-                 delete_files: bool = False, **model_object_name_kwargs):
+                 delete_files: bool = False, vectorized: bool = False, batch_size: PositiveInteger = None,
+                 **model_object_name_kwargs):
         """
 
         :param model_script: The filename (with .py extension) of the Python script which contains commands to
@@ -37,6 +40,13 @@ class PythonModel:
          and output processing.
 
          If `delete_files = True`, :class:`.RunModel` will remove all `run_i...` directories in the `model_dir`.
+        :param vectorized: If :any:`True`, the model object is called once with the whole block of samples of shape
+         ``(nsamples, n_vars)`` instead of once per sample, and it must return one quantity of interest per sample
+         along its first dimension. The quantities of interest are stored in a preallocated :class:`numpy.ndarray`.
+         Default is :any:`False`.
+        :param batch_size: Maximum number of samples passed to the model object in a single call. Setting `batch_size`
+         activates the vectorized mode, with the samples split into blocks of at most `batch_size` rows. Default is
+         :any:`None`, in which case a vectorized model receives all samples at once.
         :param model_object_name_kwargs: Additional inputs to the Python object specified by `model_object_name` in the
          Python model workflow.
         """
@@ -55,6 +65,8 @@ class PythonModel:
         self.model_object_name_kwargs = model_object_name_kwargs
 
         self.delete_files = delete_files
+        self.vectorized = vectorized or batch_size is not None
+        self.batch_size = batch_size
 
         # Check if the model script is a python script
         model_extension = pathlib.Path(model_script).suffix
@@ -88,6 +100,41 @@ class PythonModel:
     def postprocess_single_file(self, index, model_output):
         return model_output.qoi if self.model_is_class else model_output
 
+    def cache_identity(self):
+        """
+        Return a string identifying the model, used as part of the keys of an :class:`.EvaluationCache`. It changes
+        whenever the model script, the model object, its keyword arguments or the vectorized mode change.
+        """
+        identity = [self.model_script, str(self.model_object_name), repr(sorted(self.model_object_name_kwargs.items())),
+                    str(self.vectorized)]
+        if os.path.isfile(self.model_script):
+            with open(self.model_script, "rb") as f:
+                identity.append(hashlib.sha256(f.read()).hexdigest())
+        return "|".join(identity)
+
+    def execute_batch(self, first_index, samples):
+        """
+        Evaluate a vectorized model on consecutive blocks of samples.
+
+        :param first_index: Global index of the first sample in `samples`.
+        :param samples: Samples of shape ``(nsamples, n_vars)``.
+        :return: :class:`numpy.ndarray` whose first dimension holds the quantity of interest of each sample.
+        """
+        samples = np.atleast_2d(samples)
+        nsamples = len(samples)
+        batch_size = nsamples if self.batch_size is None else self.batch_size
+        qoi = None
+        for start in range(0, nsamples, batch_size):
+            block = samples[start:start + batch_size]
+            model_output = self.execute_single_sample(first_index + start, block)
+            block_qoi = np.asarray(self.postprocess_single_file(first_index + start, model_output))
+            if block_qoi.ndim == 0 or len(block_qoi) != len(block):
+                raise ValueError("\nUQpy: A vectorized model must return one quantity of interest per sample.\n")
+            if qoi is None:
+                qoi = np.empty((nsamples,) + block_qoi.shape[1:], dtype=block_qoi.dtype)
+            qoi[start:start + len(block)] = block_qoi
+        return qoi
+
     def _check_python_model(self, python_model):
         """
         Check if python model name is valid
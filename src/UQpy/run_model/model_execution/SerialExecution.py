@@ -1,20 +1,17 @@
 import logging
 
-import numpy as np
+from UQpy.run_model.model_execution.baseclass.ExecutionBackend import ExecutionBackend
 
 
-class SerialExecution:
+class SerialExecution(ExecutionBackend):
     def __init__(self):
+        """
+        Execution backend that evaluates the model sequentially in the calling process.
+        """
         self.logger = logging.getLogger(__name__)
 
     def run(self, model, n_existing_simulations, n_new_simulations, samples):
-        results = []
-        for i in range(n_existing_simulations, n_existing_simulations + n_new_simulations):
-            sample = model.preprocess_single_sample(i, samples)
-
-            execution_output = model.execute_single_sample(i, sample)
-
-            results.append(model.postprocess_single_file(i, execution_output))
+        results = self._evaluate_samples(model, n_existing_simulations, samples[:n_new_simulations])
 
         self.logger.info("\nUQpy: Serial execution of the python model complete.\n")
         return results
@@ -0,0 +1,30 @@
+# pragma: no cover
+import inspect
+import os
+import pickle
+import sys
+
+try:
+    model_script, model_object_name, output_script, output_object_name = sys.argv[1:5]
+    index = int(sys.argv[5])
+
+    # The job is started from its run directory, which contains the staged model files. With the 'shared-readonly'
+    # staging, the scripts are only found in the model directory, i.e. the parent of the run directory.
+    sys.path.insert(0, os.getcwd())
+    sys.path.insert(1, os.path.dirname(os.getcwd()))
+
+    model_object = getattr(__import__(model_script[:-3]), model_object_name)
+    model_object(index)
+
+    qoi = None
+    if output_script != "None":
+        output_object = getattr(__import__(output_script[:-3]), output_object_name)
+        model_output = output_object(index)
+        qoi = model_output.qoi if inspect.isclass(output_object) else model_output
+
+    with open("qoi_" + str(index) + ".pkl", "wb") as filehandle:
+        pickle.dump(qoi, filehandle)
+
+except Exception as e:
+    print(e)
+    sys.exit(1)
@@ -1,21 +1,27 @@
 import collections
+import copy
 import datetime
+import hashlib
 import logging
 import os
 import pathlib
+import pickle
 import platform
 import re
 import shutil
 import subprocess
+import sys
+import tempfile
 
 import numpy as np
 
 
 class ThirdPartyModel:
+    STAGING_STRATEGIES = ["copy", "symlink", "hardlink", "shared-readonly"]
 
     def __init__(self, var_names: list[str], input_template: str, model_script: str, output_script: str = None,
                  model_object_name: str = None, output_object_name: str = None, fmt: str = None, separator: str = ', ',
-                 delete_files: bool = False, model_dir: str = "Model_Runs"):
+                 delete_files: bool = False, model_dir: str = "Model_Runs", staging: str = "copy"):
         """
 
         :param var_names: A list containing the names of the variables present in `input_template`.
@@ -78,8 +84,22 @@ class ThirdPartyModel:
         :param model_dir: Specifies the name of the sub-directory from which the model will be executed and to which
          output files will be saved.  A new directory is created by :class:`.RunModel` within the current directory whose name
          is `model_dir` appended with a timestamp.
+        :param staging: Strategy used to make the model files available in the `run_i` directory of each sample.
+
+         * :code:`'copy'`: The model files and directories are copied (default).
+         * :code:`'symlink'`: Symbolic links to the model files and directories of `model_dir` are created.
+         * :code:`'hardlink'`: Hard links to the model files are created. Directories are recreated and their files
+           hard-linked. `model_dir` and the run directories must be on the same file system.
+         * :code:`'shared-readonly'`: Only the input file is written in the run directory. The model reads the
+           remaining files directly from `model_dir`, i.e. the parent of the run directory, and must not modify them.
+
+         With :code:`'symlink'`, :code:`'hardlink'` and :code:`'shared-readonly'`, the model must not modify the
+         shared model files. The number of bytes written to each run directory is reported in
+         :py:attr:`staged_bytes`.
         """
         self.template_text = None
+        self._template_chunks = None
+        self._template_slots = None
         self.logger = logging.getLogger(__name__)
 
         if platform.system() in ["Windows"]:
@@ -87,6 +107,13 @@ class ThirdPartyModel:
         else:
             self.python_command = "python3"
 
+        if staging not in ThirdPartyModel.STAGING_STRATEGIES:
+            raise ValueError("\nUQpy: staging must be one of " + str(ThirdPartyModel.STAGING_STRATEGIES) + ".\n")
+        self.staging = staging
+        self.staged_bytes: dict = {}
+        """Number of bytes written to the run directory of each sample, i.e. the size of the staged model files and
+        of the input file, indexed by the simulation number."""
+
         self.separator = separator
         self.fmt = fmt
         self.check_formatting(fmt)
@@ -202,21 +229,55 @@ class ThirdPartyModel:
         # Read in the text from the template files
         with open(self.input_template, "r") as f:
             self.template_text = str(f.read())
+        self._compile_template()
+
+    def cache_identity(self):
+        """
+        Return a string identifying the model, used as part of the keys of an :class:`.EvaluationCache`. It changes
+        whenever the scripts, the input template or the formatting options change.
+        """
+        identity = [self.model_script, str(self.model_object_name), str(self.output_script),
+                    str(self.output_object_name), str(self.var_names), str(self.fmt), self.separator]
+        for file_name in [self.model_script, self.input_template, self.output_script]:
+            full_file_name = os.path.join(self.parent_dir, str(file_name))
+            if os.path.isfile(full_file_name):
+                with open(full_file_name, "rb") as f:
+                    identity.append(hashlib.sha256(f.read()).hexdigest())
+        return "|".join(identity)
 
     def finalize(self):
-        parent_dir = os.path.dirname(self.model_dir)
-        os.chdir(parent_dir)
+        os.chdir(self.parent_dir)
+
+    def copy_to_subdirectory(self, prefix: str):
+        """
+        Return a copy of the model executed from a new sub-directory of :py:attr:`model_dir`, to which the model files
+        are copied. Independent analyses, e.g. the replicates of :class:`.SubsetSimulationReplicates`, can then run the
+        same model with the same simulation numbers without sharing their `run_i` directories.
+
+        :param prefix: Prefix of the name of the sub-directory, which is made unique by a random suffix.
+        :return: The copy of the model
+        """
+        model = copy.copy(self)
+        model.model_dir = tempfile.mkdtemp(prefix=prefix, dir=self.model_dir)
+        model.staged_bytes = {}
+        for file_name in self.model_files:
+            full_file_name = os.path.join(self.model_dir, os.path.basename(file_name))
+            if not os.path.isdir(full_file_name):
+                shutil.copy(full_file_name, model.model_dir)
+            else:
+                shutil.copytree(full_file_name, os.path.join(model.model_dir, os.path.basename(file_name)))
+        return model
 
     def preprocess_single_sample(self, i, sample):
         work_dir = os.path.join(self.model_dir, "run_" + str(i))
-        self._copy_files(work_dir=work_dir)
+        staged_bytes = self._copy_files(work_dir=work_dir)
 
         # Change current working directory to model run directory
         os.chdir(work_dir)
         self.logger.info("\nUQpy: Running model number " + str(i) + " in the following directory: \n" + work_dir)
 
         # Call the input function
-        self._input_serial(i, sample)
+        self._record_staged_bytes(i, staged_bytes + self._input_serial(i, sample))
 
     def execute_single_sample(self, index, sample_to_send):
         # os.system(f"{self.python_command} {self.model_script} {index}")
@@ -238,6 +299,47 @@ class ThirdPartyModel:
         self.logger.info("\nUQpy: Returning to the model directory:\n" + self.model_dir)
         return output
 
+    def prepare_run_directory(self, index, sample):
+        """
+        Create the run directory of a sample and write its input file, without changing the working directory.
+
+        :param index: The simulation number
+        :param sample: The sample values written in the input file
+        :return: The path of the run directory
+        """
+        work_dir = os.path.join(self.model_dir, "run_" + str(index))
+        staged_bytes = self._copy_files(work_dir=work_dir)
+        text = self._find_and_replace_var_names_with_values(sample=sample)
+        staged_bytes += self._create_input_files(file_name=self.input_template, num=index, text=text,
+                                                 new_folder=os.path.join(work_dir, "InputFiles"))
+        self._record_staged_bytes(index, staged_bytes)
+        return work_dir
+
+    def job_command(self, index):
+        """
+        Command that evaluates the model for one sample in a separate process started from its run directory. The
+        process writes the quantity of interest to the file `qoi_<index>.pkl`.
+
+        :param index: The simulation number
+        """
+        return [sys.executable, "-m", "UQpy.run_model.model_execution.ThirdPartyJob", self.model_script,
+                str(self.model_object_name), str(self.output_script), str(self.output_object_name), str(index)]
+
+    def collect_job_output(self, index, work_dir):
+        """
+        Read the quantity of interest written by the process started with :meth:`job_command` and remove the files
+        copied to the run directory.
+
+        :param index: The simulation number
+        :param work_dir: The run directory returned by :meth:`prepare_run_directory`
+        """
+        qoi_file = os.path.join(work_dir, "qoi_" + str(index) + ".pkl")
+        with open(qoi_file, "rb") as filehandle:
+            qoi = pickle.load(filehandle)
+        os.remove(qoi_file)
+        self._remove_copied_files(work_dir)
+        return qoi
+
     def _input_serial(self, index, sample):
         """
         Create one input file using the template and attach the index to the filename
@@ -249,8 +351,8 @@ class ThirdPartyModel:
         """
         self.new_text = self._find_and_replace_var_names_with_values(sample=sample)
         # Write the new text to the input file
-        self._create_input_files(file_name=self.input_template, num=index, text=self.new_text,
-                                 new_folder="InputFiles", )
+        return self._create_input_files(file_name=self.input_template, num=index, text=self.new_text,
+                                        new_folder="InputFiles", )
 
     def _create_input_files(self, file_name, num, text, new_folder="InputFiles"):
         """
@@ -271,6 +373,8 @@ class ThirdPartyModel:
 
                            Default: 'InputFiles'
         :type new_folder: str
+
+        :return: Size of the created input file in bytes
         """
         if not os.path.exists(new_folder):
             os.makedirs(new_folder)
@@ -280,7 +384,32 @@ class ThirdPartyModel:
         )
         with open(new_name, "w") as f:
             f.write(text)
-        return
+        return os.path.getsize(new_name)
+
+    def _compile_template(self):
+        """
+        Parse the template text once into a render plan of literal chunks and placeholder slots.
+
+        Each slot stores the position of its variable in the sample and its indexing expression. Indices made of
+        integers only (e.g. ``<var1[0][2]>``) are stored as tuples, any other expression is compiled once.
+        """
+        names = sorted(self.var_names, key=len, reverse=True)
+        placeholder = re.compile(r"<(" + "|".join(re.escape(name) for name in names) + r")(\[.*?)?>")
+        variable_index = {name: j for j, name in enumerate(self.var_names)}
+        chunks, slots = [], []
+        position = 0
+        for match in placeholder.finditer(self.template_text):
+            chunks.append(self.template_text[position:match.start()])
+            index_text = match.group(2) or ""
+            if re.fullmatch(r"(\[\s*-?\d+\s*\])*", index_text):
+                index = tuple(int(i) for i in re.findall(r"-?\d+", index_text))
+            else:
+                index = compile("value" + index_text, "<" + self.input_template + ">", "eval")
+            slots.append((variable_index[match.group(1)], index))
+            position = match.end()
+        chunks.append(self.template_text[position:])
+        self._template_chunks = chunks
+        self._template_slots = slots
 
     def _find_and_replace_var_names_with_values(self, sample):
         """
@@ -288,50 +417,32 @@ class ThirdPartyModel:
 
         ** Input: **
 
-        :param index: The sample number
-        :type index: int
+        :param sample: The sample values
         """
-
-        template_text = self.template_text
-        var_names = self.var_names
-
-        new_text = template_text
-        for j in range(self.n_variables):
-            string_regex = re.compile(r"<" + var_names[j] + r".*?>")
-            count = 0
-            for string in string_regex.findall(template_text):
-                temp_check = string[1:-1].split("[")[0]
-                pattern_check = re.compile(var_names[j])
-                if pattern_check.fullmatch(temp_check):
-                    temp = string[1:-1].replace(var_names[j], "sample[" + str(j) + "]")
-                    try:
-                        temp = eval(temp)
-                    except IndexError as err:
-                        print("\nUQpy: Index Error: {0}\n".format(err))
-                        raise IndexError("{0}".format(err))
-
-                    if isinstance(temp, collections.abc.Iterable):
-                        # If it is iterable, flatten and write as text file with designated separator
-                        temp = np.array(temp).flatten()
-                        to_add = ""
-                        for i in range(len(temp) - 1):
-                            if self.fmt is None:
-                                to_add += str(temp[i]) + self.separator
-                            else:
-                                to_add += self.fmt.format(temp[i]) + self.separator
-                        if self.fmt is None:
-                            to_add += str(temp[-1])
-                        else:
-                            to_add += self.fmt.format(temp[-1])
-                    else:
-                        if self.fmt is None:
-                            to_add = str(temp)
-                        else:
-                            to_add = self.fmt.format(temp)
-                    new_text = (new_text[0: new_text.index(string)] + to_add
-                                + new_text[(new_text.index(string) + len(string)):])
-                    count += 1
-        return new_text
+        parts = [self._template_chunks[0]]
+        for (j, index), chunk in zip(self._template_slots, self._template_chunks[1:]):
+            value = sample[j]
+            try:
+                if isinstance(index, tuple):
+                    for i in index:
+                        value = value[i]
+                else:
+                    value = eval(index, {}, {"value": value})
+            except IndexError as err:
+                print("\nUQpy: Index Error: {0}\n".format(err))
+                raise IndexError("{0}".format(err))
+            parts.append(self._format_value(value))
+            parts.append(chunk)
+        return "".join(parts)
+
+    def _format_value(self, value):
+        if isinstance(value, collections.abc.Iterable):
+            # If it is iterable, flatten and write as text file with designated separator
+            values = np.array(value).flatten()
+            if self.fmt is None:
+                return self.separator.join(str(v) for v in values)
+            return self.separator.join(self.fmt.format(v) for v in values)
+        return str(value) if self.fmt is None else self.fmt.format(value)
 
     def _output_serial(self, index):
         """
@@ -349,16 +460,44 @@ class ThirdPartyModel:
         return model_output.qoi if self.model_is_class else model_output
 
     def _copy_files(self, work_dir):
+        """
+        Stage the model files in the run directory according to the `staging` strategy.
+
+        ** Input: **
+
+        :param work_dir: The working directory of the current run.
+        :type work_dir: str
+
+        :return: Number of bytes written to the run directory
+        """
         os.makedirs(work_dir)
+        if self.staging == "shared-readonly":
+            return 0
 
-        # Copy files from the model list to model run directory
+        staged_bytes = 0
+        # Stage files from the model list to model run directory
         for file_name in self.model_files:
-            full_file_name = os.path.join(self.model_dir, file_name)
-            if not os.path.isdir(full_file_name):
-                shutil.copy(full_file_name, work_dir)
+            full_file_name = os.path.join(self.model_dir, os.path.basename(file_name))
+            new_file_name = os.path.join(work_dir, os.path.basename(file_name))
+            if self.staging == "symlink":
+                os.symlink(full_file_name, new_file_name, target_is_directory=os.path.isdir(full_file_name))
+            elif not os.path.isdir(full_file_name):
+                if self.staging == "hardlink":
+                    os.link(full_file_name, new_file_name)
+                else:
+                    shutil.copy(full_file_name, work_dir)
+                    staged_bytes += os.path.getsize(new_file_name)
+            elif self.staging == "hardlink":
+                shutil.copytree(full_file_name, new_file_name, copy_function=os.link)
             else:
-                new_dir_name = os.path.join(work_dir, os.path.basename(full_file_name))
-                shutil.copytree(full_file_name, new_dir_name)
+                shutil.copytree(full_file_name, new_file_name)
+                staged_bytes += sum(os.path.getsize(os.path.join(root, name))
+                                    for root, _, names in os.walk(new_file_name) for name in names)
+        return staged_bytes
+
+    def _record_staged_bytes(self, index, staged_bytes):
+        self.staged_bytes[index] = staged_bytes
+        self.logger.info("\nUQpy: " + str(staged_bytes) + " bytes staged for model number " + str(index) + ".\n")
 
     def _remove_copied_files(self, work_dir):
         """
@@ -369,10 +508,12 @@ class ThirdPartyModel:
         :param work_dir: The working directory of the current run.
         :type work_dir: str
         """
+        if self.staging == "shared-readonly":
+            return
 
         for file_name in self.model_files:
             full_file_name = os.path.join(work_dir, os.path.basename(file_name))
-            if not os.path.isdir(full_file_name):
+            if os.path.islink(full_file_name) or not os.path.isdir(full_file_name):
                 os.remove(full_file_name)
             else:
                 shutil.rmtree(full_file_name)
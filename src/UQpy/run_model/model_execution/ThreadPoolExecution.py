@@ -0,0 +1,49 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from beartype import beartype
+
+from UQpy.run_model.model_execution.baseclass.ExecutionBackend import ExecutionBackend
+from UQpy.utilities.ValidationTypes import PositiveInteger
+
+
+class ThreadPoolExecution(ExecutionBackend):
+    @beartype
+    def __init__(self, max_workers: PositiveInteger = None, chunks_per_worker: PositiveInteger = 1):
+        """
+        Execution backend that evaluates the model on a persistent pool of threads.
+
+        The threads share the model object with the calling process, so no serialization takes place. This backend is
+        best suited to Python models that release the GIL (e.g. models dominated by :py:mod:`numpy` or compiled
+        code). Since all threads share the working directory of the process, it should not be combined with models
+        that change directory during execution.
+
+        :param max_workers: Number of worker threads. Default is the number of CPUs of the machine.
+        :param chunks_per_worker: Number of sample blocks submitted per worker on each :meth:`run` call. Larger values
+         improve load balancing when the runtime varies between samples.
+        """
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.chunks_per_worker = chunks_per_worker
+        self.logger = logging.getLogger(__name__)
+        self._executor = None
+
+    def run(self, model, n_existing_simulations, n_new_simulations, samples):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        n_chunks = self.max_workers * self.chunks_per_worker
+        futures = [self._executor.submit(self._evaluate_samples, model, n_existing_simulations + start,
+                                         samples[start:stop])
+                   for start, stop in self._chunk_bounds(n_new_simulations, n_chunks)]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+        self.logger.info("\nUQpy: Thread pool execution of the model complete.\n")
+        return results
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
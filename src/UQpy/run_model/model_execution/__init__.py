@@ -1,4 +1,8 @@
 # from UQpy.utilities.model_execution.ParallelExecution import *
+from UQpy.run_model.model_execution.baseclass import *
 from UQpy.run_model.model_execution.SerialExecution import *
+from UQpy.run_model.model_execution.ThreadPoolExecution import *
+from UQpy.run_model.model_execution.ProcessPoolExecution import *
+from UQpy.run_model.model_execution.AsyncExecution import *
 from UQpy.run_model.model_execution.PythonModel import *
 from UQpy.run_model.model_execution.ThirdPartyModel import *
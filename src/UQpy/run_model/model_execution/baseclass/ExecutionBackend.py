@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+
+
+class ExecutionBackend(ABC):
+    """
+    Abstract base class of all execution backends. Serves as a template for creating new strategies that
+    :class:`.RunModel` uses to dispatch model evaluations.
+    """
+
+    @abstractmethod
+    def run(self, model, n_existing_simulations, n_new_simulations, samples):
+        """
+        Abstract method that needs to be implemented by the user when creating a new execution backend. It must
+        evaluate `model` at the ``n_new_simulations`` rows of `samples`, whose global indices start at
+        ``n_existing_simulations``, and return the list of quantities of interest in the same order.
+        """
+        pass
+
+    def shutdown(self):
+        """
+        Release any resources (e.g. worker processes or threads) held by the backend. Backends without persistent
+        resources do not need to override this method.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @staticmethod
+    def _evaluate_samples(model, first_index, samples):
+        """
+        Run the preprocess/execute/postprocess sequence of `model` for a block of consecutive samples. Models flagged
+        as vectorized evaluate the whole block through their :code:`execute_batch` method.
+        """
+        if getattr(model, "vectorized", False):
+            return model.execute_batch(first_index, samples)
+        results = []
+        for index, sample in enumerate(samples, start=first_index):
+            sample_to_send = model.preprocess_single_sample(index, sample)
+
+            execution_output = model.execute_single_sample(index, sample_to_send)
+
+            results.append(model.postprocess_single_file(index, execution_output))
+        return results
+
+    @staticmethod
+    def _chunk_bounds(n_samples, n_chunks):
+        """
+        Split ``range(n_samples)`` into at most `n_chunks` contiguous, nearly equal blocks.
+        """
+        n_chunks = max(1, min(n_chunks, n_samples))
+        edges = [(n_samples * k) // n_chunks for k in range(n_chunks + 1)]
+        return [(start, stop) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
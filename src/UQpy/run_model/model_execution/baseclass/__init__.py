@@ -0,0 +1 @@
+from UQpy.run_model.model_execution.baseclass.ExecutionBackend import ExecutionBackend
@@ -32,6 +32,7 @@ class AdaptiveKriging:
             qoi_name: str = None,
             n_add: int = 1,
             random_state: RandomStateType = None,
+            refit_interval: PositiveInteger = 1,
     ):
         """
         Adaptively sample for construction of a kriging surrogate for different objectives including reliability,
@@ -57,6 +58,11 @@ class AdaptiveKriging:
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is :any:`None`.
          If an :any:`int` is provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise,
          the object itself can be passed directly.
+        :param refit_interval: Number of learning iterations between two fits of the surrogate model on all samples,
+         which re-estimate its hyperparameters. In the other iterations, the new samples are added with the
+         :meth:`update` method of the surrogate, e.g. :meth:`.GaussianProcessRegression.update`, which reuses the
+         factorization of the covariance matrix. Surrogates without an :meth:`update` method are always fitted.
+         Default: :math:`1`, the surrogate is fitted at every iteration.
         """
         # Initialize the internal variables of the class.
         self.runmodel_object = runmodel_object
@@ -74,6 +80,7 @@ class AdaptiveKriging:
 
         self.moments = None
         self.n_add = n_add
+        self.refit_interval = refit_interval
         self.indicator = False
         self.pf = []
         self.cov_pf = []
@@ -101,9 +108,9 @@ class AdaptiveKriging:
         self.logger.info("UQpy: Adaptive Kriging - Running the initial sample set using RunModel.")
 
         # Evaluate model at the training points
-        if len(self.runmodel_object.qoi_list) == 0 and samples is not None:
+        if self.runmodel_object.results.nsamples == 0 and samples is not None:
             self.runmodel_object.run(samples=self.samples, append_samples=False)
-        if samples is not None and len(self.runmodel_object.qoi_list) != self.samples.shape[0]:
+        if samples is not None and self.runmodel_object.results.nsamples != self.samples.shape[0]:
             raise NotImplementedError("UQpy: There should be no model evaluation or Number of samples and model "
                                       "evaluation in RunModel object should be same.")
 
@@ -151,7 +158,6 @@ class AdaptiveKriging:
                     self.samples = np.vstack([self.samples, np.array(samples)])
             else:
                 self.samples = np.array(samples)
-                self.runmodel_object.qoi_list = []
 
             self.logger.info("UQpy: Adaptive Kriging - Evaluating the model at the sample set using RunModel.")
 
@@ -184,7 +190,8 @@ class AdaptiveKriging:
         # Primary loop for learning and adding samples.
         # ---------------------------------------------
 
-        for i in range(self.samples.shape[0], self.nsamples):
+        first_iteration = self.samples.shape[0]
+        for i in range(first_iteration, self.nsamples):
             # Initialize the population of samples at which to evaluate the learning function and from which to draw
             # in the sampling.
             random_criterion = Random()
@@ -221,8 +228,12 @@ class AdaptiveKriging:
             # If the quantity of interest is a dictionary, convert it to a list
             self._convert_qoi_tolist()
 
-            # Retrain the surrogate model
-            self.surrogate.fit(self.samples, self.qoi, optimizations_number=1)
+            # Retrain the surrogate model, or only add the new points to it between two scheduled fits
+            if (i - first_iteration + 1) % self.refit_interval == 0 or not hasattr(self.surrogate, "update"):
+                self.surrogate.fit(self.samples, self.qoi, optimizations_number=1)
+            else:
+                new_point = np.atleast_2d(new_point)
+                self.surrogate.update(new_point, np.asarray(self.qoi)[-new_point.shape[0]:])
             self.prediction_model = self.surrogate.predict
 
             # Exit the loop, if error criteria is satisfied
@@ -235,9 +246,7 @@ class AdaptiveKriging:
         self.logger.info("UQpy: Adaptive Kriging complete")
 
     def _convert_qoi_tolist(self):
-        self.qoi = [None] * len(self.runmodel_object.qoi_list)
-        if type(self.runmodel_object.qoi_list[0]) is dict:
-            for j in range(len(self.runmodel_object.qoi_list)):
-                self.qoi[j] = self.runmodel_object.qoi_list[j][self.qoi_name]
+        if self.runmodel_object.results.is_structured:
+            self.qoi = self.runmodel_object.results.column(self.qoi_name)
         else:
-            self.qoi = self.runmodel_object.qoi_list
+            self.qoi = self.runmodel_object.qoi
@@ -0,0 +1,224 @@
+import numpy as np
+
+
+class ChainDiagnostics:
+    def __init__(self, n_chains: int, dimension: int, n_batches: int = 64):
+        """
+        Online convergence diagnostics of a set of Markov chains, updated by :class:`.MCMC` as samples are stored.
+
+        The stored samples of each chain are summarized by the running mean and sum of squared deviations (Welford's
+        algorithm) of consecutive batches of samples. Whenever :code:`2 * n_batches` batches are complete, pairs of
+        consecutive batches are merged and the batch size is doubled, so that the memory and the cost of the
+        diagnostics do not grow with the length of the chains, and updating them costs :math:`O(dimension)` per chain
+        and stored sample. The split :math:`\\hat{R}` and the bulk effective sample size are computed from these batch
+        summaries, see :meth:`split_rhat` and :meth:`bulk_ess`.
+
+        :param n_chains: Number of chains.
+        :param dimension: Dimension of the samples.
+        :param n_batches: Minimum number of batches kept per chain once the batch size starts growing.
+        """
+        self.n_chains, self.dimension, self.n_batches = n_chains, dimension, n_batches
+        self.batch_size: int = 1
+        """Number of samples per chain summarized in each batch."""
+        self.nsamples_per_chain: int = 0
+        """Number of samples per chain included in the diagnostics."""
+        self.acceptance_rate = None
+        """Acceptance rate of each chain, as provided at the last update."""
+
+        self._n_full_batches = 0
+        self._batch_means = np.zeros((2 * n_batches, n_chains, dimension))
+        self._batch_m2 = np.zeros((2 * n_batches, n_chains, dimension))
+        self._partial_count = 0
+        self._partial_mean = np.zeros((n_chains, dimension))
+        self._partial_m2 = np.zeros((n_chains, dimension))
+
+    def update(self, states: np.ndarray, acceptance_rate=None):
+        """
+        Include new samples of the chains in the diagnostics.
+
+        :param states: New samples, :class:`numpy.ndarray` of shape ``(nsamples, n_chains, dimension)``.
+        :param acceptance_rate: Current acceptance rate of each chain.
+        """
+        states = np.reshape(states, (-1, self.n_chains, self.dimension))
+        start = 0
+        while start < len(states):
+            chunk = states[start:start + self.batch_size - self._partial_count]
+            start += len(chunk)
+            self._merge_chunk(chunk)
+            if self._partial_count == self.batch_size:
+                self._push_batch()
+        self.nsamples_per_chain += len(states)
+        if acceptance_rate is not None:
+            self.acceptance_rate = np.array(acceptance_rate)
+
+    @property
+    def mean(self):
+        """Running mean of each chain, :class:`numpy.ndarray` of shape ``(n_chains, dimension)``."""
+        return self._chain_moments()[0]
+
+    @property
+    def variance(self):
+        """Running (unbiased) variance of each chain, :class:`numpy.ndarray` of shape ``(n_chains, dimension)``."""
+        mean, m2 = self._chain_moments()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return m2 / (self.nsamples_per_chain - 1)
+
+    def split_rhat(self):
+        """
+        Split :math:`\\hat{R}` convergence diagnostic of each dimension (:cite:`MCMC1`): every chain is split in two
+        halves, and the variance of all halves is compared to their within-half variance. Values close to :math:`1`
+        indicate convergence. The halves are made of complete batches of samples.
+
+        :return: :class:`numpy.ndarray` of shape ``(dimension, )``, :any:`numpy.nan` while less than two batches
+         are complete.
+        """
+        n_half_batches = self._n_full_batches // 2
+        n = n_half_batches * self.batch_size
+        if n < 2:
+            return np.full((self.dimension,), np.nan)
+        means, m2 = self._batch_means[:self._n_full_batches], self._batch_m2[:self._n_full_batches]
+        halves = [slice(0, n_half_batches), slice(self._n_full_batches - n_half_batches, self._n_full_batches)]
+        half_means = np.concatenate([np.mean(means[half], axis=0) for half in halves])
+        half_variances = np.concatenate([
+            (np.sum(m2[half], axis=0) + self.batch_size * np.sum((means[half] - np.mean(means[half], axis=0)) ** 2,
+                                                                  axis=0)) / (n - 1) for half in halves])
+        within = np.mean(half_variances, axis=0)
+        var_plus = (n - 1) / n * within + np.var(half_means, axis=0, ddof=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(var_plus / within)
+
+    def bulk_ess(self):
+        """
+        Effective sample size of each dimension, for the estimation of the mean over all chains.
+
+        The autocorrelation of the series of batch means is estimated with the FFT, which corrects for the correlation
+        that remains between consecutive batches, see :meth:`effective_sample_size`. The effective sample size of the
+        batch means is then scaled by the ratio of the variance of the samples to the variance of the batch means.
+
+        :return: :class:`numpy.ndarray` of shape ``(dimension, )``, :any:`numpy.nan` while less than four batches are
+         complete.
+        """
+        n_batches = self._n_full_batches
+        if n_batches < 4:
+            return np.full((self.dimension,), np.nan)
+        means, m2 = self._batch_means[:n_batches], self._batch_m2[:n_batches]
+        n = n_batches * self.batch_size
+        chain_means = np.mean(means, axis=0)
+        between = np.var(chain_means, axis=0, ddof=1) if self.n_chains > 1 else 0.0
+        within_samples = np.mean((np.sum(m2, axis=0) + self.batch_size * np.sum((means - chain_means) ** 2, axis=0))
+                                 / (n - 1), axis=0)
+        within_batches = np.mean(np.var(means, axis=0, ddof=1), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (self.effective_sample_size(means)
+                    * ((n - 1) / n * within_samples + between)
+                    / ((n_batches - 1) / n_batches * within_batches + between))
+
+    @staticmethod
+    def tail_ess(samples: np.ndarray, probability: float = 0.05):
+        """
+        Effective sample size of each dimension for the estimation of the quantiles of order `probability` and
+        :code:`1 - probability`, computed as the minimum of the effective sample sizes of the indicator functions of
+        the corresponding tails.
+
+        Unlike :meth:`split_rhat` and :meth:`bulk_ess`, this requires the full chains, as the quantiles are only known
+        once all samples are available.
+
+        :param samples: Samples of all chains, :class:`numpy.ndarray` of shape ``(nsamples, n_chains, dimension)``.
+        :param probability: Probability of the lower tail.
+        :return: :class:`numpy.ndarray` of shape ``(dimension, )``.
+        """
+        samples = np.asarray(samples)
+        lower, upper = np.quantile(samples.reshape((-1, samples.shape[-1])), [probability, 1.0 - probability], axis=0)
+        return np.minimum(ChainDiagnostics.effective_sample_size((samples <= lower).astype(float)),
+                          ChainDiagnostics.effective_sample_size((samples >= upper).astype(float)))
+
+    @staticmethod
+    def effective_sample_size(samples: np.ndarray):
+        """
+        Multi-chain effective sample size of each dimension (:cite:`MCMC_diagnostics`). The autocorrelation of the
+        chains is computed with the FFT and truncated with Geyer's initial monotone sequence estimator.
+
+        :param samples: Samples of all chains, :class:`numpy.ndarray` of shape ``(nsamples, n_chains, dimension)``.
+        :return: :class:`numpy.ndarray` of shape ``(dimension, )``.
+        """
+        samples = np.asarray(samples)
+        n, n_chains = samples.shape[:2]
+        if n < 4:
+            return np.full(samples.shape[2:], np.nan)
+        centered = samples - np.mean(samples, axis=0)
+        n_fft = 2 ** int(np.ceil(np.log2(2 * n)))
+        transform = np.fft.rfft(centered, n=n_fft, axis=0)
+        autocovariance = np.fft.irfft(transform * np.conjugate(transform), n=n_fft, axis=0)[:n] / n
+
+        within = np.mean(autocovariance[0] * n / (n - 1), axis=0)
+        between = np.var(np.mean(samples, axis=0), axis=0, ddof=1) if n_chains > 1 else 0.0
+        var_plus = (n - 1) / n * within + between
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rho = 1.0 - (within - np.mean(autocovariance, axis=1)) / var_plus
+            rho[0] = 1.0
+            # Geyer's initial positive and monotone sequence on the sums of consecutive autocorrelations
+            pairs = rho[0:2 * (n // 2):2] + rho[1:2 * (n // 2):2]
+            positive = np.cumprod(pairs > 0, axis=0).astype(bool)
+            pairs = np.minimum.accumulate(pairs, axis=0)
+            tau = -1.0 + 2.0 * np.sum(np.where(positive, pairs, 0.0), axis=0)
+            tau = np.maximum(tau, 1.0 / np.log10(n * n_chains))
+            return np.where(var_plus > 0, n * n_chains / tau, np.nan)
+
+    def converged(self, rhat: float = None, min_ess: float = None, min_tail_ess: float = None,
+                  samples: np.ndarray = None):
+        """
+        Check whether the diagnostics of all dimensions meet the given targets.
+
+        :param rhat: Threshold below which the split :math:`\\hat{R}` of all dimensions must be.
+        :param min_ess: Minimum bulk effective sample size of all dimensions.
+        :param min_tail_ess: Minimum tail effective sample size of all dimensions, requires `samples`.
+        :param samples: Samples of all chains, of shape ``(nsamples, n_chains, dimension)``, used for the tail
+         effective sample size.
+        """
+        if rhat is not None and not np.all(self.split_rhat() < rhat):
+            return False
+        if min_ess is not None and not np.all(self.bulk_ess() >= min_ess):
+            return False
+        if min_tail_ess is not None and not np.all(self.tail_ess(samples) >= min_tail_ess):
+            return False
+        return True
+
+    def _merge_chunk(self, chunk):
+        # Chan et al. update of the moments of the partial batch, which reduces to Welford's for a single sample
+        n_a, n_b = self._partial_count, len(chunk)
+        chunk_mean = np.mean(chunk, axis=0)
+        delta = chunk_mean - self._partial_mean
+        self._partial_mean += delta * n_b / (n_a + n_b)
+        self._partial_m2 += np.sum((chunk - chunk_mean) ** 2, axis=0) + delta ** 2 * n_a * n_b / (n_a + n_b)
+        self._partial_count += n_b
+
+    def _push_batch(self):
+        self._batch_means[self._n_full_batches] = self._partial_mean
+        self._batch_m2[self._n_full_batches] = self._partial_m2
+        self._n_full_batches += 1
+        self._partial_count = 0
+        self._partial_mean = np.zeros((self.n_chains, self.dimension))
+        self._partial_m2 = np.zeros((self.n_chains, self.dimension))
+        if self._n_full_batches == 2 * self.n_batches:
+            first, second = self._batch_means[0::2].copy(), self._batch_means[1::2].copy()
+            self._batch_m2[:self.n_batches] = (self._batch_m2[0::2] + self._batch_m2[1::2]
+                                               + (first - second) ** 2 * self.batch_size / 2)
+            self._batch_means[:self.n_batches] = (first + second) / 2
+            self._n_full_batches = self.n_batches
+            self.batch_size *= 2
+
+    def _chain_moments(self):
+        means = self._batch_means[:self._n_full_batches]
+        count = self._n_full_batches * self.batch_size
+        if self._n_full_batches == 0:
+            mean, m2 = np.zeros((self.n_chains, self.dimension)), np.zeros((self.n_chains, self.dimension))
+        else:
+            mean = np.mean(means, axis=0)
+            m2 = (np.sum(self._batch_m2[:self._n_full_batches], axis=0)
+                  + self.batch_size * np.sum((means - mean) ** 2, axis=0))
+        if self._partial_count > 0:
+            total = count + self._partial_count
+            delta = self._partial_mean - mean
+            mean = mean + delta * self._partial_count / total
+            m2 = m2 + self._partial_m2 + delta ** 2 * count * self._partial_count / total
+        return mean, m2
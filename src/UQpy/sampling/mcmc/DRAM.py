@@ -30,6 +30,9 @@ class DRAM(MCMC):
             delayed_rejection_scale: float = 1 / 5,
             save_covariance: bool = False,
             random_state: RandomStateType = None,
+            block_size: PositiveInteger = None,
+            storage: str = None,
+            n_workers: PositiveInteger = None,
             n_chains: int = None,
             nsamples: int = None,
             nsamples_per_chain: int = None,
@@ -89,6 +92,13 @@ class DRAM(MCMC):
          Default: :any:`False`
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is
          :any:`None`.
+        :param block_size: If provided, the chains are advanced by blocks of `block_size` iterations, and the states
+         that survive burn-in and thinning are stored once per block. Default: :any:`None`, the chains are advanced
+         and stored one iteration at a time. See :meth:`.MCMC.run_block`.
+        :param storage: Path of a directory in which the chains are streamed as memory-mapped files, see
+         :class:`.MCMC`. Default: :any:`None`, the chains are kept in memory.
+        :param n_workers: If provided, the target is evaluated on a pool of `n_workers` processes, each of them evaluating
+         a chunk of chains, see :class:`.MCMC`. Default: :any:`None`, the target is evaluated in the calling process.
         :param nsamples: Number of samples to generate.
         :param nsamples_per_chain: Number of samples to generate per chain.
         """
@@ -105,6 +115,9 @@ class DRAM(MCMC):
             save_log_pdf=save_log_pdf,
             concatenate_chains=concatenate_chains,
             random_state=random_state,
+            block_size=block_size,
+            storage=storage,
+            n_workers=n_workers,
             n_chains=n_chains,
         )
 
@@ -167,25 +180,16 @@ class DRAM(MCMC):
                                    .reshape((self.dimension,))
 
         # Compute log_pdf_target of candidate sample
-        log_p_candidate = self.evaluate_log_target(candidate)
-
-        # Compare candidate with current sample and decide or not to keep the candidate (loop over nc chains)
-        accept_vec = np.zeros((self.n_chains,))
-        delayed_chains_indices = ([])  # indices of chains that will undergo delayed rejection
-        unif_rvs = (Uniform().rvs(nsamples=self.n_chains, random_state=self.random_state)
-                    .reshape((-1,)))
-        for nc, (cand, log_p_cand, log_p_curr) in enumerate(
-                zip(candidate, log_p_candidate, current_log_pdf)):
-            accept = np.log(unif_rvs[nc]) < log_p_cand - log_p_curr
-            if accept:
-                current_state[nc, :] = cand
-                current_log_pdf[nc] = log_p_cand
-                accept_vec[nc] += 1.0
-            else:  # enter delayed rejection
-                delayed_chains_indices.append(nc)  # these indices will enter the delayed rejection part
+        log_p_candidate = self._evaluate_log_target(candidate)
+
+        # Compare candidate with current sample and decide or not to keep the candidate (all chains at once)
+        accept = self._accept_reject(log_p_candidate - current_log_pdf, candidate, log_p_candidate,
+                                     current_state, current_log_pdf)
+        accept_vec = accept.astype(float)
+        delayed_chains_indices = np.nonzero(~accept)[0]  # indices of chains that will undergo delayed rejection
 
         # Delayed rejection
-        if delayed_chains_indices:  # performed delayed rejection for some chains
+        if len(delayed_chains_indices) > 0:  # performed delayed rejection for some chains
             current_states_delayed = np.zeros(
                 (len(delayed_chains_indices), self.dimension))
             candidates_delayed = np.zeros((len(delayed_chains_indices), self.dimension))
@@ -200,30 +204,23 @@ class DRAM(MCMC):
                                    multivariate_normal.rvs(nsamples=1, random_state=self.random_state) \
                                        .reshape((self.dimension,))
             # Evaluate their log_target
-            log_p_candidate2 = self.evaluate_log_target(candidate2)
+            log_p_candidate2 = self._evaluate_log_target(candidate2)
             log_prop_cand_cand2 = multivariate_normal.log_pdf(candidates_delayed - candidate2)
             log_prop_cand_curr = multivariate_normal.log_pdf(candidates_delayed - current_states_delayed)
             # Accept or reject
-            unif_rvs = (Uniform().rvs(nsamples=len(delayed_chains_indices),
-                                      random_state=self.random_state).reshape((-1,)))
-            for (nc, cand2, log_p_cand2, j1, j2, u_rv) in zip(
-                    delayed_chains_indices,
-                    candidate2,
-                    log_p_candidate2,
-                    log_prop_cand_cand2,
-                    log_prop_cand_curr,
-                    unif_rvs,
-            ):
-                alpha_cand_cand2 = min(1.0, np.exp(log_p_candidate[nc] - log_p_cand2))
-                alpha_cand_curr = min(1.0, np.exp(log_p_candidate[nc] - current_log_pdf[nc]))
-                log_alpha2 = (log_p_cand2 - current_log_pdf[nc] + j1 - j2
-                              + np.log(max(1.0 - alpha_cand_cand2, 10 ** (-320)))
-                              - np.log(max(1.0 - alpha_cand_curr, 10 ** (-320))))
-                accept = np.log(u_rv) < min(0.0, log_alpha2)
-                if accept:
-                    current_state[nc, :] = cand2
-                    current_log_pdf[nc] = log_p_cand2
-                    accept_vec[nc] += 1.0
+            log_p_candidate1 = log_p_candidate[delayed_chains_indices]
+            log_p_current = current_log_pdf[delayed_chains_indices]
+            alpha_cand_cand2 = np.minimum(1.0, np.exp(log_p_candidate1 - log_p_candidate2))
+            alpha_cand_curr = np.minimum(1.0, np.exp(log_p_candidate1 - log_p_current))
+            log_alpha2 = (log_p_candidate2 - log_p_current + log_prop_cand_cand2 - log_prop_cand_curr
+                          + np.log(np.maximum(1.0 - alpha_cand_cand2, 10 ** (-320)))
+                          - np.log(np.maximum(1.0 - alpha_cand_curr, 10 ** (-320))))
+            states_delayed = current_state[delayed_chains_indices]
+            accept = self._accept_reject(np.minimum(0.0, log_alpha2), candidate2, log_p_candidate2,
+                                         states_delayed, log_p_current)
+            accept_vec[delayed_chains_indices] += accept
+            current_state[delayed_chains_indices] = states_delayed
+            current_log_pdf[delayed_chains_indices] = log_p_current
 
         # Adaptive part: update the covariance
         for nc in range(self.n_chains):
@@ -244,6 +241,17 @@ class DRAM(MCMC):
         self._update_acceptance_rate(accept_vec)
         return current_state, current_log_pdf
 
+    def _get_adaptive_state(self):
+        state = {"current_covariance": self.current_covariance, "sample_mean": self.sample_mean,
+                 "sample_covariance": self.sample_covariance}
+        if self.save_covariance:
+            state["adaptive_covariance"] = self.adaptive_covariance
+        return state
+
+    def _set_adaptive_state(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @staticmethod
     def _recursive_update_mean_covariance(
             nsamples, new_sample, previous_mean, previous_covariance=None
@@ -34,6 +34,9 @@ class DREAM(MCMC):
             crossover_adaptation: tuple = (-1, 1),
             check_chains: tuple = (-1, 1),
             random_state: RandomStateType = None,
+            block_size: PositiveInteger = None,
+            storage: str = None,
+            n_workers: PositiveInteger = None,
             n_chains: int = None,
             nsamples: int = None,
             nsamples_per_chain: int = None,
@@ -91,6 +94,13 @@ class DREAM(MCMC):
          iterations if :code:`iter<iter_max`). Default: :code:`(-1, 1)`, i.e., no check on outlier chains
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is
          :any:`None`.
+        :param block_size: If provided, the chains are advanced by blocks of `block_size` iterations, and the states
+         that survive burn-in and thinning are stored once per block. Default: :any:`None`, the chains are advanced
+         and stored one iteration at a time. See :meth:`.MCMC.run_block`.
+        :param storage: Path of a directory in which the chains are streamed as memory-mapped files, see
+         :class:`.MCMC`. Default: :any:`None`, the chains are kept in memory.
+        :param n_workers: If provided, the target is evaluated on a pool of `n_workers` processes, each of them evaluating
+         a chunk of chains, see :class:`.MCMC`. Default: :any:`None`, the target is evaluated in the calling process.
 
         :param nsamples: Number of samples to generate.
         :param nsamples_per_chain: Number of samples to generate per chain.
@@ -108,6 +118,9 @@ class DREAM(MCMC):
             save_log_pdf=save_log_pdf,
             concatenate_chains=concatenate_chains,
             random_state=random_state,
+            block_size=block_size,
+            storage=storage,
+            n_workers=n_workers,
             n_chains=n_chains,
         )
 
@@ -152,6 +165,7 @@ class DREAM(MCMC):
         self.cross_prob = (
                 np.ones((self.crossover_probabilities_number,))
                 / self.crossover_probabilities_number)
+        self._r_diff = None
 
         self.logger.info("UQpy: Initialization of " + self.__class__.__name__ + " algorithm complete.\n")
 
@@ -163,67 +177,57 @@ class DREAM(MCMC):
         Run one iteration of the mcmc chain for DREAM algorithm, starting at current state -
         see :class:`MCMC` class.
         """
-        r_diff = np.array([np.setdiff1d(np.arange(self.n_chains), j) for j in range(self.n_chains)])
+        n_chains, dimension = self.n_chains, self.dimension
+        r_diff = self._other_chains()
         cross = (np.arange(1, self.crossover_probabilities_number + 1) / self.crossover_probabilities_number)
 
         # Dynamic part: evolution of chains
-        unif_rvs = (Uniform().rvs(nsamples=self.n_chains * (self.n_chains - 1),
-                                  random_state=self.random_state, )
-                    .reshape((self.n_chains - 1, self.n_chains)))
+        unif_rvs = (self.random_state.uniform(0.0, 1.0, n_chains * (n_chains - 1))
+                    .reshape((n_chains - 1, n_chains)))
         draw = np.argsort(unif_rvs, axis=0)
-        dx = np.zeros_like(current_state)
-        lmda = (Uniform(scale=2 * self.c).rvs(nsamples=self.n_chains, random_state=self.random_state)
-                .reshape((-1,)))
+        lmda = self.random_state.uniform(0.0, 1.0, n_chains) * (2 * self.c)
         std_x_tmp = np.std(current_state, axis=0)
 
-        multi_rvs = Multinomial(n=1, p=[1.0 / self.jump_rate, ] * self.jump_rate).rvs(
-            nsamples=self.n_chains, random_state=self.random_state)
-        d_ind = np.nonzero(multi_rvs)[1]
-        as_ = [r_diff[j, draw[slice(d_ind[j]), j]] for j in range(self.n_chains)]
-        bs_ = [r_diff[j, draw[slice(d_ind[j], 2 * d_ind[j], 1), j]] for j in range(self.n_chains)]
-        multi_rvs = Multinomial(n=1, p=self.cross_prob).rvs(
-            nsamples=self.n_chains, random_state=self.random_state)
-        id_ = np.nonzero(multi_rvs)[1]
-        # id = np.random.choice(self.n_CR, size=(self.nchains, ), replace=True, trial_probability=self.pCR)
-        z = (Uniform().rvs(nsamples=self.n_chains * self.dimension,
-                           random_state=self.random_state, )
-             .reshape((self.n_chains, self.dimension)))
-        subset_a = [np.where(z_j < cross[id_j])[0] for (z_j, id_j) in zip(z, id_)]  # subset A of selected dimensions
-        d_star = np.array([len(a_j) for a_j in subset_a])
-        for j in range(self.n_chains):
-            if d_star[j] == 0:
-                subset_a[j] = np.array([np.argmin(z[j])])
-                d_star[j] = 1
+        d_ind = np.argmax(self.random_state.multinomial(1, [1.0 / self.jump_rate, ] * self.jump_rate,
+                                                        size=n_chains), axis=1)
+        # Chain j jumps along the sum of the differences between the first d_ind[j] chains of the random permutation
+        # draw[:, j] of the other chains and the next d_ind[j] ones, accumulated pair by pair for all chains at once
+        partners = r_diff[np.arange(n_chains)[:, np.newaxis], draw.T]
+        differences = np.zeros_like(current_state)
+        for k in range(np.max(d_ind)):
+            pairs = np.nonzero((d_ind > k) & (d_ind + k < n_chains - 1))[0]
+            differences[pairs] += (current_state[partners[pairs, k]]
+                                   - current_state[partners[pairs, d_ind[pairs] + k]])
+
+        # As in scipy.stats.multinomial, the last probability is set so that the probabilities sum to one
+        cross_prob = np.append(self.cross_prob[:-1], 1.0 - np.sum(self.cross_prob[:-1]))
+        id_ = np.argmax(self.random_state.multinomial(1, cross_prob, size=n_chains), axis=1)
+        # subset A of selected dimensions, at least one dimension is selected for each chain
+        z = self.random_state.uniform(0.0, 1.0, (n_chains, dimension))
+        subset_a = z < cross[id_][:, np.newaxis]
+        d_star = np.sum(subset_a, axis=1)
+        no_selection = np.nonzero(d_star == 0)[0]
+        subset_a[no_selection, np.argmin(z[no_selection], axis=1)] = True
+        d_star[no_selection] = 1
         gamma_d = 2.38 / np.sqrt(2 * (d_ind + 1) * d_star)
-        g = (Binomial(n=1, p=self.gamma_probability).rvs(nsamples=self.n_chains, random_state=self.random_state)
-             .reshape((-1,)))
+        g = self.random_state.binomial(1, self.gamma_probability, n_chains)
         g[g == 0] = gamma_d[g == 0]
-        norm_vars = (Normal(loc=0.0, scale=1.0).rvs(nsamples=self.n_chains ** 2, random_state=self.random_state)
-                     .reshape((self.n_chains, self.n_chains)))
-        for j in range(self.n_chains):
-            for i in subset_a[j]:
-                dx[j, i] = self.c_star * norm_vars[j, i] + (1 + lmda[j]) * g[j] * np.sum(current_state[as_[j], i] -
-                                                                                         current_state[bs_[j], i])
+        # n_chains ** 2 variables are drawn as long as the dimension allows it, which keeps seeded runs reproducible
+        norm_vars = (self.random_state.standard_normal(n_chains * max(n_chains, dimension))
+                     .reshape((n_chains, -1))[:, :dimension])
+        dx = np.where(subset_a, self.c_star * norm_vars + ((1 + lmda) * g)[:, np.newaxis] * differences, 0.0)
         candidates = current_state + dx
 
         # Evaluate log likelihood of candidates
-        logp_candidates = self.evaluate_log_target(candidates)
+        logp_candidates = self._evaluate_log_target(candidates)
 
         # Accept or reject
-        accept_vec = np.zeros((self.n_chains,))
-        unif_rvs = (Uniform().rvs(nsamples=self.n_chains, random_state=self.random_state)
-                    .reshape((-1,)))
-        for nc, (lpc, candidate, log_p_curr) in enumerate(
-                zip(logp_candidates, candidates, current_log_pdf)):
-            accept = np.log(unif_rvs[nc]) < lpc - log_p_curr
-            if accept:
-                current_state[nc, :] = candidate
-                current_log_pdf[nc] = lpc
-                accept_vec[nc] = 1.0
-            else:
-                dx[nc, :] = 0
-            self.j_ind[id_[nc]] = self.j_ind[id_[nc]] + np.sum((dx[nc, :] / std_x_tmp) ** 2)
-            self.n_id[id_[nc]] += 1
+        accept = self._accept_reject(logp_candidates - current_log_pdf, candidates, logp_candidates,
+                                     current_state, current_log_pdf)
+        accept_vec = accept.astype(float)
+        dx[~accept, :] = 0
+        np.add.at(self.j_ind, id_, np.sum((dx / std_x_tmp) ** 2, axis=1))
+        np.add.at(self.n_id, id_, 1)
 
         # Save the acceptance rate
         self._update_acceptance_rate(accept_vec)
@@ -232,7 +236,7 @@ class DREAM(MCMC):
         if (self.iterations_number < self.crossover_adaptation[0]
                 and self.iterations_number % self.crossover_adaptation[1] == 0):
             self.cross_prob = self.j_ind / self.n_id
-            self.cross_prob /= sum(self.cross_prob)
+            self.cross_prob /= np.sum(self.cross_prob)
         # check outlier chains (only if you have saved at least 100 values already)
         if ((self.samples_counter >= 100)
                 and (self.iterations_number < self.check_chains[0])
@@ -241,6 +245,20 @@ class DREAM(MCMC):
 
         return current_state, current_log_pdf
 
+    def _get_adaptive_state(self):
+        return {"j_ind": self.j_ind, "n_id": self.n_id, "cross_prob": self.cross_prob}
+
+    def _set_adaptive_state(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _other_chains(self):
+        # Row j holds the indices of all chains but j, it only changes with the number of chains
+        if self._r_diff is None or len(self._r_diff) != self.n_chains:
+            others = np.arange(self.n_chains - 1)
+            self._r_diff = others + (others >= np.arange(self.n_chains)[:, np.newaxis])
+        return self._r_diff
+
     def check_outlier_chains(self, replace_with_best: bool = False):
         if not self.save_log_pdf:
             raise ValueError("UQpy: Input save_log_pdf must be True in order to check outlier chains")
@@ -252,16 +270,12 @@ class DREAM(MCMC):
         q1, q3 = avg_sorted[ind1], avg_sorted[ind3]
         qr = q3 - q1
 
-        outlier_num = 0
-        for j in range(self.n_chains):
-            if avgs_logpdf[j] < q1 - 2.0 * qr:
-                outlier_num += 1
-                if replace_with_best:
-                    self.samples[start_:, j, :] = self.samples[start_:, best_, :].copy()
-                    self.log_pdf_values[start_:, j] = self.log_pdf_values[
-                                                      start_:, best_
-                                                      ].copy()
-                else:
-                    self.logger.info("UQpy: Chain {} is an outlier chain".format(j))
-        if outlier_num > 0:
-            self.logger.info("UQpy: Detected {} outlier chains".format(outlier_num))
+        outliers = np.nonzero(avgs_logpdf < q1 - 2.0 * qr)[0]
+        if replace_with_best:
+            self.samples[start_:, outliers, :] = self.samples[start_:, best_, np.newaxis, :]
+            self.log_pdf_values[start_:, outliers] = self.log_pdf_values[start_:, best_, np.newaxis]
+        else:
+            for j in outliers:
+                self.logger.info("UQpy: Chain {} is an outlier chain".format(j))
+        if len(outliers) > 0:
+            self.logger.info("UQpy: Detected {} outlier chains".format(len(outliers)))
@@ -1,6 +1,7 @@
 import logging
 from typing import Callable
 from beartype import beartype
+import numpy as np
 from UQpy.sampling.mcmc.baseclass.MCMC import MCMC
 from UQpy.distributions import *
 from UQpy.utilities.ValidationTypes import *
@@ -27,6 +28,9 @@ class MetropolisHastings(MCMC):
             proposal: Distribution = None,
             proposal_is_symmetric: bool = False,
             random_state: RandomStateType = None,
+            block_size: PositiveInteger = None,
+            storage: str = None,
+            n_workers: PositiveInteger = None,
             nsamples: PositiveInteger = None,
             nsamples_per_chain: PositiveInteger = None,
     ):
@@ -78,6 +82,13 @@ class MetropolisHastings(MCMC):
          acceptance probability alpha Default: :any:`False`, set to :any:`True` if default proposal is used
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is
          :any:`None`.
+        :param block_size: If provided, the chains are advanced by blocks of `block_size` iterations, and the states
+         that survive burn-in and thinning are stored once per block. Default: :any:`None`, the chains are advanced
+         and stored one iteration at a time. See :meth:`.MCMC.run_block`.
+        :param storage: Path of a directory in which the chains are streamed as memory-mapped files, see
+         :class:`.MCMC`. Default: :any:`None`, the chains are kept in memory.
+        :param n_workers: If provided, the target is evaluated on a pool of `n_workers` processes, each of them evaluating
+         a chunk of chains, see :class:`.MCMC`. Default: :any:`None`, the target is evaluated in the calling process.
 
         :param nsamples: Number of samples to generate.
         :param nsamples_per_chain: Number of samples to generate per chain.
@@ -95,6 +106,9 @@ class MetropolisHastings(MCMC):
             save_log_pdf=save_log_pdf,
             concatenate_chains=concatenate_chains,
             random_state=random_state,
+            block_size=block_size,
+            storage=storage,
+            n_workers=n_workers,
             n_chains=n_chains,
         )
 
@@ -127,7 +141,7 @@ class MetropolisHastings(MCMC):
             nsamples=self.n_chains, random_state=self.random_state)
 
         # Compute log_pdf_target of candidate sample
-        log_p_candidate = self.evaluate_log_target(candidate)
+        log_p_candidate = self._evaluate_log_target(candidate)
 
         # Compute acceptance ratio
         if self.proposal_is_symmetric:  # proposal is symmetric
@@ -138,24 +152,33 @@ class MetropolisHastings(MCMC):
             ) - self.proposal.log_pdf(current_state - candidate)
             log_ratios = log_p_candidate - current_log_pdf - log_proposal_ratio
 
-        # Compare candidate with current sample and decide or not to keep the candidate (loop over nc chains)
-        accept_vec = np.zeros(
-            (self.n_chains,)
-        )  # this vector will be used to compute accept_ratio of each chain
-        unif_rvs = (
-            Uniform()
-                .rvs(nsamples=self.n_chains, random_state=self.random_state)
-                .reshape((-1,))
-        )
-        for nc, (cand, log_p_cand, r_) in enumerate(
-                zip(candidate, log_p_candidate, log_ratios)
-        ):
-            accept = np.log(unif_rvs[nc]) < r_
-            if accept:
-                current_state[nc, :] = cand
-                current_log_pdf[nc] = log_p_cand
-                accept_vec[nc] = 1.0
+        # Compare candidate with current sample and decide or not to keep the candidate (all chains at once)
+        accept_vec = self._accept_reject(log_ratios, candidate, log_p_candidate, current_state, current_log_pdf)
         # Update the acceptance rate
         self._update_acceptance_rate(accept_vec)
 
         return current_state, current_log_pdf
+
+    def run_block(self, current_state: np.ndarray, current_log_pdf: np.ndarray, n_iterations: int):
+        """
+        Run `n_iterations` iterations of the MH algorithm - see :meth:`.MCMC.run_block`. The proposal steps and the
+        uniform random variables of all iterations of the block are drawn in a single call each.
+        """
+        steps = self.proposal.rvs(nsamples=n_iterations * self.n_chains, random_state=self.random_state) \
+            .reshape((n_iterations, self.n_chains, self.dimension))
+        log_uniforms = np.log(self.random_state.uniform(0.0, 1.0, (n_iterations, self.n_chains)))
+
+        states = np.empty((n_iterations, self.n_chains, self.dimension))
+        log_pdf_values = np.empty((n_iterations, self.n_chains))
+        for i in range(n_iterations):
+            self.iterations_number += 1
+            candidate = current_state + steps[i]
+            log_p_candidate = self._evaluate_log_target(candidate)
+            log_ratios = log_p_candidate - current_log_pdf
+            if not self.proposal_is_symmetric:
+                log_ratios -= self.proposal.log_pdf(steps[i]) - self.proposal.log_pdf(-steps[i])
+            accept_vec = self._accept_reject(log_ratios, candidate, log_p_candidate, current_state, current_log_pdf,
+                                             log_uniforms=log_uniforms[i])
+            self._update_acceptance_rate(accept_vec)
+            states[i], log_pdf_values[i] = current_state, current_log_pdf
+        return states, log_pdf_values
@@ -27,6 +27,9 @@ class ModifiedMetropolisHastings(MCMC):
             proposal: Union[Distribution, list[Distribution]] = None,
             proposal_is_symmetric: Union[bool, list[bool]] = False,
             random_state: RandomStateType = None,
+            block_size: PositiveInteger = None,
+            storage: str = None,
+            n_workers: PositiveInteger = None,
             n_chains: int = None,
             nsamples: PositiveInteger = None,
             nsamples_per_chain: PositiveInteger = None,
@@ -84,6 +87,13 @@ class ModifiedMetropolisHastings(MCMC):
          acceptance probability alpha Default: :any:`False`, set to :any:`True` if default proposal is used
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is
          :any:`None`.
+        :param block_size: If provided, the chains are advanced by blocks of `block_size` iterations, and the states
+         that survive burn-in and thinning are stored once per block. Default: :any:`None`, the chains are advanced
+         and stored one iteration at a time. See :meth:`.MCMC.run_block`.
+        :param storage: Path of a directory in which the chains are streamed as memory-mapped files, see
+         :class:`.MCMC`. Default: :any:`None`, the chains are kept in memory.
+        :param n_workers: If provided, the target is evaluated on a pool of `n_workers` processes, each of them evaluating
+         a chunk of chains, see :class:`.MCMC`. Default: :any:`None`, the target is evaluated in the calling process.
         :param nsamples: Number of samples to generate.
         :param nsamples_per_chain: Number of samples to generate per chain.
         """
@@ -100,6 +110,9 @@ class ModifiedMetropolisHastings(MCMC):
             save_log_pdf=save_log_pdf,
             concatenate_chains=concatenate_chains,
             random_state=random_state,
+            block_size=block_size,
+            storage=storage,
+            n_workers=n_workers,
             n_chains=n_chains,
         )
 
@@ -184,14 +197,11 @@ class ModifiedMetropolisHastings(MCMC):
                     log_ratios = (log_p_candidate_j - self.current_log_pdf_marginals[j] - log_proposal_ratio)
 
                 # Compare candidate with current sample and decide or not to keep the candidate
-                unif_rvs = Uniform().rvs(nsamples=self.n_chains, random_state=self.random_state).reshape((-1,))
-                for nc, (cand, log_p_cand, r_) in enumerate(zip(candidate_j, log_p_candidate_j, log_ratios)):
-                    accept = np.log(unif_rvs[nc]) < r_
-                    if accept:
-                        current_state[nc, j] = cand
-                        self.current_log_pdf_marginals[j][nc] = log_p_cand
-                        current_log_pdf = np.sum(self.current_log_pdf_marginals)
-                        accept_vec[nc] += 1.0 / self.dimension
+                accept = self._accept_reject(log_ratios, candidate_j, log_p_candidate_j, current_state,
+                                             self.current_log_pdf_marginals[j], columns=[j])
+                accept_vec += accept / self.dimension
+            # Log-pdf of each chain, sum of its marginal log-pdfs
+            current_log_pdf = np.sum(self.current_log_pdf_marginals, axis=0)
 
         # The target pdf is provided as a joint pdf
         else:
@@ -202,7 +212,7 @@ class ModifiedMetropolisHastings(MCMC):
                 candidate[:, j] = candidate_j[:, 0]
 
                 # Compute log_pdf_target of candidate sample
-                log_p_candidate = self.evaluate_log_target(candidate)
+                log_p_candidate = self._evaluate_log_target(candidate)
 
                 # Compare candidate with current sample and decide or not to keep the candidate
                 if self.proposal_is_symmetric[j]:  # proposal is symmetric
@@ -212,15 +222,10 @@ class ModifiedMetropolisHastings(MCMC):
                     log_proposal_ratio = log_prop_j(candidate_j - current_state[:, j, np.newaxis]) -\
                                          log_prop_j(current_state[:, j, np.newaxis] - candidate_j)
                     log_ratios = log_p_candidate - current_log_pdf - log_proposal_ratio
-                unif_rvs = Uniform().rvs(nsamples=self.n_chains, random_state=self.random_state).reshape((-1,))
-                for nc, (cand, log_p_cand, r_) in enumerate(zip(candidate_j, log_p_candidate, log_ratios)):
-                    accept = np.log(unif_rvs[nc]) < r_
-                    if accept:
-                        current_state[nc, j] = cand
-                        current_log_pdf[nc] = float(log_p_cand)
-                        accept_vec[nc] += 1.0 / self.dimension
-                    else:
-                        candidate[:, j] = current_state[:, j]
+                accept = self._accept_reject(log_ratios, candidate_j, log_p_candidate, current_state,
+                                             current_log_pdf, columns=[j])
+                accept_vec += accept / self.dimension
+                candidate[:, j] = current_state[:, j]
         # Update the acceptance rate
         self._update_acceptance_rate(accept_vec)
         return current_state, current_log_pdf
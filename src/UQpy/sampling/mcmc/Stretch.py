@@ -26,6 +26,9 @@ class Stretch(MCMC):
             concatenate_chains: bool = True,
             scale: float = 2.0,
             random_state: RandomStateType = None,
+            block_size: PositiveInteger = None,
+            storage: str = None,
+            n_workers: PositiveInteger = None,
             n_chains: int = None,
             nsamples: PositiveInteger = None,
             nsamples_per_chain: PositiveInteger = None,
@@ -73,6 +76,13 @@ class Stretch(MCMC):
         :param scale: Scale parameter. Default: :math:`2`.
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is
          :any:`None`.
+        :param block_size: If provided, the chains are advanced by blocks of `block_size` iterations, and the states
+         that survive burn-in and thinning are stored once per block. Default: :any:`None`, the chains are advanced
+         and stored one iteration at a time. See :meth:`.MCMC.run_block`.
+        :param storage: Path of a directory in which the chains are streamed as memory-mapped files, see
+         :class:`.MCMC`. Default: :any:`None`, the chains are kept in memory.
+        :param n_workers: If provided, the target is evaluated on a pool of `n_workers` processes, each of them evaluating
+         a chunk of chains, see :class:`.MCMC`. Default: :any:`None`, the target is evaluated in the calling process.
         :param nsamples: Number of samples to generate.
         :param nsamples_per_chain: Number of samples to generate per chain.
         """
@@ -96,6 +106,9 @@ class Stretch(MCMC):
             save_log_pdf=save_log_pdf,
             concatenate_chains=concatenate_chains,
             random_state=random_state,
+            block_size=block_size,
+            storage=storage,
+            n_workers=n_workers,
             n_chains=n_chains, )
 
         self.logger = logging.getLogger(__name__)
@@ -136,7 +149,7 @@ class Stretch(MCMC):
             ns, nc = len(curr_set), len(comp_set)
 
             # Sample new state for S1 based on S0
-            unif_rvs = Uniform().rvs(nsamples=ns, random_state=self.random_state)
+            unif_rvs = self.random_state.uniform(0.0, 1.0, (ns, 1))
             zz = ((self.scale - 1.0) * unif_rvs + 1.0) ** 2.0 / self.scale  # sample Z
             factors = (self.dimension - 1.0) * np.log(zz)  # compute log(Z ** (d - 1))
             multi_rvs = Multinomial(n=1, p=[1.0 / nc, ] * nc).rvs(
@@ -146,16 +159,14 @@ class Stretch(MCMC):
                 zz, [1, self.dimension])  # new candidates
 
             # Compute new likelihood, can be done in parallel :)
-            logp_candidates = self.evaluate_log_target(candidates)
+            logp_candidates = self._evaluate_log_target(candidates)
 
             # Compute acceptance rate
-            unif_rvs = (Uniform().rvs(nsamples=len(all_inds[set1]), random_state=self.random_state).reshape((-1,)))
-            for j, f, lpc, candidate, u_rv in zip(all_inds[set1], factors, logp_candidates, candidates, unif_rvs):
-                accept = np.log(u_rv) < f + lpc - current_log_pdf[j]
-                if accept:
-                    current_state[j] = candidate
-                    current_log_pdf[j] = lpc
-                    accept_vec[j] += 1.0
+            state_set, log_pdf_set = current_state[set1], current_log_pdf[set1]
+            accept = self._accept_reject(factors[:, 0] + logp_candidates - log_pdf_set, candidates, logp_candidates,
+                                         state_set, log_pdf_set)
+            accept_vec[set1] += accept
+            current_state[set1], current_log_pdf[set1] = state_set, log_pdf_set
 
         # Update the acceptance rate
         self._update_acceptance_rate(accept_vec)
@@ -5,4 +5,5 @@ from UQpy.sampling.mcmc.DRAM import DRAM
 from UQpy.sampling.mcmc.DREAM import DREAM
 
 from UQpy.sampling.mcmc.baseclass.MCMC import MCMC
+from UQpy.sampling.mcmc.ChainDiagnostics import ChainDiagnostics
 from UQpy.sampling.mcmc.tempering_mcmc import *
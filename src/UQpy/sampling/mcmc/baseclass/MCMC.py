@@ -1,4 +1,6 @@
 import logging
+import os
+import pickle
 from typing import Callable, Tuple, List
 import warnings
 warnings.filterwarnings('ignore')
@@ -8,10 +10,34 @@ from beartype import beartype
 from UQpy.distributions import Distribution
 from UQpy.utilities.ValidationTypes import *
 from UQpy.utilities.Utilities import process_random_state
+from UQpy.utilities.WorkerPool import WorkerPool
+from UQpy.sampling.mcmc.ChainDiagnostics import ChainDiagnostics
 from abc import ABC, abstractmethod
 
+def _log_target_from_payload(target):
+    log_pdf_target, pdf_target, args_target = target
+    return MCMC._preprocess_target(log_pdf_=log_pdf_target, pdf_=pdf_target, args=args_target)[0]
+
+
+def _evaluate_worker_chains(states, entropy, evaluation, first_chain):
+    log_target = WorkerPool.payload()
+    random_state = np.random.get_state()
+    log_pdf_values = np.reshape(log_target(states), (len(states),)).astype(float)
+    if all(np.array_equal(new, old) for new, old in zip(np.random.get_state(), random_state)):
+        return log_pdf_values
+    # The target draws random numbers: each chain is evaluated with its own seed of the global numpy random number
+    # generator, which does not depend on the chunk of chains sent to the worker
+    for i, state in enumerate(states):
+        seed_sequence = np.random.SeedSequence(entropy, spawn_key=(evaluation, first_chain + i))
+        np.random.seed(seed_sequence.generate_state(1))
+        log_pdf_values[i] = np.ravel(log_target(state[np.newaxis, :]))[0]
+    return log_pdf_values
+
 
 class MCMC(ABC):
+    STORAGE_FLUSH_INTERVAL = 1000
+    """Number of samples per chain after which chains streamed to disk (see input `storage`) are flushed."""
+
     @beartype
     def __init__(
             self,
@@ -26,6 +52,9 @@ class MCMC(ABC):
             save_log_pdf: bool = False,
             concatenate_chains: bool = True,
             random_state: RandomStateType = None,
+            block_size: Union[None, PositiveInteger] = None,
+            storage: Union[None, str] = None,
+            n_workers: Union[None, PositiveInteger] = None,
     ):
         """
         Generate samples from arbitrary user-specified probability density function using Markov Chain Monte Carlo.
@@ -68,8 +97,28 @@ class MCMC(ABC):
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is :any:`None`.
          If an :any:`int` is provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise,
          the object itself can be passed directly.
+        :param block_size: If provided, the chains are advanced by blocks of `block_size` iterations using
+         :meth:`run_block`, and the states that survive burn-in and thinning are stored once per block with array
+         slicing. Default: :any:`None`, the chains are advanced and stored one iteration at a time.
+        :param storage: Path of a directory in which the chains are streamed. If provided, :py:attr:`samples` and
+         :py:attr:`log_pdf_values` are :class:`numpy.memmap` arrays backed by files of this directory instead of
+         in-memory arrays, and they are flushed to disk every :py:attr:`STORAGE_FLUSH_INTERVAL` samples per chain and at
+         the end of each run. If the directory already contains chains from a previous run, the sampler resumes from the
+         last stored state, including the state of its random number generator and the adaptive state of the sampler
+         (e.g. the proposal covariance of :class:`.DRAM`). Stored chains can be read lazily with
+         :meth:`load_storage`. Default: :any:`None`, the chains are kept in memory.
+        :param n_workers: If provided, the log-pdf of the target is evaluated on a pool of `n_workers` processes, each
+         of them evaluating a chunk of chains in a single call of the target. The workers are forked from the calling
+         process when the platform allows it, otherwise the target (`log_pdf_target` or `pdf_target`, and
+         `args_target`) must be picklable. If the target draws random numbers from the global :py:mod:`numpy.random`
+         generator, the chains of the chunk are instead evaluated one at a time, with the generator seeded from a
+         stream specific to the chain and the evaluation, so that the results are the same for any number of workers.
+         The workers are shut down at the end of :meth:`run` and :meth:`run_until`, or at the end of a :code:`with`
+         block if the sampler is used as a context manager. Default: :any:`None`, the target is evaluated in the
+         calling process.
         """
         self.burn_length, self.jump = burn_length, jump
+        self.block_size = block_size
         self._initialization_seed = seed
         self.seed = self._preprocess_seed(seed=seed, dimensions=dimension, n_chains=n_chains)
         self.n_chains, self.dimension = self.seed.shape
@@ -109,6 +158,23 @@ class MCMC(ABC):
         self.iterations_number: int = 0  # total nb of iterations, grows if you call run several times
         """Total number of iterations, updated on-the-fly as the algorithm proceeds. It is related to number of samples 
         as :code:`iterations_number=burn_length+jump*nsamples_per_chain`."""
+        self.diagnostics: ChainDiagnostics = None
+        """Online convergence diagnostics of the stored samples (split R-hat, effective sample size), updated at the
+        end of each call of :meth:`run`, see :class:`.ChainDiagnostics`."""
+        self._uniform_buffer = None
+        self._accept_buffer = None
+        self._samples_buffer = None
+        self._log_pdf_buffer = None
+        self.n_workers = n_workers
+        self._worker_pool = None
+        self._worker_target_id = None
+        self._keep_workers = False
+        self._worker_entropy = np.random.SeedSequence(self.random_state.get_state()[1]).generate_state(4)
+        self._worker_evaluations = 0
+        self.storage = storage
+        self._stored_adaptive_state = None
+        if self.storage is not None:
+            self._open_storage()
 
     def run(self, nsamples: PositiveInteger = None, nsamples_per_chain: int = None):
         """
@@ -124,37 +190,96 @@ class MCMC(ABC):
         is not a multiple of `n_chains`, `nsamples` is set to the next largest integer that is a multiple of
         `n_chains`.
         """
+        try:
+            self._run_chains(nsamples, nsamples_per_chain)
+        finally:
+            if not self._keep_workers:
+                self.shutdown()
+
+    def _run_chains(self, nsamples, nsamples_per_chain):
         if self.evaluate_log_target is None and self.evaluate_log_target_marginals is None:
             (self.evaluate_log_target, self.evaluate_log_target_marginals,) = \
                 self._preprocess_target(pdf_=self.pdf_target, log_pdf_=self.log_pdf_target, args=self.args_target)
+        if self._stored_adaptive_state is not None:
+            self._set_adaptive_state(self._stored_adaptive_state)
+            self._stored_adaptive_state = None
         # Initialize the runs: allocate space for the new samples and log pdf values
         (final_nsamples, final_nsamples_per_chain, current_state, current_log_pdf,) = self._initialize_samples(
             nsamples=nsamples, nsamples_per_chain=nsamples_per_chain)
 
         self.logger.info("UQpy: Running mcmc...")
 
-        # Run nsims iterations of the mcmc algorithm, starting at current_state
-        while self.nsamples_per_chain < final_nsamples_per_chain:
-            # update the total number of iterations
-            self.iterations_number += 1
-            # run iteration
-            current_state, current_log_pdf = self.run_one_iteration(current_state, current_log_pdf)
-            # Update the chain, only if burn-in is over and the sample is not being jumped over
-            # also increase the current number of samples and samples_per_chain
-            if (self.iterations_number > self.burn_length
-                    and (self.iterations_number - self.burn_length) % self.jump == 0):
-                self.samples[self.nsamples_per_chain, :, :] = current_state.copy()
-                if self.save_log_pdf:
-                    self.log_pdf_values[self.nsamples_per_chain, :] = current_log_pdf.copy()
-                self.nsamples_per_chain += 1
-                self.samples_counter += self.n_chains
-
+        if self.block_size is not None:
+            self._run_blocks(final_nsamples_per_chain, current_state, current_log_pdf)
+        else:
+            # Run nsims iterations of the mcmc algorithm, starting at current_state
+            while self.nsamples_per_chain < final_nsamples_per_chain:
+                # update the total number of iterations
+                self.iterations_number += 1
+                # run iteration
+                current_state, current_log_pdf = self.run_one_iteration(current_state, current_log_pdf)
+                # Update the chain, only if burn-in is over and the sample is not being jumped over
+                # also increase the current number of samples and samples_per_chain
+                if (self.iterations_number > self.burn_length
+                        and (self.iterations_number - self.burn_length) % self.jump == 0):
+                    self.samples[self.nsamples_per_chain, :, :] = current_state.copy()
+                    if self.save_log_pdf:
+                        self.log_pdf_values[self.nsamples_per_chain, :] = current_log_pdf.copy()
+                    self.nsamples_per_chain += 1
+                    self.samples_counter += self.n_chains
+                    if self.storage is not None and self.nsamples_per_chain % self.STORAGE_FLUSH_INTERVAL == 0:
+                        self._flush_storage()
+
+        self._update_diagnostics()
+        self._flush_storage()
         self.logger.info("UQpy: mcmc run successfully !")
 
         # Concatenate chains maybe
         if self.concatenate_chains:
             self._concatenate_chains()
 
+    def run_until(self, rhat: float = 1.01, min_ess: float = None, min_tail_ess: float = None,
+                  check_interval: PositiveInteger = 100, max_nsamples_per_chain: int = None):
+        """
+        Run the mcmc algorithm until the convergence diagnostics of all dimensions meet the given targets.
+
+        The chains are advanced by calls of :meth:`run` with `check_interval` samples per chain, and the
+        :py:attr:`diagnostics` are checked after each call, so that sampling stops as soon as the targets are met.
+
+        :param rhat: Threshold below which the split :math:`\\hat{R}` of all dimensions must be. Default: :math:`1.01`.
+        :param min_ess: Minimum bulk effective sample size (over all chains) of all dimensions. Default: :any:`None`,
+         not checked.
+        :param min_tail_ess: Minimum tail effective sample size (over all chains) of all dimensions. Its computation
+         requires all stored samples, see :meth:`.ChainDiagnostics.tail_ess`. Default: :any:`None`, not checked.
+        :param check_interval: Number of samples per chain generated between two checks of the diagnostics.
+        :param max_nsamples_per_chain: Maximum number of samples per chain, after which sampling stops even if the
+         targets are not met. Default: :any:`None`, no limit.
+        :return: :any:`True` if the targets were met, :any:`False` if `max_nsamples_per_chain` was reached first.
+        """
+        if rhat is None and min_ess is None and min_tail_ess is None:
+            raise ValueError("UQpy: At least one of rhat, min_ess or min_tail_ess must be provided.")
+        if not (isinstance(check_interval, int) and check_interval > 0):
+            raise TypeError("UQpy: check_interval must be an integer > 0.")
+        # the workers are kept alive between the calls of run
+        keep_workers, self._keep_workers = self._keep_workers, True
+        try:
+            while max_nsamples_per_chain is None or self.nsamples_per_chain < max_nsamples_per_chain:
+                nsamples_per_chain = check_interval if max_nsamples_per_chain is None \
+                    else min(check_interval, max_nsamples_per_chain - self.nsamples_per_chain)
+                self.run(nsamples_per_chain=nsamples_per_chain)
+                samples = None if min_tail_ess is None else self.samples.reshape((-1, self.n_chains, self.dimension))
+                if self.diagnostics.converged(rhat=rhat, min_ess=min_ess, min_tail_ess=min_tail_ess, samples=samples):
+                    self.logger.info("UQpy: Convergence targets met after " + str(self.nsamples_per_chain)
+                                     + " samples per chain.")
+                    return True
+            self.logger.info("UQpy: Convergence targets not met after " + str(self.nsamples_per_chain)
+                             + " samples per chain.")
+            return False
+        finally:
+            self._keep_workers = keep_workers
+            if not keep_workers:
+                self.shutdown()
+
     def run_one_iteration(self, current_state: np.ndarray, current_log_pdf: np.ndarray):
         """
         Run one iteration of the mcmc algorithm, starting at `current_state`.
@@ -170,6 +295,61 @@ class MCMC(ABC):
         """
         return [], []
 
+    def run_block(self, current_state: np.ndarray, current_log_pdf: np.ndarray, n_iterations: int):
+        """
+        Run `n_iterations` iterations of the mcmc algorithm, starting at `current_state`. This method is used instead
+        of :meth:`run_one_iteration` when a `block_size` is provided.
+
+        The default implementation calls :meth:`run_one_iteration` repeatedly. Algorithms can over-write it to draw the
+        random variables of all iterations of the block at once. The method must increment
+        :py:attr:`iterations_number` for each iteration.
+
+        :param current_state: Current state of the chain(s), :class:`numpy.ndarray` of shape ``(n_chains, dimension)``.
+        :param current_log_pdf: Log-pdf of the current state of the chain(s), :class:`numpy.ndarray` of shape
+         ``(n_chains, )``.
+        :param n_iterations: Number of iterations to run.
+        :return: States of the chain(s) after each iteration, :class:`numpy.ndarray` of shape
+         ``(n_iterations, n_chains, dimension)``, and their log-pdf values, of shape ``(n_iterations, n_chains)``.
+        """
+        states = np.empty((n_iterations, self.n_chains, self.dimension))
+        log_pdf_values = np.empty((n_iterations, self.n_chains))
+        for i in range(n_iterations):
+            self.iterations_number += 1
+            current_state, current_log_pdf = self.run_one_iteration(current_state, current_log_pdf)
+            states[i], log_pdf_values[i] = current_state, current_log_pdf
+        return states, log_pdf_values
+
+    def _run_blocks(self, final_nsamples_per_chain, current_state, current_log_pdf):
+        while self.nsamples_per_chain < final_nsamples_per_chain:
+            # Iterations already stored after burn-in and last iteration to run to reach final_nsamples_per_chain
+            n_stored_iterations = max(0, (self.iterations_number - self.burn_length) // self.jump)
+            last_iteration = self.burn_length + self.jump * (n_stored_iterations + final_nsamples_per_chain
+                                                             - self.nsamples_per_chain)
+            n_iterations = min(self.block_size, last_iteration - self.iterations_number)
+            first_stored = self.burn_length + self.jump * (n_stored_iterations + 1) - self.iterations_number - 1
+
+            states, log_pdf_values = self.run_block(current_state, current_log_pdf, n_iterations)
+            current_state, current_log_pdf = states[-1].copy(), log_pdf_values[-1].copy()
+
+            # Apply burn-in and thinning to the whole block at once
+            new_states = states[first_stored::self.jump]
+            start, stop = self.nsamples_per_chain, self.nsamples_per_chain + len(new_states)
+            self.samples[start:stop] = new_states
+            if self.save_log_pdf:
+                self.log_pdf_values[start:stop] = log_pdf_values[first_stored::self.jump]
+            self.nsamples_per_chain = stop
+            self.samples_counter += len(new_states) * self.n_chains
+            if (self.iterations_number - self.burn_length) % self.jump == 0:  # the last state of the block is stored
+                self._flush_storage()
+
+    def _update_diagnostics(self):
+        # Samples stored since the last update, the diagnostics are rebuilt if the chains were modified externally
+        if (self.diagnostics is None or (self.diagnostics.n_chains, self.diagnostics.dimension)
+                != (self.n_chains, self.dimension) or self.diagnostics.nsamples_per_chain > self.nsamples_per_chain):
+            self.diagnostics = ChainDiagnostics(n_chains=self.n_chains, dimension=self.dimension)
+        self.diagnostics.update(self.samples[self.diagnostics.nsamples_per_chain:self.nsamples_per_chain],
+                                acceptance_rate=self.acceptance_rate)
+
     def _concatenate_chains(self):
         self.samples = self.samples.reshape((-1, self.dimension), order="C")
         if self.save_log_pdf:
@@ -194,12 +374,10 @@ class MCMC(ABC):
             raise TypeError("UQpy: nsamples_per_chain must be an integer >= 0.")
         nsamples = int(nsamples_per_chain * self.n_chains)
         if self.samples is None:  # very first call of run, set current_state as the seed and initialize self.samples
-            self.samples = np.zeros((nsamples_per_chain, self.n_chains, self.dimension))
-            if self.save_log_pdf:
-                self.log_pdf_values = np.zeros((nsamples_per_chain, self.n_chains))
+            self._reserve_chains(nsamples_per_chain)
             current_state = np.zeros_like(self.seed)
             np.copyto(current_state, self.seed)
-            current_log_pdf = self.evaluate_log_target(current_state)
+            current_log_pdf = self._evaluate_log_target(current_state)
             if self.burn_length == 0:  # if nburn is 0, save the seed, run one iteration less
                 self.samples[0, :, :] = current_state
                 if self.save_log_pdf:
@@ -211,24 +389,233 @@ class MCMC(ABC):
         else:  # fetch previous samples to start the new run, current state is last saved sample
             if len(self.samples.shape) == 2:  # the chains were previously concatenated
                 self._unconcatenate_chains()
-            current_state = self.samples[-1]
-            current_log_pdf = self.evaluate_log_target(current_state)
-            self.samples = np.concatenate([self.samples,
-                                           np.zeros((nsamples_per_chain, self.n_chains, self.dimension)), ], axis=0, )
-            if self.save_log_pdf:
-                self.log_pdf_values = np.concatenate([self.log_pdf_values,
-                                                      np.zeros((nsamples_per_chain, self.n_chains)), ], axis=0, )
+            current_state = self.samples[-1].copy()
+            current_log_pdf = self._evaluate_log_target(current_state)
+            self._reserve_chains(len(self.samples) + nsamples_per_chain)
             final_nsamples = nsamples + self.samples_counter
             final_nsamples_per_chain = (nsamples_per_chain + self.nsamples_per_chain)
 
         return final_nsamples, final_nsamples_per_chain, current_state, current_log_pdf
 
+    def _evaluate_log_target(self, x: np.ndarray):
+        """
+        Evaluate the log-pdf of the target at the states `x` of the chains, of shape ``(n, dimension)``. If
+        `n_workers` is provided, the states are split in contiguous chunks of chains evaluated on the worker processes.
+        """
+        if self.n_workers is None:
+            return self.evaluate_log_target(x)
+        target = (self.log_pdf_target, self.pdf_target, self.args_target)
+        if self._worker_pool is None or self._worker_target_id != tuple(id(t) for t in target):
+            self.shutdown()
+            self._worker_pool = WorkerPool(target, self.n_workers, initializer=_log_target_from_payload)
+            self._worker_target_id = tuple(id(t) for t in target)
+        self._worker_evaluations += 1
+        bounds = np.linspace(0, len(x), max(1, min(self.n_workers, len(x))) + 1).astype(int)
+        futures = [self._worker_pool.submit(_evaluate_worker_chains, x[start:stop], self._worker_entropy,
+                                         self._worker_evaluations, start)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        return np.concatenate([future.result() for future in futures])
+
+    def shutdown(self):
+        """
+        Shut down the worker processes used to evaluate the target (see input `n_workers`). They are restarted on the
+        next evaluation of the target.
+
+        This is done at the end of :meth:`run` and :meth:`run_until`, unless the sampler is used as a context manager,
+        in which case the workers are kept alive until the end of the :code:`with` block.
+        """
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+            self._worker_target_id = None
+
+    def __enter__(self):
+        self._keep_workers = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._keep_workers = False
+        self.shutdown()
+
+    def _draw_uniforms(self, nsamples: int):
+        """
+        Draw `nsamples` standard uniform random variables directly from the random state of the sampler. The values
+        are written in a preallocated buffer that is reused across iterations, the returned array is a view of it.
+        """
+        if self._uniform_buffer is None or len(self._uniform_buffer) < nsamples:
+            self._uniform_buffer = np.empty((max(nsamples, self.n_chains),))
+            self._accept_buffer = np.empty((max(nsamples, self.n_chains),), dtype=bool)
+        uniforms = self._uniform_buffer[:nsamples]
+        uniforms[:] = self.random_state.uniform(0.0, 1.0, nsamples)
+        return uniforms
+
+    def _accept_reject(self, log_ratios: np.ndarray, candidate: np.ndarray, log_p_candidate: np.ndarray,
+                       current_state: np.ndarray, current_log_pdf: np.ndarray, columns=slice(None),
+                       log_uniforms: np.ndarray = None):
+        """
+        Vectorized Metropolis-Hastings accept/reject step, shared by all MCMC algorithms.
+
+        A candidate is accepted if :math:`\\log(u) < \\log(r)` with :math:`u \\sim U(0, 1)`. Accepted candidates and
+        their log-pdf values are written in place in `current_state` and `current_log_pdf`.
+
+        :param log_ratios: Logarithm of the acceptance ratios, of shape ``(n, )``.
+        :param candidate: Candidate states, of shape ``(n, dimension)`` (or ``(n, len(columns))``).
+        :param log_p_candidate: Log-pdf values of the candidate states, of shape ``(n, )``.
+        :param current_state: Current states, updated in place.
+        :param current_log_pdf: Log-pdf values of the current states, updated in place.
+        :param columns: Columns of `current_state` replaced by `candidate` upon acceptance, given as a slice or a list
+         of indices. Default: all columns.
+        :param log_uniforms: Logarithm of uniform random variables used for the comparison, of shape ``(n, )``. By
+         default they are drawn with :meth:`_draw_uniforms`.
+        :return: Boolean mask of the accepted candidates. This is a view of a reused buffer, it must be copied if it
+         is kept beyond the current iteration.
+        """
+        log_ratios = np.reshape(log_ratios, (-1,))
+        if log_uniforms is None:
+            log_uniforms = np.log(self._draw_uniforms(len(log_ratios)), out=self._uniform_buffer[:len(log_ratios)])
+        elif self._accept_buffer is None or len(self._accept_buffer) < len(log_ratios):
+            self._accept_buffer = np.empty((max(len(log_ratios), self.n_chains),), dtype=bool)
+        accept = np.less(log_uniforms, log_ratios, out=self._accept_buffer[:len(log_ratios)])
+        current_state[:, columns] = np.where(accept[:, np.newaxis], np.reshape(candidate, (len(accept), -1)),
+                                             current_state[:, columns])
+        log_pdf_shape = np.shape(current_log_pdf)
+        current_log_pdf[...] = np.where(np.reshape(accept, log_pdf_shape), np.reshape(log_p_candidate, log_pdf_shape),
+                                        current_log_pdf)
+        return accept
+
+    def _reserve_chains(self, nsamples_per_chain):
+        """
+        Make :py:attr:`samples` (and :py:attr:`log_pdf_values`) views of length `nsamples_per_chain` of preallocated
+        buffers. The capacity of the buffers is doubled whenever it is exceeded, so that calling :meth:`run` repeatedly
+        does not copy the existing samples at every call.
+        """
+        self._samples_buffer, self.samples = self._reserve_buffer(
+            "samples", self._samples_buffer, self.samples, (self.n_chains, self.dimension), nsamples_per_chain)
+        if self.save_log_pdf:
+            self._log_pdf_buffer, self.log_pdf_values = self._reserve_buffer(
+                "log_pdf_values", self._log_pdf_buffer, self.log_pdf_values, (self.n_chains,), nsamples_per_chain)
+
+    def _reserve_buffer(self, name, buffer, stored, row_shape, nrows):
+        if stored is not None and (buffer is None or stored.base is not buffer):
+            # the stored values are not a view of the buffer (e.g. they were set by the user), adopt them
+            buffer, stored = None, np.reshape(stored, (-1,) + row_shape)
+        n_stored = 0 if stored is None else len(stored)
+        if buffer is None or len(buffer) < nrows:
+            capacity = nrows if buffer is None else max(nrows, 2 * len(buffer))
+            if self.storage is None:
+                new_buffer = np.zeros((capacity,) + row_shape)
+            else:
+                new_buffer = self._map_storage_file(name, (max(capacity, 1),) + row_shape, mode="r+")
+            if n_stored > 0 and not (self.storage is not None and buffer is not None):
+                new_buffer[:n_stored] = stored
+            buffer = new_buffer
+        return buffer, buffer[:nrows]
+
+    def _map_storage_file(self, name, shape, mode):
+        path = os.path.join(self.storage, name + ".dat")
+        if mode == "r+":
+            # grow the file if needed, the rows already written are kept in place
+            size = int(np.prod(shape)) * np.dtype(np.float64).itemsize
+            with open(path, "ab") as file:
+                if file.tell() < size:
+                    file.truncate(size)
+        return np.memmap(path, dtype=np.float64, mode=mode, shape=shape)
+
+    def _open_storage(self):
+        state_path = os.path.join(self.storage, "chain_state.pkl")
+        if not os.path.exists(state_path):
+            os.makedirs(self.storage, exist_ok=True)
+            for name in ("samples", "log_pdf_values"):
+                open(os.path.join(self.storage, name + ".dat"), "wb").close()
+            return
+        with open(state_path, "rb") as file:
+            state = pickle.load(file)
+        if (state["n_chains"], state["dimension"]) != (self.n_chains, self.dimension):
+            raise ValueError("UQpy: The chains stored in " + self.storage + " have a different number of chains or "
+                             "dimension.")
+        if state["save_log_pdf"] != self.save_log_pdf:
+            raise ValueError("UQpy: The chains stored in " + self.storage + " were run with save_log_pdf="
+                             + str(state["save_log_pdf"]) + ".")
+        self.nsamples_per_chain, self.samples_counter = state["nsamples_per_chain"], state["samples_counter"]
+        self.iterations_number, self.acceptance_rate = state["iterations_number"], state["acceptance_rate"]
+        self._worker_evaluations = state.get("worker_evaluations", 0)
+        self.random_state = state["random_state"]
+        # restored at the next run, once the sampler has initialized its own adaptive state
+        self._stored_adaptive_state = state.get("adaptive_state", {})
+        self._samples_buffer = self._map_storage_file("samples", (self.nsamples_per_chain, self.n_chains,
+                                                                   self.dimension), mode="r+")
+        self.samples = self._samples_buffer[:self.nsamples_per_chain]
+        if self.save_log_pdf:
+            self._log_pdf_buffer = self._map_storage_file("log_pdf_values", (self.nsamples_per_chain, self.n_chains),
+                                                          mode="r+")
+            self.log_pdf_values = self._log_pdf_buffer[:self.nsamples_per_chain]
+        if self.concatenate_chains:
+            self._concatenate_chains()
+        self.logger.info("UQpy: Resuming the chains stored in " + self.storage)
+
+    def _flush_storage(self):
+        if self.storage is None:
+            return
+        self._samples_buffer.flush()
+        if self.save_log_pdf:
+            self._log_pdf_buffer.flush()
+        state = {"n_chains": self.n_chains, "dimension": self.dimension, "save_log_pdf": self.save_log_pdf,
+                 "nsamples_per_chain": self.nsamples_per_chain, "samples_counter": self.samples_counter,
+                 "iterations_number": self.iterations_number, "acceptance_rate": list(self.acceptance_rate),
+                 "random_state": self.random_state, "worker_evaluations": self._worker_evaluations,
+                 "adaptive_state": self._get_adaptive_state()}
+        state_path = os.path.join(self.storage, "chain_state.pkl")
+        with open(state_path + ".tmp", "wb") as file:
+            pickle.dump(state, file)
+        os.replace(state_path + ".tmp", state_path)
+
+    def _get_adaptive_state(self):
+        """
+        State adapted by the sampler along the chains, saved with the chains streamed to disk so that a resumed run
+        continues them exactly. Samplers with adaptive proposals override this method and
+        :meth:`_set_adaptive_state`.
+
+        :return: Dictionary of the adaptive state, empty for non-adaptive samplers.
+        """
+        return {}
+
+    def _set_adaptive_state(self, state: dict):
+        """
+        Restore the state returned by :meth:`_get_adaptive_state` when resuming chains streamed to disk.
+        """
+        pass
+
+    @staticmethod
+    def load_storage(storage: str, concatenate_chains: bool = True):
+        """
+        Read chains streamed to disk by a sampler created with input `storage`, without loading them in memory.
+
+        :param storage: Path of the directory in which the chains were streamed.
+        :param concatenate_chains: Boolean that indicates whether to return the samples as an array of shape
+         ``(nsamples * n_chains, dimension)`` if :any:`True`, ``(nsamples, n_chains, dimension)`` if :any:`False`.
+        :return: Read-only :class:`numpy.memmap` arrays of the samples and of the log-pdf values (:any:`None` if they
+         were not saved).
+        """
+        with open(os.path.join(storage, "chain_state.pkl"), "rb") as file:
+            state = pickle.load(file)
+        shape = (state["nsamples_per_chain"], state["n_chains"])
+        samples = np.memmap(os.path.join(storage, "samples.dat"), dtype=np.float64, mode="r",
+                            shape=shape + (state["dimension"],))
+        log_pdf_values = None
+        if state["save_log_pdf"]:
+            log_pdf_values = np.memmap(os.path.join(storage, "log_pdf_values.dat"), dtype=np.float64, mode="r",
+                                       shape=shape)
+        if concatenate_chains:
+            samples = samples.reshape((-1, state["dimension"]))
+            log_pdf_values = None if log_pdf_values is None else log_pdf_values.reshape((-1,))
+        return samples, log_pdf_values
+
     def _update_acceptance_rate(self, chain_state_acceptance=None):
-        self.acceptance_rate = [
-            na / self.iterations_number
-            + (self.iterations_number - 1) / self.iterations_number * a
-            for (na, a) in zip(chain_state_acceptance, self.acceptance_rate)
-        ]
+        chain_state_acceptance, acceptance_rate = np.asarray(chain_state_acceptance), np.asarray(self.acceptance_rate)
+        n_chains = min(len(chain_state_acceptance), len(acceptance_rate))
+        self.acceptance_rate = list(chain_state_acceptance[:n_chains] / self.iterations_number
+                                    + (self.iterations_number - 1) / self.iterations_number
+                                    * acceptance_rate[:n_chains])
 
     @staticmethod
     def _preprocess_target(log_pdf_, pdf_, args):
@@ -250,7 +637,7 @@ class MCMC(ABC):
                 evaluate_log_pdf_marginals = list(map(lambda i: lambda x: log_pdf_[i](x, *args[i]),
                                                       range(len(log_pdf_)), ))
                 evaluate_log_pdf = lambda x: np.sum(
-                    [log_pdf_[i](x[:, i, np.newaxis], *args[i]) for i in range(len(log_pdf_))])
+                    [log_pdf_[i](x[:, i, np.newaxis], *args[i]) for i in range(len(log_pdf_))], axis=0)
             else:
                 raise TypeError("UQpy: log_pdf_target must be a callable or list of callables")
         # pdf is provided
@@ -273,7 +660,7 @@ class MCMC(ABC):
                         range(len(pdf_)), ))
                 evaluate_log_pdf = lambda x: np.sum([np.log(np.maximum(pdf_[i](x[:, i, np.newaxis], *args[i]),
                                                                        10 ** (-320) * np.ones((x.shape[0],)), ))
-                                                     for i in range(len(pdf_))])
+                                                     for i in range(len(pdf_))], axis=0)
             else:
                 raise TypeError("UQpy: pdf_target must be a callable or list of callables")
         else:
@@ -325,7 +712,11 @@ class MCMC(ABC):
 
         if 'seed' in kwargs.keys():
             kwargs['seed'] = list(kwargs['seed'])
+        if 'storage' in attributes.keys() and 'storage' not in keys:  # copies do not share the chains on disk
+            kwargs.pop('storage', None)
         if 'nsamples_per_chain' in kwargs.keys() and kwargs['nsamples_per_chain'] == 0:
             del kwargs['nsamples_per_chain']
+        # inputs explicitly set to None take their default value, e.g. to copy a sampler without running it
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
 
         return self.__class__(**kwargs)
@@ -134,30 +134,30 @@ class ParallelTemperingMCMC(TemperingMCMC):
 
         self.logger.info('UQpy: Running MCMC...')
 
+        current_state, current_log_pdf = np.array(current_state), np.array(current_log_pdf)
+        # All levels are stepped as a single stacked batch when they all use the Metropolis Hastings algorithm
+        stacked = all(type(sampler) is MetropolisHastings for sampler in self.mcmc_samplers)
+        if stacked:
+            log_reference, log_likelihood = self._evaluate_log_components(current_state)
+
         # Run nsims iterations of the MCMC algorithm, starting at current_state
         while self.mcmc_samplers[0].nsamples_per_chain < final_ns_per_chain:
-            # update the total number of iterations
-
             # run one iteration of MCMC algorithms at various temperatures
-            new_state, new_log_pdf = [], []
-            for t, sampler in enumerate(self.mcmc_samplers):
-                sampler.iterations_number += 1
-                new_state_t, new_log_pdf_t = sampler.run_one_iteration(
-                    current_state[t], current_log_pdf[t])
-                new_state.append(new_state_t.copy())
-                new_log_pdf.append(new_log_pdf_t.copy())
+            if stacked:
+                log_reference, log_likelihood = self._run_stacked_iteration(
+                    current_state, current_log_pdf, log_reference, log_likelihood)
+            else:
+                for t, sampler in enumerate(self.mcmc_samplers):
+                    sampler.iterations_number += 1
+                    current_state[t], current_log_pdf[t] = sampler.run_one_iteration(
+                        current_state[t], current_log_pdf[t])
 
             # Do sweeps if necessary
             if self.mcmc_samplers[-1].iterations_number % self.n_iterations_between_sweeps == 0:
-                for i in range(self.n_tempering_parameters - 1):
-                    log_accept = (self.mcmc_samplers[i].evaluate_log_target(new_state[i + 1]) +
-                                  self.mcmc_samplers[i + 1].evaluate_log_target(new_state[i]) -
-                                  self.mcmc_samplers[i].evaluate_log_target(new_state[i]) -
-                                  self.mcmc_samplers[i + 1].evaluate_log_target(new_state[i + 1]))
-                    for nc, log_accept_chain in enumerate(log_accept):
-                        if np.log(self.random_state.rand()) < log_accept_chain:
-                            new_state[i][nc], new_state[i + 1][nc] = new_state[i + 1][nc], new_state[i][nc]
-                            new_log_pdf[i][nc], new_log_pdf[i + 1][nc] = new_log_pdf[i + 1][nc], new_log_pdf[i][nc]
+                if not stacked:
+                    log_likelihood = self._evaluate_log_components(current_state, with_reference=False)
+                swapped_arrays = [current_state, log_likelihood] + ([log_reference] if stacked else [])
+                self._swap_chains(current_log_pdf, log_likelihood, swapped_arrays)
 
             # Update the chain, only if burn-in is over and the sample is not being jumped over
             # also increase the current number of samples and samples_per_chain
@@ -165,9 +165,9 @@ class ParallelTemperingMCMC(TemperingMCMC):
                     (self.mcmc_samplers[-1].iterations_number -
                      self.mcmc_samplers[-1].burn_length) % self.mcmc_samplers[-1].jump == 0:
                 for t, sampler in enumerate(self.mcmc_samplers):
-                    sampler.samples[sampler.nsamples_per_chain, :, :] = new_state[t].copy()
+                    sampler.samples[sampler.nsamples_per_chain, :, :] = current_state[t]
                     if self.save_log_pdf:
-                        sampler.log_pdf_values[sampler.nsamples_per_chain, :] = new_log_pdf[t].copy()
+                        sampler.log_pdf_values[sampler.nsamples_per_chain, :] = current_log_pdf[t]
                     sampler.nsamples_per_chain += 1
                     sampler.samples_counter += sampler.n_chains
 
@@ -184,6 +184,66 @@ class ParallelTemperingMCMC(TemperingMCMC):
         if self.save_log_pdf:
             self.log_pdf_values = self.mcmc_samplers[-1].log_pdf_values
 
+    def _evaluate_log_components(self, states, with_reference=True):
+        """
+        Evaluate the log-reference and the untempered log-factor :math:`\log{q_1(x)}` of the states of all levels, of
+        shape ``(n_tempering_parameters, n_chains, dimension)``, in a single call each.
+        """
+        n_levels, n_chains, dimension = states.shape
+        flat_states = states.reshape((-1, dimension))
+        log_likelihood = np.reshape(self.evaluate_log_intermediate(flat_states, 1.0), (n_levels, n_chains))
+        if not with_reference:
+            return log_likelihood
+        log_reference = np.reshape(self.evaluate_log_reference(flat_states), (n_levels, n_chains))
+        return log_reference, log_likelihood
+
+    def _run_stacked_iteration(self, current_state, current_log_pdf, log_reference, log_likelihood):
+        """
+        Run one Metropolis Hastings iteration at all temperatures, with a single evaluation of the target for the
+        candidates of all levels. The states and log-pdf values are updated in place.
+        """
+        betas = np.array(self.tempering_parameters)[:, np.newaxis]
+        candidates = np.empty_like(current_state)
+        log_uniforms = np.empty(current_log_pdf.shape)
+        for t, sampler in enumerate(self.mcmc_samplers):
+            sampler.iterations_number += 1
+            candidates[t] = current_state[t] + sampler.proposal.rvs(nsamples=sampler.n_chains,
+                                                                    random_state=sampler.random_state)
+            log_uniforms[t] = np.log(sampler.random_state.uniform(0.0, 1.0, sampler.n_chains))
+
+        candidate_log_reference, candidate_log_likelihood = self._evaluate_log_components(candidates)
+        candidate_log_pdf = candidate_log_reference + betas * candidate_log_likelihood
+        log_ratios = candidate_log_pdf - current_log_pdf
+        for t, sampler in enumerate(self.mcmc_samplers):
+            if not sampler.proposal_is_symmetric:
+                log_ratios[t] -= (sampler.proposal.log_pdf(candidates[t] - current_state[t])
+                                  - sampler.proposal.log_pdf(current_state[t] - candidates[t]))
+
+        accept = log_uniforms < log_ratios
+        current_state[...] = np.where(accept[..., np.newaxis], candidates, current_state)
+        current_log_pdf[...] = np.where(accept, candidate_log_pdf, current_log_pdf)
+        for t, sampler in enumerate(self.mcmc_samplers):
+            sampler._update_acceptance_rate(accept[t])
+        return (np.where(accept, candidate_log_reference, log_reference),
+                np.where(accept, candidate_log_likelihood, log_likelihood))
+
+    def _swap_chains(self, current_log_pdf, log_likelihood, swapped_arrays):
+        """
+        Replica exchange between adjacent temperatures. The acceptance ratios and the log-pdf values of the swapped
+        states are computed from the cached log-factors :math:`\log{q_1(x)}`, without evaluating the target.
+        """
+        for i in range(self.n_tempering_parameters - 1):
+            delta_beta = self.tempering_parameters[i] - self.tempering_parameters[i + 1]
+            log_accept = delta_beta * (log_likelihood[i + 1] - log_likelihood[i])
+            swap = np.log(self.random_state.uniform(0.0, 1.0, len(log_accept))) < log_accept
+            if not np.any(swap):
+                continue
+            log_pdf_i = current_log_pdf[i + 1][swap] + delta_beta * log_likelihood[i + 1][swap]
+            log_pdf_j = current_log_pdf[i][swap] - delta_beta * log_likelihood[i][swap]
+            current_log_pdf[i][swap], current_log_pdf[i + 1][swap] = log_pdf_i, log_pdf_j
+            for array in swapped_arrays:
+                array[i][swap], array[i + 1][swap] = array[i + 1][swap], array[i][swap]
+
     @beartype
     def evaluate_normalization_constant(self, compute_potential, log_Z0: float = None, nsamples_from_p0: int = None):
         """
@@ -9,6 +9,7 @@ from UQpy.sampling.mcmc.tempering_mcmc.baseclass.TemperingMCMC import TemperingM
 
 
 class SequentialTemperingMCMC(TemperingMCMC):
+    RESAMPLING_METHODS = ["systematic", "residual", "multinomial"]
 
     @beartype
     def __init__(self, pdf_intermediate=None, log_pdf_intermediate=None, args_pdf_intermediate=(), seed=None,
@@ -21,7 +22,8 @@ class SequentialTemperingMCMC(TemperingMCMC):
                  random_state: RandomStateType = None,
                  resampling_burn_length: int = 0,
                  resampling_proposal: Distribution = None,
-                 resampling_proposal_is_symmetric: bool = True):
+                 resampling_proposal_is_symmetric: bool = True,
+                 resampling_method: str = "systematic"):
 
         """
         Class for Sequential-Tempering MCMC
@@ -44,7 +46,14 @@ class SequentialTemperingMCMC(TemperingMCMC):
          dispersion step.
         :param resampling_proposal_is_symmetric: boolean: Indicates whether the provided resampling proposal is
          symmetric.
+        :param resampling_method: str: Scheme used to resample all points of a tempering level at once, one of
+         :code:`'systematic'`, :code:`'residual'` or :code:`'multinomial'`. The resampled points are then dispersed
+         together by a single Metropolis Hastings run with one chain per point. Ignored if `recalculate_weights` is
+         :any:`True`, in which case points are resampled and dispersed one at a time. Default: :code:`'systematic'`
         """
+        if resampling_method not in self.RESAMPLING_METHODS:
+            raise ValueError("UQpy: resampling_method must be one of " + ", ".join(self.RESAMPLING_METHODS) + ".")
+        self.resampling_method = resampling_method
 
         self.proposal = resampling_proposal
         self.proposal_is_symmetric = resampling_proposal_is_symmetric
@@ -114,11 +123,7 @@ class SequentialTemperingMCMC(TemperingMCMC):
         previous_tempering_parameter = current_tempering_parameter
         self.tempering_parameters = np.array(current_tempering_parameter)
         pts_index = np.arange(nsamples)  # Array storing sample indices
-        weights = np.zeros(nsamples)  # Array storing plausibility weights
-        weight_probabilities = np.zeros(nsamples)  # Array storing plausibility weight probabilities
-        expected_q0 = sum(
-            np.exp(self.evaluate_log_intermediate(points[i, :].reshape((1, -1)), 0.0))
-            for i in range(nsamples)) / nsamples
+        expected_q0 = np.sum(np.exp(self.evaluate_log_intermediate(points, 0.0))) / nsamples
 
         evidence_estimator = expected_q0
 
@@ -134,21 +139,20 @@ class SequentialTemperingMCMC(TemperingMCMC):
             # Copy the state of the points array
             points_copy = np.copy(points)
 
+            # Evaluate the log-likelihood of all points at once, the tempered values are obtained from this cache
+            log_likelihood = self._evaluate_log_likelihood(points)
+            is_cached = np.ones(nsamples, dtype=bool)
+
             # Adaptively set the tempering exponent for the current level
             previous_tempering_parameter = current_tempering_parameter
-            current_tempering_parameter = self._find_temper_param(previous_tempering_parameter, points,
-                                                                  self.evaluate_log_intermediate, nsamples)
+            current_tempering_parameter = self._find_temper_param(previous_tempering_parameter, log_likelihood)
             # d_exp = temper_param - temper_param_prev
             self.tempering_parameters = np.append(self.tempering_parameters, current_tempering_parameter)
 
             self.logger.info('beta selected')
 
             # Calculate the plausibility weights
-            for i in range(nsamples):
-                weights[i] = np.exp(self.evaluate_log_intermediate(points[i, :].reshape((1, -1)),
-                                                                   current_tempering_parameter)
-                                    - self.evaluate_log_intermediate(points[i, :].reshape((1, -1)),
-                                                                     previous_tempering_parameter))
+            weights = np.exp((current_tempering_parameter - previous_tempering_parameter) * log_likelihood)
 
             # Calculate normalizing constant for the plausibility weights (sum of the weights)
             w_sum = np.sum(weights)
@@ -157,51 +161,50 @@ class SequentialTemperingMCMC(TemperingMCMC):
             # Normalize plausibility weight probabilities
             weight_probabilities = (weights / w_sum)
 
-            w_theta_sum = np.zeros(self.__dimension)
-            for i in range(nsamples):
-                for j in range(self.__dimension):
-                    w_theta_sum[j] += weights[i] * points[i, j]
-            sigma_matrix = np.zeros((self.__dimension, self.__dimension))
-            for i in range(nsamples):
-                points_deviation = np.zeros((self.__dimension, 1))
-                for j in range(self.__dimension):
-                    points_deviation[j, 0] = points[i, j] - (w_theta_sum[j] / w_sum)
-                sigma_matrix += (weights[i] / w_sum) * np.dot(points_deviation,
-                                                              points_deviation.T)  # Normalized by w_sum as per Betz et al
+            # Weighted covariance of the points, normalized by w_sum as per Betz et al
+            sigma_matrix = np.atleast_2d(np.cov(points, rowvar=False, aweights=weights, bias=True))
             sigma_matrix = cov_scale ** 2 * sigma_matrix
 
             mcmc_log_pdf_target = self._target_generator(self.evaluate_log_intermediate,
                                                          self.evaluate_log_reference, current_tempering_parameter)
 
             self.logger.info('Begin Resampling')
-            # Resampling and MH-MCMC step
-            for i in range(self.n_resamples):
-
-                # Resampling from previous tempering level
-                lead_index = int(self.random_state.choice(pts_index, p=weight_probabilities))
-                lead = points_copy[lead_index]
-
-                # Defining the default proposal
-                if self.proposal_given_flag is False:
-                    self.proposal = MultivariateNormal(lead, cov=sigma_matrix)
-
-                # Single MH-MCMC step
-                x = MetropolisHastings(dimension=self.__dimension, log_pdf_target=mcmc_log_pdf_target, seed=list(lead),
-                                       nsamples=1, n_chains=1, burn_length=self.resampling_burn_length,
-                                       proposal=self.proposal, random_state=self.random_state,
-                                       proposal_is_symmetric=self.proposal_is_symmetric)
-
-                # Setting the generated sample in the array
-                points[i] = x.samples
-                points_copy[lead_index] = x.samples
-
-                if self.recalculate_weights:
-                    weights[lead_index] = np.exp(
-                        self.evaluate_log_intermediate(points[lead_index, :].reshape((1, -1)), current_tempering_parameter)
-                        - self.evaluate_log_intermediate(points[lead_index, :].reshape((1, -1)), previous_tempering_parameter))
-                    w_sum = np.sum(weights)
-                    for j in range(nsamples):
-                        weight_probabilities[j] = weights[j] / w_sum
+            if not self.recalculate_weights and self.n_resamples > 0:
+                # Resample all points at once and disperse them with a single MH run, one chain per point
+                points[:self.n_resamples] = self._resample_and_move(points_copy, weight_probabilities,
+                                                                    mcmc_log_pdf_target, sigma_matrix)
+            elif self.recalculate_weights:
+                # Resampling and MH-MCMC step, one point at a time since weights are updated after each point
+                for i in range(self.n_resamples):
+
+                    # Resampling from previous tempering level
+                    lead_index = int(self.random_state.choice(pts_index, p=weight_probabilities))
+                    lead = points_copy[lead_index]
+
+                    # Defining the default proposal
+                    if self.proposal_given_flag is False:
+                        self.proposal = MultivariateNormal(lead, cov=sigma_matrix)
+
+                    # Single MH-MCMC step
+                    x = MetropolisHastings(dimension=self.__dimension, log_pdf_target=mcmc_log_pdf_target,
+                                           seed=list(lead), nsamples=1, n_chains=1,
+                                           burn_length=self.resampling_burn_length, proposal=self.proposal,
+                                           random_state=self.random_state,
+                                           proposal_is_symmetric=self.proposal_is_symmetric)
+
+                    # Setting the generated sample in the array
+                    points[i] = x.samples
+                    points_copy[lead_index] = x.samples
+                    is_cached[i] = False
+
+                    # Recalculate the weight of the lead point
+                    if not is_cached[lead_index]:
+                        log_likelihood[lead_index] = self._evaluate_log_likelihood(
+                            points[lead_index].reshape((1, -1)))
+                        is_cached[lead_index] = True
+                    weights[lead_index] = np.exp((current_tempering_parameter - previous_tempering_parameter)
+                                                 * log_likelihood[lead_index])
+                    weight_probabilities = weights / np.sum(weights)
 
             self.logger.info('Begin MCMC')
             mcmc_seed = self._mcmc_seed_generator(resampled_pts=points[0:self.n_resamples, :],
@@ -235,8 +238,63 @@ class SequentialTemperingMCMC(TemperingMCMC):
     def evaluate_normalization_constant(self):
         return self.evidence
 
+    def _resample_and_move(self, points, weight_probabilities, log_pdf_target, sigma_matrix):
+        """
+        Population-level resample-and-move step: resample :code:`n_resamples` points according to the plausibility
+        weights, then advance all of them as parallel chains of a single Metropolis Hastings run.
+        """
+        if self.resampling_method == "systematic":
+            indices = self._systematic_resampling(weight_probabilities, self.n_resamples, self.random_state)
+        elif self.resampling_method == "residual":
+            indices = self._residual_resampling(weight_probabilities, self.n_resamples, self.random_state)
+        else:
+            indices = self.random_state.choice(len(points), size=self.n_resamples, p=weight_probabilities)
+        proposal = self.proposal
+        if self.proposal_given_flag is False:
+            proposal = MultivariateNormal(np.zeros(self.__dimension), cov=sigma_matrix)
+        x = MetropolisHastings(dimension=self.__dimension, log_pdf_target=log_pdf_target,
+                               seed=points[indices].tolist(), nsamples_per_chain=1, n_chains=self.n_resamples,
+                               burn_length=self.resampling_burn_length, proposal=proposal,
+                               random_state=self.random_state, proposal_is_symmetric=self.proposal_is_symmetric)
+        return x.samples
+
+    @staticmethod
+    def _systematic_resampling(weight_probabilities, n, random_state):
+        """
+        Systematic resampling: draw `n` indices using a single uniform random variable and `n` evenly spaced positions
+        on the cumulative distribution of the weights.
+        """
+        positions = (random_state.uniform(0.0, 1.0) + np.arange(n)) / n
+        cumulative_weights = np.cumsum(weight_probabilities)
+        cumulative_weights[-1] = 1.0
+        return np.searchsorted(cumulative_weights, positions, side="right")
+
     @staticmethod
-    def _find_temper_param(temper_param_prev, samples, q_func, n, iter_lim=1000, iter_thresh=0.00001):
+    def _residual_resampling(weight_probabilities, n, random_state):
+        """
+        Residual resampling: each index `i` is first replicated :math:`\lfloor n w_i \rfloor` times, the remaining
+        indices are drawn from the residual weights.
+        """
+        copies = np.floor(n * weight_probabilities).astype(int)
+        indices = np.repeat(np.arange(len(weight_probabilities)), copies)
+        n_residual = n - len(indices)
+        if n_residual > 0:
+            residual_weights = n * weight_probabilities - copies
+            residual_indices = random_state.choice(len(weight_probabilities), size=n_residual,
+                                                   p=residual_weights / np.sum(residual_weights))
+            indices = np.concatenate([indices, residual_indices])
+        return indices
+
+    def _evaluate_log_likelihood(self, points):
+        """
+        Evaluate the logarithm of the target factor :math:`\log{q_1(x)}` at all `points` in a single call. Since the
+        intermediate factors are tempered versions of the target factor, :math:`\log{q_{\beta}(x)} = \beta
+        \log{q_1(x)}`, all quantities needed at a given tempering level are computed from these values.
+        """
+        return np.asarray(self.evaluate_log_intermediate(points, 1.0), dtype=float).reshape((-1,))
+
+    @staticmethod
+    def _find_temper_param(temper_param_prev, log_likelihood, iter_lim=1000, iter_thresh=0.00001):
         """
         Find the tempering parameter for the next intermediate target using bisection search between 1.0 and the
         previous tempering parameter (taken to be 0.0 for the first level).
@@ -246,14 +304,9 @@ class SequentialTemperingMCMC(TemperingMCMC):
         * **temper_param_prev** ('float'):
             The value of the previous tempering parameter
 
-        * **samples** (`ndarray`):
-            Generated samples from the previous intermediate target distribution
-
-        * **q_func** (callable):
-            The intermediate distribution (called 'self.evaluate_log_intermediate' in this code)
-
-        * **n** ('int'):
-            Number of samples
+        * **log_likelihood** (`ndarray`):
+            Log of the target factor :math:`\log{q_1(x)}` evaluated at the samples generated from the previous
+            intermediate target distribution
 
         * **iter_lim** ('int'):
             Number of iterations to run the bisection search algorithm for, to avoid infinite loops
@@ -265,22 +318,13 @@ class SequentialTemperingMCMC(TemperingMCMC):
         top = 1.0
         flag = 0  # Indicates when the tempering exponent has been found (flag = 1 => solution found)
         loop_counter = 0
+        q_scaled = np.exp((1.0 - temper_param_prev) * log_likelihood)
+        if np.std(q_scaled) < np.mean(q_scaled):
+            return 1
         while flag == 0:
             loop_counter += 1
-            q_scaled = np.zeros(n)
             temper_param_trial = ((bot + top) / 2)
-            for i2 in range(n):
-                q_scaled[i2] = np.exp(q_func(samples[i2, :].reshape((1, -1)), 1)
-                                      - q_func(samples[i2, :].reshape((1, -1)), temper_param_prev))
-            sigma_1 = np.std(q_scaled)
-            mu_1 = np.mean(q_scaled)
-            if sigma_1 < mu_1:
-                flag = 1
-                temper_param_trial = 1
-                continue
-            for i3 in range(n):
-                q_scaled[i3] = np.exp(q_func(samples[i3, :].reshape((1, -1)), temper_param_trial)
-                                      - q_func(samples[i3, :].reshape((1, -1)), temper_param_prev))
+            q_scaled = np.exp((temper_param_trial - temper_param_prev) * log_likelihood)
             sigma = np.std(q_scaled)
             mu = np.mean(q_scaled)
             if sigma < (0.9 * mu):
@@ -12,6 +12,30 @@ from UQpy.sampling.stratified_sampling.strata.baseclass.Strata import Strata
 CompatibleSurrogate = Annotated[object, Is[lambda x: hasattr(x, "fit") and hasattr(x, 'predict')]]
 
 
+class _ScheduledSurrogate:
+    """
+    Surrogate passed to the strata to estimate the gradients, which only adds the new training points to `surrogate`
+    with its :meth:`update` method when no fit is scheduled.
+    """
+
+    def __init__(self, surrogate, refit: bool, n_fitted: int):
+        self.surrogate = surrogate
+        self.refit = refit
+        self.n_fitted = n_fitted
+
+    def fit(self, samples, values):
+        samples = np.atleast_2d(samples)
+        if self.refit or len(samples) <= self.n_fitted:
+            self.surrogate.fit(samples, values)
+        else:
+            values = np.asarray(values).reshape(len(samples), -1)
+            self.surrogate.update(samples[self.n_fitted:], values[self.n_fitted:])
+        self.n_fitted = len(samples)
+
+    def predict(self, points, *args, **kwargs):
+        return self.surrogate.predict(points, *args, **kwargs)
+
+
 class GradientEnhancedRefinement(Refinement):
     @beartype
     def __init__(
@@ -22,6 +46,7 @@ class GradientEnhancedRefinement(Refinement):
         nearest_points_number: int = None,
         qoi_name: str = None,
         step_size: float = 0.005,
+        refit_interval: PositiveInteger = 1,
     ):
         """
         Gradient-enhanced version (so-called GE-RSS) refinement algorithm. Draws samples in strata that possess both
@@ -38,13 +63,21 @@ class GradientEnhancedRefinement(Refinement):
          dictionary, this used to convert it to a list.
         :param step_size: Defines the size of the step to use for gradient estimation using the central difference
          method.
+        :param refit_interval: Number of refinement iterations between two fits of the surrogate model on all samples,
+         which re-estimate its hyperparameters. In the other iterations, the new samples are added with the
+         :meth:`update` method of the surrogate, e.g. :meth:`.GaussianProcessRegression.update`, which reuses the
+         factorization of the covariance matrix. Surrogates without an :meth:`update` method are always fitted.
+         Default: :math:`1`, the surrogate is fitted at every iteration.
         """
         self.runmodel_object = runmodel_object
         self.step_size = step_size
         self.nearest_points_number = nearest_points_number
         self.qoi_name = qoi_name
         self.strata = strata
+        self.refit_interval = refit_interval
         self.dy_dx = 0
+        self._iteration = 0
+        self._n_fitted = 0
         if surrogate is not None:
             if hasattr(surrogate, 'fit') and hasattr(surrogate, 'predict'):
                 self.surrogate = surrogate
@@ -59,6 +92,7 @@ class GradientEnhancedRefinement(Refinement):
         self.runmodel_object.run(samples)
         self.dy_dx = np.zeros((samples_number, np.size(training_points[1])))
         self.strata.initialize(samples_number, training_points)
+        self._iteration, self._n_fitted = 0, 0
 
     def update_samples(
         self,
@@ -72,8 +106,15 @@ class GradientEnhancedRefinement(Refinement):
     ):
         points_to_add = min(samples_per_iteration, nsamples - index)
 
+        # Fit the surrogate model, or only add the new samples to it between two scheduled fits
+        surrogate = self.surrogate
+        if surrogate is not None and hasattr(surrogate, "update"):
+            surrogate = _ScheduledSurrogate(self.surrogate, self._iteration % self.refit_interval == 0,
+                                            self._n_fitted)
+        self._iteration += 1
+
         self.strata.estimate_gradient(
-            self.surrogate,
+            surrogate,
             self.step_size,
             nsamples,
             index,
@@ -81,6 +122,8 @@ class GradientEnhancedRefinement(Refinement):
             training_points,
             self._convert_qoi_tolist(),
         )
+        if isinstance(surrogate, _ScheduledSurrogate):
+            self._n_fitted = surrogate.n_fitted
 
         strata_metrics = self.strata.calculate_gradient_strata_metrics(index)
 
@@ -98,13 +141,9 @@ class GradientEnhancedRefinement(Refinement):
         self.runmodel_object.run(samples=np.atleast_2d(samples[-samples_per_iteration:]), append_samples=True)
 
     def _convert_qoi_tolist(self):
-        qoi = [None] * len(self.runmodel_object.qoi_list)
-        if type(self.runmodel_object.qoi_list[0]) is dict:
-            for j in range(len(self.runmodel_object.qoi_list)):
-                qoi[j] = self.runmodel_object.qoi_list[j][self.qoi_name]
-        else:
-            qoi = self.runmodel_object.qoi_list
-        return qoi
+        if self.runmodel_object.results.is_structured:
+            return self.runmodel_object.results.column(self.qoi_name)
+        return self.runmodel_object.qoi
 
     def _estimate_gradient(self, points, values, prediction_points):
         """
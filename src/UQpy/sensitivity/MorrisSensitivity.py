@@ -209,7 +209,7 @@ class MorrisSensitivity:
         elementary_effects = []
         for samples in trajectories_physical_space:
             self.runmodel_object.run(samples=samples, append_samples=False)
-            qoi = np.array(self.runmodel_object.qoi_list)
+            qoi = self.runmodel_object.qoi
             el_effect = np.zeros((self.dimension,))
             perms = [np.argwhere(bi != 0.0)[0, 0] for bi in (samples[1:] - samples[:-1])]
             for count_d, d in enumerate(perms):
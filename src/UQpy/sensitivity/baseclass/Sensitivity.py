@@ -9,7 +9,6 @@ sensitivity classes:
 
 """
 
-import copy
 import numpy as np
 import scipy.stats
 
@@ -63,7 +62,7 @@ class Sensitivity:
         """
 
         self.runmodel_object.run(samples=samples, append_samples=False)
-        model_evals = copy.deepcopy(np.array(self.runmodel_object.qoi_list))
+        model_evals = np.array(self.runmodel_object.qoi)
 
         return model_evals
 
@@ -1,16 +1,34 @@
 import logging
+from collections import OrderedDict
+from typing import Union
+
 import numpy as np
-from scipy.linalg import cholesky, cho_solve
+from scipy.linalg import cholesky, cho_solve, solve_triangular
+from scipy.linalg.lapack import dpotri
 
 from beartype import beartype
 
 from UQpy.utilities.Utilities import process_random_state
 from UQpy.surrogates.baseclass.Surrogate import Surrogate
 from UQpy.utilities.ValidationTypes import RandomStateType
+from UQpy.utilities.WorkerPool import WorkerPool
 from UQpy.utilities.kernels.baseclass.Kernel import Kernel
 from UQpy.surrogates.gaussian_process.constraints.baseclass.Constraints import ConstraintsGPR
 
 
+def _minimize_worker_log_likelihood(starting_point):
+    return _minimize_log_likelihood(WorkerPool.payload(), starting_point)
+
+
+def _minimize_log_likelihood(problem, starting_point):
+    optimizer, kernel, s_, y_, noise, fx_, jac = problem
+    p_ = optimizer.optimize(function=GaussianProcessRegression.log_likelihood, initial_guess=starting_point,
+                            args=(kernel, s_, y_, noise, fx_, jac), jac=jac)
+    if isinstance(p_, np.ndarray):
+        return p_, GaussianProcessRegression.log_likelihood(p_, kernel, s_, y_, noise, fx_)
+    return p_.x, p_.fun
+
+
 class GaussianProcessRegression(Surrogate):
     @beartype
     def __init__(
@@ -25,6 +43,8 @@ class GaussianProcessRegression(Surrogate):
             normalize: bool = False,
             noise: bool = False,
             random_state: RandomStateType = None,
+            cache_size: int = 4,
+            n_workers: Union[None, int] = None,
     ):
         """
         GaussianProcessRegressor an Gaussian process regression-based surrogate model to predict the model output at
@@ -56,6 +76,13 @@ class GaussianProcessRegression(Surrogate):
         :param random_state: Random seed used to initialize the pseudo-random number generator. If an integer is
          provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
          object itself can be passed directly.
+        :param cache_size: Number of factorizations of the covariance matrix of the training points, for different
+         hyperparameters, kept in memory to speed up the predictions, see :meth:`predict`. Each one stores an
+         :math:`n \\times n` matrix, where :math:`n` is the number of training points. Default: 4.
+        :param n_workers: If provided, the `optimizations_number` maximum likelihood problems are solved on a pool of
+         `n_workers` processes. The workers are forked from the calling process when the platform allows it, otherwise
+         the kernel, the optimizer and the constraints must be picklable. Default: :any:`None`, the problems are solved
+         one after the other in the calling process.
         """
         self.regression_model = regression_model
         self.kernel = kernel
@@ -68,6 +95,8 @@ class GaussianProcessRegression(Surrogate):
         self.noise = noise
         self.logger = logging.getLogger(__name__)
         self.random_state = random_state
+        self.cache_size = cache_size
+        self.n_workers = n_workers
 
         # Variables are used outside the __init__
         self.samples = None
@@ -87,6 +116,8 @@ class GaussianProcessRegression(Surrogate):
         self.F, self.K = None, None
         self.cc, self.alpha_ = None, None
         self.mu = 0
+        self._normalized_samples, self._normalized_values = None, None
+        self._fitted_states = OrderedDict()
 
         if bounds is None:
             if isinstance(self.optimizer, type(None)) or isinstance(self.optimizer._bounds, type(None)):
@@ -162,11 +193,11 @@ class GaussianProcessRegression(Surrogate):
 
         if self.regression_model is not None:
             self.F = self.regression_model.r(s_)
+        self._normalized_samples, self._normalized_values = s_, y_
+        self._fitted_states.clear()
 
         # Maximum Likelihood Estimation : Solving optimization problem to calculate hyperparameters
         if self.optimizer is not None:
-            # To ensure that cholesky of covariance matrix is computed again during optimization
-            self.alpha_ = None
             lb = [np.log10(xy[0]) for xy in self.bounds]
             ub = [np.log10(xy[1]) for xy in self.bounds]
 
@@ -181,22 +212,18 @@ class GaussianProcessRegression(Surrogate):
                 log_bounds = [[np.log10(xy[0]), np.log10(xy[1])] for xy in self.bounds]
                 self.optimizer.update_bounds(bounds=log_bounds)
 
-            minimizer = np.zeros([self.optimizations_number, len(self.bounds)])
-            fun_value = np.zeros([self.optimizations_number, 1])
-
-            for i__ in range(self.optimizations_number):
-                p_ = self.optimizer.optimize(function=GaussianProcessRegression.log_likelihood,
-                                             initial_guess=starting_point[i__, :],
-                                             args=(self.kernel, s_, y_, self.noise, self.F),
-                                             jac=self.jac)
-
-                if isinstance(p_, np.ndarray):
-                    minimizer[i__, :] = p_
-                    fun_value[i__, 0] = GaussianProcessRegression.log_likelihood(p_, self.kernel, s_, y_,
-                                                                                 self.noise, self.F)
-                else:
-                    minimizer[i__, :] = p_.x
-                    fun_value[i__, 0] = p_.fun
+            # Analytic gradients of the log-likelihood are used if both the kernel and the optimizer support them
+            self.jac = getattr(self.kernel, "has_gradient", False) and \
+                getattr(self.optimizer, "supports_jacobian", lambda: False)()
+            problem = (self.optimizer, self.kernel, s_, y_, self.noise, self.F, self.jac)
+            if self.n_workers is None:
+                results = [_minimize_log_likelihood(problem, point) for point in starting_point]
+            else:
+                # forked workers inherit the problem, e.g. constraints calling the 'predict' method of this model
+                with WorkerPool(problem, self.n_workers) as pool:
+                    results = list(pool.map(_minimize_worker_log_likelihood, starting_point))
+            minimizer = np.array([result[0] for result in results])
+            fun_value = np.array([[result[1]] for result in results])
 
             if min(fun_value) == np.inf:
                 raise NotImplementedError("Maximum likelihood estimator failed: Choose different starting point or "
@@ -205,114 +232,150 @@ class GaussianProcessRegression(Surrogate):
             self.hyperparameters = 10 ** minimizer[t, :]
 
         # Updated Correlation matrix corresponding to MLE estimates of hyperparameters
+        self.K, state = self._compute_state(self.hyperparameters)
+        self._store_state(self.hyperparameters, state)
+        self.cc, self.alpha_, self.beta, self.mu = state["cc"], state["alpha"], state["beta"], state["mu"]
+
+        self.logger.info("UQpy: gpr fit complete.")
+
+    def update(self, samples, values, refit_hyperparameters: bool = False, optimizations_number=None):
+        """
+        Add training points to the surrogate model.
+
+        Unless `refit_hyperparameters` is :any:`True`, the hyperparameters and the normalization of the data are kept,
+        and the Cholesky factor of the covariance matrix is extended with the new points by a block update, which costs
+        :math:`O(n^2 k)` for :math:`n` training points and :math:`k` new points, instead of :math:`O(n^3)` for
+        :meth:`fit`.
+
+        :param samples: `ndarray` containing the new training points.
+        :param values: `ndarray` containing the model evaluations at the new training points.
+        :param refit_hyperparameters: If :any:`True`, the model is fitted again on all training points with
+         :meth:`fit`, which solves the maximum likelihood problem if an `optimizer` is provided.
+        :param optimizations_number: Number of optimization iterations, used if `refit_hyperparameters` is :any:`True`.
+        """
+        samples = np.atleast_2d(samples)
+        if self.samples is None or refit_hyperparameters:
+            all_samples = samples if self.samples is None else np.vstack([self.samples, samples])
+            all_values = values if self.values is None else np.vstack(
+                [self.values, np.array(values).reshape(samples.shape[0], self.values.shape[1])])
+            self.fit(all_samples, all_values, optimizations_number=optimizations_number)
+            return
+
+        values = np.array(values).reshape(samples.shape[0], self.values.shape[1])
+        if self.normalize:
+            s_new = (samples - self.sample_mean) / self.sample_std
+            y_new = (values - self.value_mean) / self.value_std
+        else:
+            s_new, y_new = samples, values
+        s_, nsamples, n_new = self._normalized_samples, self.samples.shape[0], samples.shape[0]
+        state = self._fitted_state(self.hyperparameters)
+
         if self.noise:
             self.kernel.kernel_parameter = self.hyperparameters[:-2]
-            sigma = self.hyperparameters[-2]
-            self.K = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_, s=s_) + \
-                     np.eye(nsamples) * (self.hyperparameters[-1]) ** 2
+            sigma, noise_variance = self.hyperparameters[-2], self.hyperparameters[-1] ** 2
         else:
             self.kernel.kernel_parameter = self.hyperparameters[:-1]
-            sigma = self.hyperparameters[-1]
-            self.K = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_, s=s_)
-
-        self.cc = cholesky(self.K + 1e-10 * np.eye(nsamples), lower=True)
-        self.alpha_ = cho_solve((self.cc, True), y_)
-
+            sigma, noise_variance = self.hyperparameters[-1], 0
+        k_new = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_new, s=s_)
+        k_new_new = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_new, s=s_new) + \
+            np.eye(n_new) * noise_variance
+
+        # Block Cholesky factorization [[L, 0], [B, C]] of the extended covariance matrix
+        b = solve_triangular(state["cc"], k_new.T, lower=True, check_finite=False).T
+        c = cholesky(k_new_new + 1e-10 * np.eye(n_new) - b @ b.T, lower=True)
+        cc = np.empty((nsamples + n_new, nsamples + n_new))
+        cc[:nsamples, :nsamples], cc[:nsamples, nsamples:] = state["cc"], 0
+        cc[nsamples:, :nsamples], cc[nsamples:, nsamples:] = b, c
+        if self.K is not None:
+            k = np.empty((nsamples + n_new, nsamples + n_new))
+            k[:nsamples, :nsamples], k[nsamples:, nsamples:] = self.K, k_new_new
+            k[nsamples:, :nsamples], k[:nsamples, nsamples:] = k_new, k_new.T
+            self.K = k
+
+        y_dash = np.vstack([state["y_dash"],
+                            solve_triangular(c, y_new - b @ state["y_dash"], lower=True, check_finite=False)])
+        f_dash = None
         if self.regression_model is not None:
-            # Compute the regression coefficient (solving this linear equation: F * beta = Y)
-            # Eq: 3.8, DACE
-            f_dash = np.linalg.solve(self.cc, self.F)
-            y_dash = np.linalg.solve(self.cc, y_)
-            q_, g_ = np.linalg.qr(f_dash)  # Eq: 3.11, DACE
-            # Check if F is a full rank matrix
-            if np.linalg.matrix_rank(g_) != min(np.size(self.F, 0), np.size(self.F, 1)):
-                raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
-            # Design parameters (beta: regression coefficient)
-            self.beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
-            self.mu = np.einsum("ij,jk->ik", self.F, self.beta)
-            self.alpha_ = cho_solve((self.cc, True), y_ - self.mu)
-
-        self.logger.info("UQpy: gpr fit complete.")
-
-    def predict(self, points, return_std: bool = False, hyperparameters: list = None):
+            f_new = self.regression_model.r(s_new)
+            self.F = np.vstack([self.F, f_new])
+            f_dash = np.vstack([state["f_dash"],
+                                solve_triangular(c, f_new - b @ state["f_dash"], lower=True, check_finite=False)])
+
+        self.samples, self.values = np.vstack([self.samples, samples]), np.vstack([self.values, values])
+        self._normalized_samples = np.vstack([s_, s_new])
+        self._normalized_values = np.vstack([self._normalized_values, y_new])
+        self._fitted_states.clear()
+        state = self._store_state(self.hyperparameters, self._solve_state(cc, f_dash, y_dash))
+        self.cc, self.alpha_, self.beta, self.mu = state["cc"], state["alpha"], state["beta"], state["mu"]
+
+    def predict(self, points, return_std: bool = False, hyperparameters: list = None, return_cov: bool = False):
         """
         Predict the model response at new points.
 
         This method evaluates the regression and correlation model at new sample points. Then, it predicts the function
         value and standard deviation.
 
+        The points are processed by chunks, and only the diagonal of the predictive covariance is computed for the
+        standard deviation, so that memory and time are linear in the number of points.
+
         :param points: Points at which to predict the model response.
         :param return_std: Indicator to estimate standard deviation.
         :param hyperparameters: Hyperparameters for correlation model.
+        :param return_cov: Indicator to compute the full predictive covariance matrix of the points, which is returned
+         instead of the standard deviation. This requires memory quadratic in the number of points.
         :return: Predicted values at the new points, Standard deviation of predicted values at the new points
         """
         x_ = np.atleast_2d(points)
         if self.normalize:
             x_ = (x_ - self.sample_mean) / self.sample_std
-            s_ = (self.samples - self.sample_mean) / self.sample_std
-            y_ = (self.values - self.value_mean) / self.value_std
-        else:
-            s_ = self.samples
-            y_ = self.values
+        s_ = self._normalized_samples
 
         if hyperparameters is None:
             hyperparameters = self.hyperparameters
+        kernelparameters = hyperparameters[:-1] if self.noise else hyperparameters
 
-        noise_std = 0
-        kernelparameters = hyperparameters
-        if self.noise:
-            kernelparameters = hyperparameters[:-1]
-            noise_std = hyperparameters[-1]
-
-        if hyperparameters is not None:
-            # This is used for MLE constraints, if constraints call 'predict' method.
-            self.kernel.kernel_parameter = kernelparameters[:-1]
-            if kernelparameters is not None:
-                sigma = kernelparameters[-1]
-            else:
-                raise ValueError('kernelparameters is None')
-            K = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_, s=s_) + \
-                np.eye(self.samples.shape[0]) * (noise_std ** 2)
-            cc = np.linalg.cholesky(K + 1e-10 * np.eye(self.samples.shape[0]))
-            mu = 0
-            if self.regression_model is not None:
-                f_dash = np.linalg.solve(cc, self.F)
-                y_dash = np.linalg.solve(cc, y_)
-                q_, g_ = np.linalg.qr(f_dash)  # Eq: 3.11, DACE
-                # Check if F is a full rank matrix
-                if np.linalg.matrix_rank(g_) != min(np.size(self.F, 0), np.size(self.F, 1)):
-                    raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
-                # Design parameters (beta: regression coefficient)
-                beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
-                mu = np.einsum("ij,jk->ik", self.F, beta)
-            alpha_ = cho_solve((cc, True), y_ - mu)
-        else:
-            cc, alpha_ = self.cc, self.alpha_
+        # The factorization is computed once per hyperparameters, e.g. for the MLE constraints calling this method
+        state = self._fitted_state(hyperparameters)
+        cc, alpha_ = state["cc"], state["alpha"]
 
         mu1 = 0
         if self.regression_model is not None:
-            fx = self.regression_model.r(x_)
-            if self.beta is None:
-                mu1 = np.einsum("ij,jk->ik", fx, beta)
-            else:
-                mu1 = np.einsum("ij,jk->ik", fx, self.beta)
+            mu1 = np.einsum("ij,jk->ik", self.regression_model.r(x_), state["beta"])
 
         self.kernel.kernel_parameter = kernelparameters[:-1]
         sigma = kernelparameters[-1]
 
-        k = sigma**2*self.kernel.calculate_kernel_matrix(x=x_, s=s_)
-        y = mu1 + k @ alpha_
+        # The cross-covariance is evaluated by chunks of prediction points, so that memory is linear in their number
+        n_points, nsamples = x_.shape[0], s_.shape[0]
+        chunk_size = max(1, int(getattr(self.kernel, "memory_budget", 2 ** 28) // (16 * nsamples)))
+        y = np.empty((n_points, alpha_.shape[1]))
+        var = np.empty((n_points,))
+        v = np.empty((nsamples, n_points)) if return_cov else None
+        for start in range(0, n_points, chunk_size):
+            stop = min(start + chunk_size, n_points)
+            k = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=x_[start:stop], s=s_)
+            y[start:stop] = k @ alpha_
+            if return_std or return_cov:
+                # Predictive variance k(x, x) - k K^-1 k^T, with v = L^-1 k^T
+                v_ = solve_triangular(cc, k.T, lower=True, check_finite=False)
+                var[start:stop] = (sigma ** 2 * self.kernel.calculate_kernel_diagonal(x_[start:stop])
+                                   - np.einsum("ij,ij->j", v_, v_))
+                if return_cov:
+                    v[:, start:stop] = v_
+        y = mu1 + y
         if self.normalize:
             y = self.value_mean + y * self.value_std
         if x_.shape[1] == 1:
             y = y.flatten()
 
-        if return_std:
-            self.kernel.kernel_parameter = kernelparameters[:-1]
-            sigma = kernelparameters[-1]
-            k1 = sigma**2*self.kernel.calculate_kernel_matrix(x=x_, s=x_)
-            var = (k1 - k @ cho_solve((cc, True), k.T)).diagonal()
-            mse = np.sqrt(var)
+        if return_cov:
+            cov = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=x_, s=x_) - v.T @ v
+            if self.normalize:
+                cov = np.multiply.outer(cov, self.value_std ** 2)
+                cov = cov[:, :, 0] if cov.shape[2] == 1 else cov
+            return y, cov
+        elif return_std:
+            mse = np.sqrt(np.maximum(var, 0))
             if self.normalize:
                 mse = self.value_std * mse
             if x_.shape[1] == 1:
@@ -321,8 +384,64 @@ class GaussianProcessRegression(Surrogate):
         else:
             return y
 
+    def _fitted_state(self, hyperparameters):
+        key = np.asarray(hyperparameters, dtype=float).tobytes()
+        if key in self._fitted_states:
+            self._fitted_states.move_to_end(key)
+            return self._fitted_states[key]
+        return self._store_state(hyperparameters, self._compute_state(hyperparameters)[1])
+
+    def _store_state(self, hyperparameters, state):
+        self._fitted_states[np.asarray(hyperparameters, dtype=float).tobytes()] = state
+        while len(self._fitted_states) > max(self.cache_size, 1):
+            self._fitted_states.popitem(last=False)
+        return state
+
+    def _compute_state(self, hyperparameters):
+        """
+        Factorize the covariance matrix of the training points for the given hyperparameters, and compute the
+        quantities needed for the predictions.
+
+        :return: The covariance matrix and a dictionary with its lower Cholesky factor `cc`, :math:`L^{-1} Y`
+         `y_dash`, the solution `alpha` of :math:`K \\alpha = Y - F \\beta`, and :math:`L^{-1} F` `f_dash`, the
+         regression coefficients `beta`, mean `mu` and QR decomposition `q`, `g` of `f_dash`, if a regression model is
+         used.
+        """
+        s_, y_ = self._normalized_samples, self._normalized_values
+        nsamples = s_.shape[0]
+        if self.noise:
+            self.kernel.kernel_parameter = hyperparameters[:-2]
+            sigma = hyperparameters[-2]
+            k = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_, s=s_) + \
+                np.eye(nsamples) * hyperparameters[-1] ** 2
+        else:
+            self.kernel.kernel_parameter = hyperparameters[:-1]
+            sigma = hyperparameters[-1]
+            k = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=s_, s=s_)
+
+        cc = cholesky(k + 1e-10 * np.eye(nsamples), lower=True)
+        f_dash = solve_triangular(cc, self.F, lower=True) if self.regression_model is not None else None
+        return k, self._solve_state(cc, f_dash, solve_triangular(cc, y_, lower=True))
+
+    def _solve_state(self, cc, f_dash, y_dash):
+        state = {"cc": cc, "f_dash": f_dash, "y_dash": y_dash, "beta": None, "mu": 0, "q": None, "g": None}
+        if self.regression_model is not None:
+            # Compute the regression coefficient (solving this linear equation: F * beta = Y)
+            # Eq: 3.8, DACE
+            q_, g_ = np.linalg.qr(f_dash)  # Eq: 3.11, DACE
+            # Check if F is a full rank matrix
+            if np.linalg.matrix_rank(g_) != min(np.size(self.F, 0), np.size(self.F, 1)):
+                raise NotImplementedError("Chosen regression functions are not sufficiently linearly independent")
+            # Design parameters (beta: regression coefficient)
+            state["beta"] = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
+            state["mu"] = np.einsum("ij,jk->ik", self.F, state["beta"])
+            state["q"], state["g"] = q_, g_
+            y_dash = y_dash - f_dash @ state["beta"]
+        state["alpha"] = solve_triangular(cc, y_dash, lower=True, trans="T", check_finite=False)
+        return state
+
     @staticmethod
-    def log_likelihood(p0, k_, s, y, ind_noise, fx_):
+    def log_likelihood(p0, k_, s, y, ind_noise, fx_, return_gradient: bool = False):
         """
 
         :param p0: An 1-D numpy array of hyperparameters, that are identified through MLE. The last two elements are
@@ -332,9 +451,12 @@ class GaussianProcessRegression(Surrogate):
         :param y: Output training data
         :param ind_noise: Boolean flag to indicate the noisy output
         :param fx_: Basis function evaluated at training points
-        :return:
+        :param return_gradient: Boolean flag to also return the gradient with respect to `p0`, computed analytically
+         from the same Cholesky factorization, see :meth:`.EuclideanKernel.calculate_gradient_contraction`.
+        :return: The negative log-likelihood, and its gradient if `return_gradient` is :any:`True`.
         """
-        # Return the log-likelihood function and it's gradient. Gradient is calculated using Central Difference
+        # Return the negative log-likelihood and, if requested, its analytic gradient with respect to the logarithm of
+        # the hyperparameters
         m = s.shape[0]
 
         if ind_noise:
@@ -359,7 +481,23 @@ class GaussianProcessRegression(Surrogate):
             beta = np.linalg.solve(g_, np.matmul(np.transpose(q_), y_dash))
             mu = np.einsum("ij,jk->ik", fx_, beta)
 
-        term1 = (y - mu).T @ (cho_solve((cc, True), y - mu))
+        alpha = cho_solve((cc, True), y - mu)
+        term1 = (y - mu).T @ alpha
         term2 = 2 * np.sum(np.log(np.abs(np.diag(cc))))
-
-        return 0.5 * (term1 + term2 + m * np.log(2 * np.pi))[0, 0]
+        value = 0.5 * (term1 + term2 + m * np.log(2 * np.pi))[0, 0]
+        if not return_gradient:
+            return value
+
+        # d(-log L)/dtheta = -0.5 tr((alpha alpha^T - K^-1) dK/dtheta); the regression coefficients do not contribute
+        # since they minimize the quadratic term
+        k_inv = dpotri(cc, lower=1)[0]
+        k_inv = np.tril(k_inv) + np.tril(k_inv, -1).T
+        weights = np.outer(alpha[:, 0], alpha[:, 0]) - k_inv
+        noise_variance = (10 ** p0[-1]) ** 2 if ind_noise else 0
+        n_lengthscales = len(p0) - (2 if ind_noise else 1)
+        gradient = np.empty(len(p0))
+        gradient[:n_lengthscales] = sigma ** 2 * k_.calculate_gradient_contraction(s, weights)
+        gradient[n_lengthscales] = 2 * (np.sum(weights * k__) - noise_variance * np.trace(weights))
+        if ind_noise:
+            gradient[-1] = 2 * noise_variance * np.trace(weights)
+        return value, -0.5 * np.log(10) * gradient
@@ -0,0 +1,322 @@
+import logging
+
+import numpy as np
+from beartype import beartype
+from scipy.cluster.vq import kmeans2
+from scipy.linalg import cholesky, solve_triangular
+
+from UQpy.surrogates.baseclass.Surrogate import Surrogate
+from UQpy.utilities.Utilities import process_random_state
+from UQpy.utilities.ValidationTypes import RandomStateType, PositiveInteger
+from UQpy.utilities.kernels.baseclass.Kernel import Kernel
+
+
+class SparseGaussianProcessRegression(Surrogate):
+    @beartype
+    def __init__(
+            self,
+            kernel: Kernel,
+            hyperparameters: list,
+            inducing_points_number: PositiveInteger = 100,
+            inducing_points: np.ndarray = None,
+            inducing_points_method: str = "kmeans",
+            approximation: str = "FITC",
+            regression_model=None,
+            optimizer=None,
+            bounds=None,
+            optimizations_number: int = 1,
+            normalize: bool = False,
+            random_state: RandomStateType = None,
+    ):
+        """
+        Sparse Gaussian process regression-based surrogate model, which approximates the covariance of the training
+        points through a set of :math:`m` inducing points, so that training costs :math:`O(n m^2)` operations and
+        predictions :math:`O(m)` for the mean and :math:`O(m^2)` for the standard deviation, for :math:`n` training
+        points.
+
+        :param kernel: `kernel` specifies and evaluates the kernel.
+         Built-in options: RBF, Matern
+        :param hyperparameters: List or array of initial values for the hyperparameters, of length equal to the input
+         dimension plus two (d+2): the 'd' length scales, the process standard deviation and the noise standard
+         deviation.
+        :param inducing_points_number: Number of inducing points, if they are selected from the training points.
+         Default: 100
+        :param inducing_points: Array of inducing points of shape ``(m, d)``. If provided, `inducing_points_number` and
+         `inducing_points_method` are ignored.
+        :param inducing_points_method: Method used to select the inducing points from the training points, either
+         'kmeans' (centroids of k-means clusters) or 'greedy' (training points of largest remaining prior variance,
+         i.e. the pivots of an incomplete Cholesky factorization of their covariance matrix). Default: 'kmeans'
+        :param approximation: Sparse approximation of the covariance matrix, either 'FITC' (fully independent training
+         conditional) or 'VFE' (variational free energy). Default: 'FITC'
+        :param regression_model: A class object, which computes the basis function at a sample point. If
+         regression_model is None, this class will train GP with regression.
+         Default: None
+        :param optimizer: A class object of 'MinimizeOptimizer' or 'FminCobyla' from UQpy.utilities module. If optimizer
+         is not defined, this class will not solve MLE problem and predictions will be based on hyperparameters provided
+         as input. The inducing points are selected before the MLE problem is solved, and are not modified by it.
+         Default: None.
+        :param bounds: Bounds of the loguniform distributions, which randomly generate new starting points for the MLE
+         problem.
+         Default: [10**-3, 10**3] for each hyperparameter and [10**-10, 10**-1] for the noise standard deviation.
+        :param optimizations_number: Number of times MLE optimization problem is to be solved with a random starting
+         point. Default: 1.
+        :param normalize: Boolean flag used in case data normalization is required.
+        :param random_state: Random seed used to initialize the pseudo-random number generator. If an integer is
+         provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
+         object itself can be passed directly.
+        """
+        if inducing_points_method not in ("kmeans", "greedy"):
+            raise ValueError("UQpy: The inducing_points_method must be either 'kmeans' or 'greedy'.")
+        if approximation not in ("FITC", "VFE"):
+            raise ValueError("UQpy: The approximation must be either 'FITC' or 'VFE'.")
+        self.kernel = kernel
+        self.hyperparameters = np.array(hyperparameters)
+        self.inducing_points_number = inducing_points_number
+        self.inducing_points_method = inducing_points_method
+        self.approximation = approximation
+        self.regression_model = regression_model
+        self.optimizer = optimizer
+        self.bounds = bounds
+        self.optimizations_number = optimizations_number
+        self.normalize = normalize
+        self.random_state = process_random_state(random_state)
+        self.logger = logging.getLogger(__name__)
+
+        self.inducing_points = None if inducing_points is None else np.atleast_2d(inducing_points)
+        """Inducing points of the sparse approximation."""
+        self._user_inducing_points = inducing_points is not None
+        self.beta = None
+        """Regression coefficients."""
+        self.samples, self.values = None, None
+        self.sample_mean, self.sample_std = None, None
+        self.value_mean, self.value_std = None, None
+        self.F = None
+        self.alpha_ = None
+        self._z, self._lm, self._lb = None, None, None
+
+        if bounds is None:
+            if self.optimizer is None or getattr(self.optimizer, "_bounds", None) is None:
+                self.bounds = [[10 ** -3, 10 ** 3]] * (self.hyperparameters.shape[0] - 1) + [[10 ** -10, 10 ** -1]]
+            else:
+                self.bounds = self.optimizer._bounds
+
+    def fit(self, samples, values, optimizations_number=None, hyperparameters=None):
+        """
+        Fit the surrogate model using the training samples and the corresponding model values.
+
+        :param samples: `ndarray` containing the training points.
+        :param values: `ndarray` containing the model evaluations at the training points.
+        :param optimizations_number: number of optimization iterations
+        :param hyperparameters: List or array of initial values for the hyperparameters.
+        """
+        self.logger.info("UQpy: Running sparse gpr.fit")
+
+        if optimizations_number is not None:
+            self.optimizations_number = optimizations_number
+        if hyperparameters is not None:
+            self.hyperparameters = np.array(hyperparameters)
+        self.samples = np.array(samples)
+        nsamples, input_dim = self.samples.shape
+        if self.hyperparameters.shape[0] != input_dim + 2:
+            raise RuntimeError("UQpy: The length/shape of attribute 'hyperparameter' and input dimension are not "
+                               "consistent.")
+        self.values = np.array(values).reshape(nsamples, -1)
+
+        if self.normalize:
+            self.sample_mean, self.sample_std = np.mean(self.samples, 0), np.std(self.samples, 0)
+            self.value_mean, self.value_std = np.mean(self.values, 0), np.std(self.values, 0)
+            s_ = (self.samples - self.sample_mean) / self.sample_std
+            y_ = (self.values - self.value_mean) / self.value_std
+        else:
+            s_, y_ = self.samples, self.values
+        if self.regression_model is not None:
+            self.F = self.regression_model.r(s_)
+
+        if self._user_inducing_points:
+            self._z = self.inducing_points if not self.normalize \
+                else (self.inducing_points - self.sample_mean) / self.sample_std
+        else:
+            self._z = self._select_inducing_points(s_)
+            self.inducing_points = self._z if not self.normalize else self._z * self.sample_std + self.sample_mean
+
+        # Maximum Likelihood Estimation : Solving optimization problem to calculate hyperparameters
+        if self.optimizer is not None:
+            lb = [np.log10(xy[0]) for xy in self.bounds]
+            ub = [np.log10(xy[1]) for xy in self.bounds]
+            starting_point = self.random_state.uniform(low=lb, high=ub,
+                                                       size=(self.optimizations_number, len(self.bounds)))
+            starting_point[0, :] = np.log10(self.hyperparameters)
+            self.optimizer.update_bounds(bounds=[[np.log10(xy[0]), np.log10(xy[1])] for xy in self.bounds])
+
+            minimizer = np.zeros([self.optimizations_number, len(self.bounds)])
+            fun_value = np.zeros([self.optimizations_number, 1])
+            args = (self.kernel, s_, y_, self._z, self.F, self.approximation)
+            for i__ in range(self.optimizations_number):
+                p_ = self.optimizer.optimize(function=SparseGaussianProcessRegression.log_likelihood,
+                                             initial_guess=starting_point[i__, :], args=args)
+                if isinstance(p_, np.ndarray):
+                    minimizer[i__, :] = p_
+                    fun_value[i__, 0] = SparseGaussianProcessRegression.log_likelihood(p_, *args)
+                else:
+                    minimizer[i__, :] = p_.x
+                    fun_value[i__, 0] = p_.fun
+
+            if min(fun_value) == np.inf:
+                raise NotImplementedError("Maximum likelihood estimator failed: Choose different starting point or "
+                                          "increase nopt")
+            self.hyperparameters = 10 ** minimizer[np.argmin(fun_value), :]
+
+        factorization = self._factorize(self.hyperparameters, self.kernel, s_, self._z, self.approximation)
+        self._lm, v, lam, self._lb = factorization
+        self.beta, residuals = self._regression(self.F, y_, v, lam, self._lb)
+        # alpha = Kmm^-1 Kmn C^-1 (Y - F beta) = Lm^-T B^-1 V Lambda^-1 (Y - F beta)
+        c = solve_triangular(self._lb, v @ (residuals / lam[:, np.newaxis]), lower=True)
+        self.alpha_ = solve_triangular(self._lm, solve_triangular(self._lb, c, lower=True, trans="T"),
+                                       lower=True, trans="T")
+        self.logger.info("UQpy: sparse gpr fit complete.")
+
+    def predict(self, points, return_std: bool = False):
+        """
+        Predict the model response at new points.
+
+        :param points: Points at which to predict the model response.
+        :param return_std: Indicator to estimate standard deviation.
+        :return: Predicted values at the new points, Standard deviation of predicted values at the new points
+        """
+        x_ = np.atleast_2d(points)
+        if self.normalize:
+            x_ = (x_ - self.sample_mean) / self.sample_std
+        self.kernel.kernel_parameter = self.hyperparameters[:-2]
+        sigma = self.hyperparameters[-2]
+
+        n_points, m = x_.shape[0], self._z.shape[0]
+        chunk_size = max(1, int(getattr(self.kernel, "memory_budget", 2 ** 28) // (24 * m)))
+        y = np.empty((n_points, self.alpha_.shape[1]))
+        var = np.empty((n_points,))
+        for start in range(0, n_points, chunk_size):
+            stop = min(start + chunk_size, n_points)
+            k = sigma ** 2 * self.kernel.calculate_kernel_matrix(x=x_[start:stop], s=self._z)
+            y[start:stop] = k @ self.alpha_
+            if return_std:
+                # K** - Q** + K*m (Kmm + Kmn Lambda^-1 Knm)^-1 Km*, with w = Lm^-1 Km*
+                w = solve_triangular(self._lm, k.T, lower=True, check_finite=False)
+                u = solve_triangular(self._lb, w, lower=True, check_finite=False)
+                var[start:stop] = (sigma ** 2 * self.kernel.calculate_kernel_diagonal(x_[start:stop])
+                                   - np.einsum("ij,ij->j", w, w) + np.einsum("ij,ij->j", u, u))
+        if self.regression_model is not None:
+            y += self.regression_model.r(x_) @ self.beta
+        if self.normalize:
+            y = self.value_mean + y * self.value_std
+        if x_.shape[1] == 1:
+            y = y.flatten()
+
+        if return_std:
+            mse = np.sqrt(np.maximum(var, 0))
+            if self.normalize:
+                mse = self.value_std * mse
+            if x_.shape[1] == 1:
+                mse = mse.flatten()
+            return y, mse
+        return y
+
+    @staticmethod
+    def log_likelihood(p0, k_, s, y, z, fx_, approximation):
+        """
+        Negative log marginal likelihood of the sparse approximation, with the variational trace term for 'VFE'.
+
+        :param p0: An 1-D numpy array of the logarithm (base 10) of the hyperparameters: the length scales, the process
+         standard deviation and the noise standard deviation.
+        :param k_: Kernel
+        :param s: Input training data
+        :param y: Output training data
+        :param z: Inducing points
+        :param fx_: Basis function evaluated at training points
+        :param approximation: Sparse approximation, 'FITC' or 'VFE'.
+        """
+        n = s.shape[0]
+        try:
+            lm, v, lam, lb = SparseGaussianProcessRegression._factorize(10 ** p0, k_, s, z, approximation)
+        except np.linalg.LinAlgError:
+            return np.inf
+        beta, residuals = SparseGaussianProcessRegression._regression(fx_, y, v, lam, lb)
+        residuals = residuals[:, :1]
+        c = solve_triangular(lb, v @ (residuals / lam[:, np.newaxis]), lower=True)
+        quadratic = np.sum(residuals ** 2 / lam[:, np.newaxis]) - np.sum(c ** 2)
+        log_determinant = 2 * np.sum(np.log(np.diag(lb))) + np.sum(np.log(lam))
+        value = 0.5 * (quadratic + log_determinant + n * np.log(2 * np.pi))
+        if approximation == "VFE":
+            sigma, noise_variance = 10 ** p0[-2], (10 ** p0[-1]) ** 2
+            k_.kernel_parameter = 10 ** p0[:-2]
+            trace = np.sum(sigma ** 2 * k_.calculate_kernel_diagonal(s)) - np.sum(v ** 2)
+            value += 0.5 * trace / noise_variance
+        return value
+
+    @staticmethod
+    def _factorize(hyperparameters, kernel, s, z, approximation):
+        """
+        Factorize the sparse approximation :math:`Q_{nn} + \\Lambda` of the covariance matrix, with
+        :math:`Q_{nn} = K_{nm} K_{mm}^{-1} K_{mn} = V^T V`.
+
+        :return: The Cholesky factor :math:`L_m` of :math:`K_{mm}`, :math:`V = L_m^{-1} K_{mn}`, the diagonal of
+         :math:`\\Lambda` and the Cholesky factor :math:`L_B` of :math:`B = I + V \\Lambda^{-1} V^T`.
+        """
+        kernel.kernel_parameter = hyperparameters[:-2]
+        sigma, noise_variance = hyperparameters[-2], hyperparameters[-1] ** 2
+        m = z.shape[0]
+        k_mm = sigma ** 2 * kernel.calculate_kernel_matrix(x=z, s=z)
+        # Jitter relative to the process variance, since inducing points may be close to each other
+        lm = cholesky(k_mm + 1e-8 * sigma ** 2 * np.eye(m), lower=True)
+        v = solve_triangular(lm, sigma ** 2 * kernel.calculate_kernel_matrix(x=z, s=s), lower=True,
+                             check_finite=False)
+        lam = np.full(s.shape[0], noise_variance)
+        if approximation == "FITC":
+            lam += np.maximum(sigma ** 2 * kernel.calculate_kernel_diagonal(s) - np.sum(v ** 2, axis=0), 0)
+        v_scaled = v / np.sqrt(lam)
+        lb = cholesky(np.eye(m) + v_scaled @ v_scaled.T, lower=True)
+        return lm, v, lam, lb
+
+    @staticmethod
+    def _regression(fx_, y, v, lam, lb):
+        """
+        Generalized least squares regression coefficients for the covariance matrix :math:`C = Q_{nn} + \\Lambda`,
+        whose inverse is applied with the Woodbury identity
+        :math:`C^{-1} = \\Lambda^{-1} - \\Lambda^{-1} V^T B^{-1} V \\Lambda^{-1}`.
+
+        :return: The regression coefficients and the residuals :math:`Y - F \\beta`.
+        """
+        if fx_ is None:
+            return None, y
+
+        def inverse_covariance(matrix):
+            scaled = matrix / lam[:, np.newaxis]
+            c = solve_triangular(lb, v @ scaled, lower=True)
+            return scaled - (v / lam).T @ solve_triangular(lb, c, lower=True, trans="T")
+
+        c_inv_f = inverse_covariance(fx_)
+        beta = np.linalg.solve(fx_.T @ c_inv_f, c_inv_f.T @ y)
+        return beta, y - fx_ @ beta
+
+    def _select_inducing_points(self, s_):
+        m = min(self.inducing_points_number, s_.shape[0])
+        if self.inducing_points_method == "kmeans":
+            centroids, labels = kmeans2(s_, s_[self.random_state.choice(s_.shape[0], m, replace=False)],
+                                        minit="matrix")
+            # Clusters left empty keep their initial point, which may duplicate another inducing point
+            return np.unique(centroids[np.unique(labels)], axis=0)
+
+        # Greedy selection of the points of largest remaining variance, by incomplete Cholesky factorization
+        self.kernel.kernel_parameter = self.hyperparameters[:-2]
+        remaining_variance = self.kernel.calculate_kernel_diagonal(s_).astype(float)
+        factor = np.zeros((m, s_.shape[0]))
+        selected = [self.random_state.randint(s_.shape[0])]
+        for j in range(m):
+            i = selected[j]
+            column = self.kernel.calculate_kernel_matrix(x=s_, s=s_[i:i + 1])[:, 0]
+            factor[j] = (column - factor[:j].T @ factor[:j, i]) / np.sqrt(remaining_variance[i])
+            remaining_variance = np.maximum(remaining_variance - factor[j] ** 2, 0)
+            remaining_variance[selected] = 0
+            if j + 1 < m:
+                if np.max(remaining_variance) <= 1e-12:
+                    break
+                selected.append(int(np.argmax(remaining_variance)))
+        return s_[selected]
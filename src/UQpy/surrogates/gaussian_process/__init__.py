@@ -1,4 +1,5 @@
 from UQpy.surrogates.gaussian_process.GaussianProcessRegression import GaussianProcessRegression
+from UQpy.surrogates.gaussian_process.SparseGaussianProcessRegression import SparseGaussianProcessRegression
 
 from UQpy.surrogates.gaussian_process.regression_models import *
 from UQpy.surrogates.gaussian_process.constraints import *
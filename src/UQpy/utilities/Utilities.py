@@ -163,7 +163,7 @@ def gradient(runmodel_object=None, point=None, order="first", df_step=None):
         def func_eval(x):
             if isinstance(m, RunModel):
                 m.run(samples=x, append_samples=False)
-                return np.array(m.qoi_list).flatten()
+                return np.array(m.qoi).flatten()
             else:
                 return m(x).flatten()
 
@@ -0,0 +1,71 @@
+import itertools
+import multiprocessing
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+_worker_payload = None
+# Payloads of the pools with running worker processes, inherited by the workers when they are forked
+_pool_payloads = {}
+_pool_keys = itertools.count()
+
+
+def _initialize_worker(pool_key, serialized_payload, initializer):
+    global _worker_payload
+    payload = _pool_payloads[pool_key] if serialized_payload is None else pickle.loads(serialized_payload)
+    _worker_payload = payload if initializer is None else initializer(payload)
+
+
+def _release(executor, pool_key):
+    executor.shutdown(wait=True)
+    _pool_payloads.pop(pool_key, None)
+
+
+class WorkerPool:
+    def __init__(self, payload, n_workers: int, initializer: Callable = None):
+        """
+        Pool of worker processes sharing a common payload, e.g. a model or a target density, that the tasks of the
+        pool read with :meth:`payload`.
+
+        The workers are forked from the calling process when the platform allows it, so that they inherit the payload,
+        which does not need to be picklable. Otherwise, the payload is pickled and sent to each worker. The pool is shut
+        down by :meth:`shutdown`, at the exit of a :code:`with` block, or when it is garbage collected.
+
+        :param payload: Object made available to the tasks run by the workers.
+        :param n_workers: Number of worker processes.
+        :param initializer: Function applied to the payload once in each worker, whose output is returned by
+         :meth:`payload` instead of the payload itself. It must be picklable if the workers are not forked.
+        """
+        pool_key = next(_pool_keys)
+        if "fork" in multiprocessing.get_all_start_methods():
+            _pool_payloads[pool_key] = payload
+            context, initargs = multiprocessing.get_context("fork"), (pool_key, None, initializer)
+        else:
+            context, initargs = None, (None, pickle.dumps(payload), initializer)
+        self._executor = ProcessPoolExecutor(max_workers=n_workers, mp_context=context,
+                                             initializer=_initialize_worker, initargs=initargs)
+        self._finalizer = weakref.finalize(self, _release, self._executor, pool_key)
+
+    @staticmethod
+    def payload():
+        """Payload of the pool, to be called by the tasks run in the worker processes."""
+        return _worker_payload
+
+    def submit(self, function: Callable, *args):
+        """Run `function(*args)` on a worker process, see :meth:`concurrent.futures.Executor.submit`."""
+        return self._executor.submit(function, *args)
+
+    def map(self, function: Callable, *iterables):
+        """Map `function` over `iterables` on the worker processes, see :meth:`concurrent.futures.Executor.map`."""
+        return self._executor.map(function, *iterables)
+
+    def shutdown(self):
+        """Shut down the worker processes and release the payload."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -5,5 +5,6 @@ from UQpy.utilities.Utilities import *
 from UQpy.utilities.ValidationTypes import *
 from UQpy.utilities.DistanceMetric import *
 from UQpy.utilities.GrassmannPoint import GrassmannPoint
+from UQpy.utilities.WorkerPool import WorkerPool
 from UQpy.utilities.distances import *
 from UQpy.utilities.kernels import *
@@ -1,7 +1,110 @@
 from abc import ABC
+from typing import Union
+
+import numpy as np
 
 from UQpy.utilities.kernels.baseclass.Kernel import Kernel
 
 
 class EuclideanKernel(Kernel, ABC):
     """This is a blueprint for Euclidean kernels implemented in the :py:mod:`kernels` module ."""
+
+    def __init__(self, kernel_parameter: Union[int, float], memory_budget: int = 2 ** 28, dtype=np.float64):
+        """
+        :param kernel_parameter: Scale parameter(s) of the kernel.
+        :param memory_budget: Approximate size in bytes of the temporary arrays used to compute the kernel matrix,
+         which is evaluated by blocks of rows that fit in this budget. The size of the kernel matrix itself is not
+         included. Default: 256 MiB.
+        :param dtype: Floating point type of the kernel matrix, e.g. :class:`numpy.float32` to halve its memory.
+         Default: :class:`numpy.float64`
+        """
+        super().__init__(kernel_parameter)
+        self.memory_budget = memory_budget
+        self.dtype = dtype
+
+    def calculate_kernel_diagonal(self, x):
+        """
+        Compute the diagonal of the kernel matrix of the points `x` with themselves. Euclidean kernels are stationary
+        and normalized, hence :math:`k(x_i, x_i) = 1`.
+
+        :params x: An array containing the points.
+        """
+        return np.ones(np.atleast_2d(x).shape[0], dtype=self.dtype)
+
+    @property
+    def has_gradient(self):
+        """:any:`True` if the kernel provides :meth:`calculate_gradient_contraction`."""
+        return False
+
+    def calculate_gradient_contraction(self, x, weights):
+        """
+        Contract the derivatives of the kernel matrix of the points `x` with respect to the logarithm of each length
+        scale :math:`l_i` with a symmetric matrix of weights :math:`W`, i.e. compute
+        :math:`\\sum_{jk} W_{jk} \\partial k(x_j, x_k) / \\partial \\log l_i`, e.g. for the gradient of the
+        log-likelihood of a Gaussian process.
+
+        The derivatives have the form :math:`G(r_{jk}) (x_{ji} - x_{ki})^2 / l_i^2`, where :math:`r_{jk}` is the scaled
+        distance between the points, so that the contraction is computed with matrix products without forming the
+        derivative matrix of each length scale.
+
+        :params x: An array containing the points.
+        :params weights: Symmetric array of shape ``(n_x, n_x)``.
+        :return: Array of the contractions for each length scale.
+        """
+        derivatives = self._calculate_by_blocks(x, x, self._radial_derivative, out=np.empty((len(x), len(x))))
+        derivatives *= weights
+        x_ = np.atleast_2d(x / self.kernel_parameter)
+        x_ = x_ - np.mean(x_, axis=0)
+        # sum_jk M_jk (x_j - x_k)^2 = 2 sum_j x_j^2 sum_k M_jk - 2 x^T M x for a symmetric matrix M
+        contraction = 2 * (x_ ** 2).T @ np.sum(derivatives, axis=1) - 2 * np.einsum("ji,ji->i", x_, derivatives @ x_)
+        return contraction if np.ndim(self.kernel_parameter) > 0 else np.sum(contraction, keepdims=True)
+
+    def _radial_derivative(self, squared_distances):
+        """
+        Compute the function :math:`G` of the squared scaled distances such that the derivative of the kernel with
+        respect to the logarithm of the length scale :math:`l_i` is :math:`G(r) (x_i - s_i)^2 / l_i^2`.
+        """
+        raise NotImplementedError("UQpy: The gradient of this kernel is not available.")
+
+    def _calculate_by_blocks(self, x, s, kernel_function, out=None):
+        """
+        Evaluate a function of the scaled squared Euclidean distances between the rows of `x` and `s`, by blocks of
+        rows of `x`, without forming the differences of all pairs of points.
+
+        The squared distances are computed with the identity :math:`\\|x-s\\|^2 = \\|x\\|^2 + \\|s\\|^2 - 2 x \\cdot s`,
+        so that most of the work is a matrix product. The points are centered beforehand to limit cancellation, and
+        the distance of identical points is exactly zero.
+
+        :param kernel_function: Function mapping a block of squared distances to the kernel values. It may modify its
+         input in place.
+        :param out: Array of shape ``(n_x, n_s)`` in which the kernel matrix is written. Its type is used for the
+         computations. If not provided, a new array of type `dtype` is allocated.
+        """
+        x_ = np.atleast_2d(x / self.kernel_parameter)
+        s_ = np.atleast_2d(s / self.kernel_parameter)
+        if out is None:
+            out = np.empty((x_.shape[0], s_.shape[0]), dtype=self.dtype)
+        elif out.shape != (x_.shape[0], s_.shape[0]):
+            raise ValueError("UQpy: The shape of 'out' must be (" + str(x_.shape[0]) + ", " + str(s_.shape[0]) + ").")
+        symmetric = x_.shape == s_.shape and np.array_equal(x_, s_)
+
+        center = np.mean(s_, axis=0)
+        x_ = (x_ - center).astype(out.dtype, copy=False)
+        s_ = (s_ - center).astype(out.dtype, copy=False)
+        x_norms = np.einsum("ij,ij->i", x_, x_)
+        s_norms = np.einsum("ij,ij->i", s_, s_)
+
+        # Each block needs about two temporaries of its size, e.g. for (1 + d) * exp(-d)
+        block_size = max(1, int(self.memory_budget // (2 * out.itemsize * max(1, s_.shape[0]))))
+        for start in range(0, x_.shape[0], block_size):
+            stop = min(start + block_size, x_.shape[0])
+            block = out[start:stop]
+            np.matmul(x_[start:stop], s_.T, out=block)
+            block *= -2
+            block += x_norms[start:stop, np.newaxis]
+            block += s_norms
+            np.maximum(block, 0, out=block)
+            if symmetric:
+                np.fill_diagonal(block[:, start:stop], 0)
+            block[...] = kernel_function(block)
+        return out
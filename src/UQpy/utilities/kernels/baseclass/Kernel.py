@@ -30,6 +30,19 @@ class Kernel(ABC):
         """
         pass
 
+    def calculate_kernel_diagonal(self, x):
+        """
+        Compute the diagonal of the kernel matrix of the points `x` with themselves, i.e. :math:`k(x_i, x_i)`, without
+        forming the full kernel matrix. Kernels for which this diagonal is known should override this method.
+
+        :params x: An array containing the points.
+        """
+        kernel_matrix = self.kernel_matrix
+        diagonal = np.array([self.calculate_kernel_matrix(point[np.newaxis], point[np.newaxis])[0, 0]
+                             for point in np.atleast_2d(x)])
+        self.kernel_matrix = kernel_matrix
+        return diagonal
+
     @staticmethod
     def check_samples_and_return_stack(x, s):
         x_, s_ = np.atleast_2d(x), np.atleast_2d(s)
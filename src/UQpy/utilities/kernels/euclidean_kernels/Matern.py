@@ -3,36 +3,72 @@ from typing import Union
 import numpy as np
 
 from UQpy.utilities.kernels.baseclass.EuclideanKernel import EuclideanKernel
-from scipy.spatial.distance import cdist
 from scipy.special import gamma, kv
 
 
 class Matern(EuclideanKernel):
-    def __init__(self, kernel_parameter: Union[int, float] = 1, nu=1.5):
+    def __init__(self, kernel_parameter: Union[int, float] = 1, nu=1.5, memory_budget: int = 2 ** 28,
+                 dtype=np.float64):
         """
         Matern Kernel is a generalization of Radial Basis Function kernel.
 
         :params nu: Shape parameter. For nu=0.5, 1.5, 2.5 and infinity, matern coincides with the exponential,
          matern-3/2, matern-5/2 and RBF covariance function, respectively.
+        :params memory_budget: Approximate size in bytes of the temporary arrays used to compute the kernel matrix by
+         blocks of rows. Default: 256 MiB.
+        :params dtype: Floating point type of the kernel matrix. Default: :class:`numpy.float64`
         """
-        super().__init__(kernel_parameter)
+        super().__init__(kernel_parameter, memory_budget, dtype)
         self.nu = nu
 
-    def calculate_kernel_matrix(self, x, s):
-        l = self.kernel_parameter
-        stack = cdist(x / l, s / l, metric='euclidean')
+    def calculate_kernel_matrix(self, x, s, out=None):
+        """
+        This method compute the Matern kernel on sample points 'x' and 's'.
+
+        :params x: An array containing training points.
+        :params s: An array containing input points.
+        :params out: Optional array of shape ``(n_x, n_s)`` in which the kernel matrix is written.
+        """
+        self.kernel_matrix = self._calculate_by_blocks(x, s, self._matern, out=out)
+        return self.kernel_matrix
+
+    @property
+    def has_gradient(self):
+        return self.nu in (0.5, 1.5, 2.5, np.inf)
+
+    def _radial_derivative(self, squared_distances):
+        if self.nu == np.inf:
+            squared_distances *= -0.5
+            return np.exp(squared_distances, out=squared_distances)
+        stack = np.sqrt(squared_distances, out=squared_distances)
         if self.nu == 0.5:
-            self.kernel_matrix = np.exp(-np.abs(stack))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(stack > 0, np.exp(-stack) / stack, 0)
         elif self.nu == 1.5:
-            self.kernel_matrix = (1 + np.sqrt(3) * stack) * np.exp(-np.sqrt(3) * stack)
+            stack *= np.sqrt(3)
+            return 3 * np.exp(-stack)
         elif self.nu == 2.5:
-            self.kernel_matrix = (1 + np.sqrt(5) * stack + 5 * (stack ** 2) / 3) * np.exp(-np.sqrt(5) * stack)
-        elif self.nu == np.inf:
-            self.kernel_matrix = np.exp(-(stack ** 2) / 2)
+            stack *= np.sqrt(5)
+            return 5 / 3 * (1 + stack) * np.exp(-stack)
+        return super()._radial_derivative(squared_distances)
+
+    def _matern(self, squared_distances):
+        if self.nu == np.inf:
+            squared_distances *= -0.5
+            return np.exp(squared_distances, out=squared_distances)
+        stack = np.sqrt(squared_distances, out=squared_distances)
+        if self.nu == 0.5:
+            stack *= -1
+            return np.exp(stack, out=stack)
+        elif self.nu == 1.5:
+            stack *= np.sqrt(3)
+            return (1 + stack) * np.exp(-stack)
+        elif self.nu == 2.5:
+            stack *= np.sqrt(5)
+            return (1 + stack + (stack ** 2) / 3) * np.exp(-stack)
         else:
             stack *= np.sqrt(2 * self.nu)
             tmp = 1 / (gamma(self.nu) * (2 ** (self.nu - 1)))
             tmp1 = stack ** self.nu
             tmp2 = kv(self.nu, stack)
-            self.kernel_matrix = tmp * tmp1 * tmp2
-        return self.kernel_matrix
+            return tmp * tmp1 * tmp2
@@ -3,20 +3,38 @@ from typing import Union
 import numpy as np
 
 from UQpy.utilities.kernels.baseclass.EuclideanKernel import EuclideanKernel
-from UQpy.utilities.kernels.baseclass.Kernel import Kernel
 
 
 class RBF(EuclideanKernel):
-    def __init__(self, kernel_parameter: Union[int, float] = 1.0):
-        super().__init__(kernel_parameter)
+    def __init__(self, kernel_parameter: Union[int, float] = 1.0, memory_budget: int = 2 ** 28, dtype=np.float64):
+        """
+        Radial Basis Function kernel.
+
+        :params memory_budget: Approximate size in bytes of the temporary arrays used to compute the kernel matrix by
+         blocks of rows. Default: 256 MiB.
+        :params dtype: Floating point type of the kernel matrix. Default: :class:`numpy.float64`
+        """
+        super().__init__(kernel_parameter, memory_budget, dtype)
 
-    def calculate_kernel_matrix(self, x, s):
+    def calculate_kernel_matrix(self, x, s, out=None):
         """
         This method compute the RBF kernel on sample points 'x' and 's'.
 
         :params x: An array containing training points.
         :params s: An array containing input points.
+        :params out: Optional array of shape ``(n_x, n_s)`` in which the kernel matrix is written.
         """
-        stack = Kernel.check_samples_and_return_stack(x / self.kernel_parameter, s / self.kernel_parameter)
-        self.kernel_matrix = np.exp(np.sum(-0.5 * (stack ** 2), axis=2))
+        def rbf(squared_distances):
+            squared_distances *= -0.5
+            return np.exp(squared_distances, out=squared_distances)
+
+        self.kernel_matrix = self._calculate_by_blocks(x, s, rbf, out=out)
         return self.kernel_matrix
+
+    @property
+    def has_gradient(self):
+        return True
+
+    def _radial_derivative(self, squared_distances):
+        squared_distances *= -0.5
+        return np.exp(squared_distances, out=squared_distances)
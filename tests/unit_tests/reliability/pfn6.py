@@ -0,0 +1,7 @@
+import numpy as np
+
+
+def example2(samples=None):
+    d = 2
+    beta = 3.0902
+    return -1 / np.sqrt(d) * (samples[:, 0] + samples[:, 1]) + beta
@@ -1,3 +1,4 @@
+import os
 import shutil
 
 import numpy as np
@@ -49,10 +50,226 @@ def test_subset():  # Define the structural problem
                                 nsamples_per_subset=n_samples_set, samples_init=init_sus_samples)
 
     print(SuS_object.failure_probability)
-    assert SuS_object.failure_probability == 3.1200000000000006e-05
+    assert SuS_object.failure_probability == 1.86e-05
 
 
+def linear_subset_simulation(**kwargs):
+    from UQpy.run_model.model_execution.PythonModel import PythonModel
+    from UQpy.sampling import ModifiedMetropolisHastings
+
+    distribution = JointIndependent(marginals=[Normal(), Normal()])
+    initial_samples = MonteCarloSampling(distributions=distribution, nsamples=1000, random_state=1).samples
+    runmodel_object = RunModel(model=PythonModel(model_script='pfn6.py', model_object_name='example2'))
+    calls = []
+    run = runmodel_object.run
+
+    def counting_run(samples=None, **run_kwargs):
+        calls.append(len(samples))
+        return run(samples=samples, **run_kwargs)
+
+    runmodel_object.run = counting_run
+    sampling = ModifiedMetropolisHastings(pdf_target=distribution.pdf, dimension=2, n_chains=100, random_state=1)
+    subset_simulation = SubsetSimulation(sampling=sampling, runmodel_object=runmodel_object, samples_init=initial_samples,
+                                         nsamples_per_subset=1000, **kwargs)
+    return subset_simulation, calls
+
+
+def test_subset_one_model_call_per_step():
+    subset_simulation, calls = linear_subset_simulation()
+    n_levels = len(subset_simulation.performance_threshold_per_level) - 1
+    assert calls[0] == 1000
+    assert len(calls) == 1 + 9 * n_levels
+    assert all(0 < n <= 100 for n in calls[1:])
+    assert 5e-4 < subset_simulation.failure_probability < 2e-3
+    for level in range(1, n_levels + 1):
+        samples = subset_simulation.samples[level]
+        performance_function = subset_simulation.performance_function_per_level[level]
+        assert np.allclose(performance_function, 3.0902 - (samples[:, 0] + samples[:, 1]) / np.sqrt(2))
+        assert np.all(performance_function <= subset_simulation.performance_threshold_per_level[level - 1])
+
+
+def test_subset_marginal_target():
+    from UQpy.run_model.model_execution.PythonModel import PythonModel
+    from UQpy.sampling import ModifiedMetropolisHastings
+
+    distribution = JointIndependent(marginals=[Normal(), Normal()])
+    initial_samples = MonteCarloSampling(distributions=distribution, nsamples=1000, random_state=1).samples
+    runmodel_object = RunModel(model=PythonModel(model_script='pfn6.py', model_object_name='example2'))
+    sampling = ModifiedMetropolisHastings(pdf_target=[Normal().pdf, Normal().pdf], dimension=2, n_chains=100,
+                                          random_state=1, save_log_pdf=True, concatenate_chains=False)
+    subset_simulation = SubsetSimulation(sampling=sampling, runmodel_object=runmodel_object,
+                                         samples_init=initial_samples, nsamples_per_subset=1000)
+    assert 3e-4 < subset_simulation.failure_probability < 2e-3
+    mcmc = subset_simulation.mcmc_objects[-1]
+    assert np.allclose(mcmc.log_pdf_values, np.sum(Normal().log_pdf(mcmc.samples.reshape(-1, 1)).reshape(
+        mcmc.samples.shape), axis=2))
+
+
+def test_subset_workers_shut_down():
+    from UQpy.run_model.model_execution.PythonModel import PythonModel
+    from UQpy.sampling import MetropolisHastings
+    from UQpy.utilities.WorkerPool import _pool_payloads
+
+    distribution = JointIndependent(marginals=[Normal(), Normal()])
+    runmodel_object = RunModel(model=PythonModel(model_script='pfn6.py', model_object_name='example2'))
+    sampling = MetropolisHastings(log_pdf_target=distribution.log_pdf, dimension=2, n_chains=100, random_state=1,
+                                  n_workers=2)
+    subset_simulation = SubsetSimulation(sampling=sampling, runmodel_object=runmodel_object,
+                                         nsamples_per_subset=1000)
+    assert len(subset_simulation.mcmc_objects) > 2
+    assert all(mcmc._worker_pool is None for mcmc in subset_simulation.mcmc_objects)
+    assert not _pool_payloads
+
+
+def test_subset_delayed_evaluation():
+    subset_simulation, calls = linear_subset_simulation(delayed_evaluation=True)
+    n_levels = len(subset_simulation.performance_threshold_per_level) - 1
+    assert len(calls) == 1 + 9 * n_levels
+    assert 5e-4 < subset_simulation.failure_probability < 2e-3
+
+
+def test_subset_delayed_evaluation_ensemble_sampler():
+    from UQpy.run_model.model_execution.PythonModel import PythonModel
+    from UQpy.sampling import Stretch
+    import pytest
+
+    distribution = JointIndependent(marginals=[Normal(), Normal()])
+    runmodel_object = RunModel(model=PythonModel(model_script='pfn6.py', model_object_name='example2'))
+    with pytest.raises(ValueError):
+        SubsetSimulation(sampling=Stretch(pdf_target=distribution.pdf, dimension=2, n_chains=100),
+                         runmodel_object=runmodel_object, delayed_evaluation=True)
+
+
+def correlation_factors_reference(indicator, response_function_values, conditional_probability, acceptance_rate):
+    n_samples_per_chain, n_chains = indicator.shape
+    gamma = np.zeros(n_samples_per_chain - 1)
+    r = np.zeros(n_samples_per_chain)
+    ii = indicator * 1
+    r_ = ii @ ii.T / n_chains - conditional_probability ** 2
+    for i in range(r_.shape[0]):
+        r[i] = np.sum(np.diag(r_, i)) / (r_.shape[0] - i)
+    r = r / (0.1 * (1 - 0.1))
+    for i in range(n_samples_per_chain - 1):
+        gamma[i] = (1 - ((i + 1) / n_samples_per_chain)) * r[i + 1]
+    gamma = 2 * np.sum(gamma)
+
+    beta = 0
+    for i in range(n_chains):
+        for j in range(i + 1, n_chains):
+            if response_function_values[0, i] == response_function_values[0, j]:
+                beta += 1
+    beta *= 2
+    factor = sum((1 - (i + 1) * n_samples_per_chain / n_chains) * (1 - np.mean(acceptance_rate))
+                 for i in range(n_samples_per_chain - 1))
+    return gamma, beta / n_chains * (factor * 2 + 1)
+
+
+def subset_simulation_stub(conditional_probability, acceptance_rate):
+    from types import SimpleNamespace
+
+    subset_simulation = SubsetSimulation.__new__(SubsetSimulation)
+    subset_simulation.conditional_probability = conditional_probability
+    subset_simulation.mcmc_objects = [None, SimpleNamespace(acceptance_rate=acceptance_rate)]
+    return subset_simulation
+
+
+def test_correlation_factors_match_reference():
+    random_state = np.random.RandomState(0)
+    n_samples_per_chain, n_chains = 10, 300
+    # chains with repeated values, as produced by rejected MCMC moves
+    response_function_values = np.round(random_state.randn(n_samples_per_chain, n_chains), 1)
+    indicator = response_function_values < 0.5
+    acceptance_rate = random_state.uniform(0.2, 0.8, n_chains)
+    subset_simulation = subset_simulation_stub(0.1, acceptance_rate)
+    gamma = subset_simulation._correlation_factor_gamma(indicator, n_samples_per_chain, n_chains)
+    beta = subset_simulation._correlation_factor_beta(response_function_values, 1)
+    gamma_reference, beta_reference = correlation_factors_reference(indicator, response_function_values, 0.1,
+                                                                    acceptance_rate)
+    assert np.isclose(gamma, gamma_reference, rtol=1e-12, atol=1e-12)
+    assert beta == beta_reference
+
+
+def test_correlation_factors_large_subsets():
+    # 10^6 samples per subset, i.e. 10^5 chains, where the pairwise comparison of chains is not tractable
+    random_state = np.random.RandomState(1)
+    n_samples_per_chain, n_chains = 10, 100000
+    subset_simulation = subset_simulation_stub(0.1, np.full(n_chains, 0.5))
+    # constant chains, 10% of which are in the next subset: the correlation coefficients are all 1, hence
+    # gamma = 2 * sum_k (1 - k / N) = N - 1
+    indicator = np.zeros((n_samples_per_chain, n_chains), dtype=bool)
+    indicator[:, random_state.choice(n_chains, n_chains // 10, replace=False)] = True
+    gamma = subset_simulation._correlation_factor_gamma(indicator, n_samples_per_chain, n_chains)
+    assert np.isclose(gamma, n_samples_per_chain - 1, rtol=1e-12)
+    # independent samples: the correlation coefficients vanish
+    indicator = random_state.uniform(size=(n_samples_per_chain, n_chains)) < 0.1
+    gamma = subset_simulation._correlation_factor_gamma(indicator, n_samples_per_chain, n_chains)
+    assert abs(gamma) < 0.1
+    # the chains start from seeds repeated 4 times, i.e. 3 * n_chains ordered pairs of equal seeds, and
+    # 1 + 2 * (1 - 0.5) * sum_k (1 - k * N / n_chains) = 1 + 9 - 0.0045
+    response_function_values = random_state.randn(n_samples_per_chain, n_chains)
+    response_function_values[0] = random_state.permutation(np.repeat(random_state.randn(n_chains // 4), 4))
+    beta = subset_simulation._correlation_factor_beta(response_function_values, 1)
+    assert np.isclose(beta, 3 * 9.9955, rtol=1e-12)
+
+
+def test_subset_failure_probabilities():
+    subset_simulation, _ = linear_subset_simulation()
+    assert np.allclose(subset_simulation.failure_probabilities(0.0), subset_simulation.failure_probability)
+    probabilities = subset_simulation.failure_probabilities(np.linspace(-1.0, 3.0, 9))
+    assert np.all(np.diff(probabilities) > 0)
+    assert 1e-2 < probabilities[4] < 3e-2  # P(G < 1) = 0.0183
+
+
+def replicates(**kwargs):
+    from UQpy.run_model.model_execution.PythonModel import PythonModel
+    from UQpy.sampling import ModifiedMetropolisHastings
+    from UQpy.reliability import SubsetSimulationReplicates
+
+    distribution = JointIndependent(marginals=[Normal(), Normal()])
+    runmodel_object = RunModel(model=PythonModel(model_script='pfn6.py', model_object_name='example2'))
+    sampling = ModifiedMetropolisHastings(pdf_target=distribution.pdf, dimension=2, n_chains=100, random_state=1)
+    return SubsetSimulationReplicates(runmodel_object=runmodel_object, sampling=sampling, n_replicates=6,
+                                      distributions=distribution, nsamples_per_subset=1000, random_state=3, **kwargs)
+
 
+def test_subset_replicates():
+    serial = replicates()
+    parallel = replicates(n_workers=2)
+    assert np.array_equal(serial.failure_probability_per_replicate, parallel.failure_probability_per_replicate)
+    assert serial.runmodel_object.results.nsamples == 0
+    assert len(np.unique(serial.failure_probability_per_replicate)) == 6
+    assert 5e-4 < serial.failure_probability < 2e-3
+    assert 0 < serial.coefficient_of_variation < 1
+    probabilities = serial.failure_probabilities([0.0, 1.0])
+    assert probabilities.shape == (6, 2)
+    assert np.allclose(probabilities[:, 0], serial.failure_probability_per_replicate)
 
 
+def test_subset_replicates_third_party_model(tmp_path, monkeypatch):
+    from UQpy.run_model.model_execution.ThirdPartyModel import ThirdPartyModel
+    from UQpy.sampling import MetropolisHastings
+    from UQpy.reliability import SubsetSimulationReplicates
 
+    with open(tmp_path / 'linear_model.py', 'w') as f:
+        f.write("import numpy as np\n\n\ndef linear(index):\n"
+                "    x = np.loadtxt('InputFiles/sample_%d.txt' % index)\n"
+                "    np.save('g_%d.npy' % index, 3.0902 - np.sum(x) / np.sqrt(2))\n")
+    with open(tmp_path / 'read_linear_model.py', 'w') as f:
+        f.write("import numpy as np\n\n\ndef read_output(index):\n    return float(np.load('g_%d.npy' % index))\n")
+    with open(tmp_path / 'sample.txt', 'w') as f:
+        f.write("<x0> <x1>\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    model = ThirdPartyModel(model_script='linear_model.py', input_template='sample.txt', var_names=['x0', 'x1'],
+                            model_object_name='linear', output_script='read_linear_model.py',
+                            output_object_name='read_output')
+    distribution = JointIndependent(marginals=[Normal(), Normal()])
+    sampling = MetropolisHastings(log_pdf_target=distribution.log_pdf, dimension=2, n_chains=10, random_state=1)
+    results = [SubsetSimulationReplicates(runmodel_object=RunModel(model=model), sampling=sampling, n_replicates=3,
+                                          distributions=distribution, nsamples_per_subset=100, max_level=2,
+                                          random_state=3, n_workers=n_workers)
+               for n_workers in [None, 2]]
+    assert np.array_equal(results[0].failure_probability_per_replicate, results[1].failure_probability_per_replicate)
+    assert len(np.unique(results[0].failure_probability_per_replicate)) == 3
+    assert len([name for name in os.listdir(model.model_dir) if name.startswith('replicate_')]) == 6
+    assert os.getcwd() == str(tmp_path)
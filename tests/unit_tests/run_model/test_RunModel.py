@@ -3,12 +3,14 @@ import shutil
 from beartype.roar import BeartypeCallHintPepParamException
 
 from UQpy.run_model.model_execution.PythonModel import PythonModel
-from UQpy.run_model import ThirdPartyModel, RunModel
+from UQpy.run_model import ThirdPartyModel, RunModel, ProcessPoolExecution, ThreadPoolExecution, ResultsStore, \
+    EvaluationCache, AsyncExecution
 from UQpy.sampling import MonteCarloSampling
 from UQpy.run_model.RunModel import RunModel
 from UQpy.distributions import Normal
 import pytest
 import os
+import time
 import numpy as np
 
 d = Normal(loc=0, scale=1)
@@ -123,6 +125,48 @@ def test_python_serial_workflow_function():
 #     model_python_serial_function.run(samples=x_mcs.samples)
 #     assert np.allclose(np.array(model_python_serial_function.qoi_list).flatten(), np.sum(x_mcs.samples, axis=1))
 
+def test_python_vectorized_workflow_function():
+    model = PythonModel(model_script='python_model.py', model_object_name='sum_rvs', vectorized=True)
+    model_vectorized = RunModel(model=model, samples=x_mcs.samples)
+    assert np.allclose(np.array(model_vectorized.qoi_list), np.sum(x_mcs.samples, axis=1))
+
+
+def test_python_vectorized_workflow_class_batches():
+    model = PythonModel(model_script='python_model.py', model_object_name='SumRVs', batch_size=2)
+    model_vectorized = RunModel(model=model, samples=x_mcs.samples)
+    model_vectorized.run(samples=x_mcs_new.samples)
+    assert model.vectorized
+    assert np.allclose(np.array(model_vectorized.qoi_list),
+                       np.sum(np.vstack((x_mcs.samples, x_mcs_new.samples)), axis=1))
+
+
+def test_python_vectorized_wrong_output():
+    with pytest.raises(ValueError):
+        model = PythonModel(model_script='python_model.py', model_object_name='det_rvs_fixed', vectorized=True,
+                            coeff=1.0)
+        RunModel(model=model, samples=np.eye(3))
+
+
+def test_python_thread_pool_workflow():
+    model = PythonModel(model_script='python_model.py', model_object_name='sum_rvs')
+    with ThreadPoolExecution(max_workers=2) as backend:
+        model_thread_pool = RunModel(model=model, execution_backend=backend, samples=x_mcs.samples)
+        model_thread_pool.run(samples=x_mcs_new.samples)
+    assert np.allclose(np.array(model_thread_pool.qoi_list).flatten(),
+                       np.sum(np.vstack((x_mcs.samples, x_mcs_new.samples)), axis=1))
+
+
+def test_python_process_pool_workflow():
+    model = PythonModel(model_script='python_model.py', model_object_name='SumRVs')
+    with ProcessPoolExecution(max_workers=2, chunks_per_worker=2) as backend:
+        model_process_pool = RunModel(model=model, execution_backend=backend, samples=x_mcs.samples)
+        executor = backend._executor
+        model_process_pool.run(samples=x_mcs_new.samples)
+        assert backend._executor is executor
+    assert np.allclose(np.array(model_process_pool.qoi_list).flatten(),
+                       np.sum(np.vstack((x_mcs.samples, x_mcs_new.samples)), axis=1))
+
+
 @pytest.mark.skip()
 def test_python_parallel_workflow_class():
     model = PythonModel(model_script='python_model.py', model_object_name='SumRVs')
@@ -236,3 +280,160 @@ def test_python_serial_workflow_function_no_objects():
         model = PythonModel(model_script='python_model_blank.py')
         model = RunModel(model=model)
         model.run(x_mcs.samples)
+
+
+def test_results_store_views():
+    model = PythonModel(model_script='python_model.py', model_object_name='sum_rvs', vectorized=True)
+    run_model = RunModel(model=model, samples=x_mcs.samples)
+    run_model.run(samples=x_mcs_new.samples)
+    assert run_model.results.nsamples == 10
+    assert np.allclose(run_model.samples, np.vstack((x_mcs.samples, x_mcs_new.samples)))
+    assert np.allclose(run_model.latest_qoi, np.sum(x_mcs_new.samples, axis=1))
+    assert np.shares_memory(run_model.latest_qoi, run_model.qoi)
+
+
+def test_results_assignment():
+    model = PythonModel(model_script='python_model.py', model_object_name='sum_rvs', vectorized=True)
+    run_model = RunModel(model=model, samples=x_mcs.samples)
+    run_model.qoi_list = [2 * value for value in run_model.qoi_list]
+    assert np.allclose(run_model.qoi, 2 * np.sum(x_mcs.samples, axis=1))
+    run_model.samples = x_mcs_new.samples
+    assert np.allclose(run_model.samples, x_mcs_new.samples)
+    with pytest.raises(ValueError):
+        run_model.qoi = np.zeros(3)
+    run_model.qoi_list = []
+    assert run_model.results.nsamples == 0 and run_model.samples.size == 0
+    run_model.run(samples=x_mcs_new.samples)
+    assert np.allclose(run_model.qoi, np.sum(x_mcs_new.samples, axis=1))
+
+
+def test_results_store_capacity_doubling():
+    store = ResultsStore(initial_capacity=2)
+    for i in range(9):
+        store.append(np.full((1, 2), i, dtype=float), [i])
+    assert store.nsamples == 9 and len(store._samples) == 16
+    assert np.allclose(store.qoi, np.arange(9))
+    assert store.to_list()[-1] == 8
+
+
+def test_results_store_dictionary_columns():
+    store = ResultsStore()
+    store.append(np.zeros((2, 1)), [{'a': 1.0, 'b': [1, 2]}, {'a': 2.0, 'b': [3, 4]}])
+    store.append(np.ones((1, 1)), [{'a': 3.0, 'b': [5, 6]}])
+    assert store.is_structured
+    assert np.allclose(store.column('a'), [1.0, 2.0, 3.0])
+    assert store.column('b').shape == (3, 2)
+    assert store.to_list()[2]['a'] == 3.0
+    with pytest.raises(ValueError):
+        store.append(np.ones((1, 1)), [1.0])
+
+
+def test_results_store_heterogeneous_qoi():
+    store = ResultsStore()
+    store.append(np.zeros((2, 1)), [np.ones(2), np.ones(2)])
+    store.append(np.zeros((1, 1)), [np.ones(3)])
+    assert store.qoi.dtype == object
+    assert [len(value) for value in store.to_list()] == [2, 2, 3]
+
+
+def test_evaluation_cache_skips_known_samples(tmp_path):
+    cache_file = str(tmp_path / 'cache.sqlite')
+    model = PythonModel(model_script='python_model.py', model_object_name='sum_rvs')
+    run_model = RunModel(model=model, cache=EvaluationCache(path=cache_file), samples=x_mcs.samples)
+    repeated_samples = np.vstack((x_mcs.samples[:2], x_mcs_new.samples[:1], x_mcs_new.samples[:1]))
+    run_model.run(samples=repeated_samples)
+    assert run_model.cache.hits == 2 and run_model.cache.misses == 7
+    assert len(run_model.cache) == 6
+    assert run_model.evaluated_sample_indices == [7]
+    assert np.allclose(np.array(run_model.latest_qoi).flatten(), np.sum(repeated_samples, axis=1))
+
+    restarted_model = RunModel(model=model, cache=EvaluationCache(path=cache_file), samples=x_mcs.samples)
+    assert restarted_model.cache.hits == 5 and restarted_model.cache.misses == 0
+    assert restarted_model.evaluated_sample_indices == []
+    assert np.allclose(np.array(restarted_model.qoi_list).flatten(), np.sum(x_mcs.samples, axis=1))
+
+
+def test_evaluation_cache_lru_limit():
+    cache = EvaluationCache(path=':memory:', max_entries=3)
+    keys = ['a', 'b', 'c']
+    cache.put(keys, [1.0, 2.0, 3.0])
+    cache.get(['a'])
+    cache.put(['d'], [4.0])
+    assert set(cache.get(['a', 'b', 'c', 'd'])) == {'a', 'c', 'd'}
+
+
+def test_evaluation_cache_model_identity():
+    cache = EvaluationCache(path=':memory:')
+    model_sum = PythonModel(model_script='python_model.py', model_object_name='sum_rvs')
+    model_det = PythonModel(model_script='python_model.py', model_object_name='det_rvs')
+    assert cache.keys(model_sum, x_mcs.samples[:1]) != cache.keys(model_det, x_mcs.samples[:1])
+
+
+@pytest.mark.parametrize('staging', ['copy', 'symlink', 'hardlink', 'shared-readonly'])
+def test_third_party_async_execution(tmp_path, monkeypatch, staging):
+    test_dir = os.path.dirname(os.path.abspath(__file__))
+    for file_name in ['python_model_sum_scalar.py', 'sum_scalar.py', 'process_third_party_output.py']:
+        shutil.copy(os.path.join(test_dir, file_name), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    names = ['var1', 'var11', 'var111']
+    model = ThirdPartyModel(model_script='python_model_sum_scalar.py', fmt="{:>10.4f}", input_template='sum_scalar.py',
+                            var_names=names, model_object_name="python",
+                            output_script='process_third_party_output.py', output_object_name='read_output',
+                            staging=staging)
+    m = RunModel(model=model, execution_backend=AsyncExecution(max_concurrent_jobs=2))
+    m.run(x_mcs.samples)
+    assert np.allclose(np.array(m.qoi_list).flatten(), np.sum(x_mcs.samples, axis=1), atol=1e-4)
+    assert os.path.isfile(os.path.join(model.model_dir, 'run_4', 'InputFiles', 'sum_scalar_4.py'))
+    assert not os.path.exists(os.path.join(model.model_dir, 'run_4', 'sum_scalar.py'))
+    input_file_size = os.path.getsize(os.path.join(model.model_dir, 'run_4', 'InputFiles', 'sum_scalar_4.py'))
+    if staging == 'copy':
+        assert model.staged_bytes[4] > input_file_size
+    else:
+        assert model.staged_bytes[4] == input_file_size
+
+
+def test_third_party_async_execution_failure(tmp_path, monkeypatch):
+    with open(tmp_path / 'failing_model.py', 'w') as f:
+        f.write("import sys\nimport time\n\n\ndef python(index):\n    if index == 0:\n        sys.exit(1)\n"
+                "    time.sleep(1.5)\n    open('done.txt', 'w').close()\n")
+    with open(tmp_path / 'template.txt', 'w') as f:
+        f.write("x = <var1>\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    model = ThirdPartyModel(model_script='failing_model.py', input_template='template.txt', var_names=['var1'],
+                            model_object_name="python")
+    m = RunModel(model=model, execution_backend=AsyncExecution(max_concurrent_jobs=3))
+    with pytest.raises(RuntimeError):
+        m.run(np.arange(3.).reshape(-1, 1))
+    # the processes of the other evaluations are killed, hence they never complete
+    time.sleep(2)
+    assert not any(os.path.exists(os.path.join(model.model_dir, 'run_' + str(i), 'done.txt')) for i in range(3))
+
+
+def test_async_execution_python_model():
+    model = PythonModel(model_script='python_model.py', model_object_name='sum_rvs')
+    with pytest.raises(TypeError):
+        RunModel(model=model, execution_backend=AsyncExecution(), samples=x_mcs.samples)
+
+
+def test_third_party_staging_error():
+    with pytest.raises(ValueError):
+        ThirdPartyModel(model_script='python_model_sum_scalar.py', input_template='sum_scalar.py',
+                        var_names=['var1', 'var11', 'var111'], model_object_name="python", staging='move')
+
+
+def test_third_party_template_rendering(tmp_path, monkeypatch):
+    test_dir = os.path.dirname(os.path.abspath(__file__))
+    for file_name in ['python_model_sum_scalar.py', 'process_third_party_output.py']:
+        shutil.copy(os.path.join(test_dir, file_name), tmp_path)
+    with open(tmp_path / 'template.txt', 'w') as f:
+        f.write("if a < b:\n    x = <var1>\n    y = <var11[1]>, <var11>\n    z = <var111[1][0]> <var1>\n")
+    monkeypatch.chdir(tmp_path)
+    model = ThirdPartyModel(model_script='python_model_sum_scalar.py', input_template='template.txt',
+                            var_names=['var1', 'var11', 'var111'], model_object_name="python",
+                            output_script='process_third_party_output.py', output_object_name='read_output')
+    sample = [1.5, np.array([2., 3.]), np.arange(4.).reshape(2, 2)]
+    model.initialize([sample])
+    text = model._find_and_replace_var_names_with_values(sample)
+    assert text == "if a < b:\n    x = 1.5\n    y = 3.0, 2.0, 3.0\n    z = 2.0 1.5\n"
+    model.finalize()
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 from UQpy.sampling.mcmc import *
 import UQpy.distributions as Distributions
 
@@ -186,3 +188,186 @@ def test_unconcatenate_chains_mcmc():
     x.run(nsamples=5)
     x.run(nsamples=5)
     assert (round(float(x.samples[-1]), 3) == -0.744)
+
+
+def test_mh_many_chains_log_pdf_consistent():
+    target = Distributions.Normal().log_pdf
+    x = MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=1000, random_state=123,
+                           nsamples_per_chain=20, save_log_pdf=True)
+    assert x.samples.shape == (20000, 1)
+    assert np.allclose(x.log_pdf_values, target(x.samples))
+    assert 0.6 < np.mean(x.acceptance_rate) < 0.8
+
+
+def test_dream_many_chains_high_dimension():
+    x = DREAM(log_pdf_target=lambda x: -0.5 * np.sum(x ** 2, axis=1), seed=np.zeros((50, 100)).tolist(),
+              random_state=123, nsamples_per_chain=20, save_log_pdf=True)
+    assert x.samples.shape == (1000, 100)
+    assert np.allclose(x.log_pdf_values, -0.5 * np.sum(x.samples ** 2, axis=1))
+    assert np.all(np.isfinite(x.samples))
+
+
+def test_accept_reject_kernel():
+    x = MetropolisHastings(dimension=2, log_pdf_target=Distributions.Normal().log_pdf, n_chains=4, random_state=1)
+    current_state, current_log_pdf = np.zeros((4, 2)), np.zeros(4)
+    accept = x._accept_reject(np.array([0.0, -np.inf, 0.0, -np.inf]), np.ones((4, 2)), np.ones(4),
+                              current_state, current_log_pdf)
+    assert accept.tolist() == [True, False, True, False]
+    assert current_state.tolist() == [[1., 1.], [0., 0.], [1., 1.], [0., 0.]]
+    assert current_log_pdf.tolist() == [1., 0., 1., 0.]
+
+
+def test_repeated_runs_grow_chain_buffer():
+    target = Distributions.Normal().log_pdf
+    x = MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=3, random_state=123, save_log_pdf=True)
+    for _ in range(10):
+        x.run(nsamples_per_chain=4)
+    assert x.samples.shape == (120, 1)
+    assert x.nsamples_per_chain == 40
+    assert len(x._samples_buffer) == 64
+    assert np.allclose(x.log_pdf_values, target(x.samples))
+
+
+def test_block_size_matches_iteration_by_iteration():
+    target = Distributions.Normal().log_pdf
+    x = DREAM(dimension=1, log_pdf_target=target, n_chains=4, burn_length=7, jump=3, random_state=1,
+              save_log_pdf=True)
+    y = DREAM(dimension=1, log_pdf_target=target, n_chains=4, burn_length=7, jump=3, random_state=1,
+              save_log_pdf=True, block_size=5)
+    for sampler in (x, y):
+        sampler.run(nsamples_per_chain=10)
+        sampler.run(nsamples_per_chain=13)
+    assert x.iterations_number == y.iterations_number == 76
+    assert np.array_equal(x.samples, y.samples)
+    assert np.array_equal(x.log_pdf_values, y.log_pdf_values)
+
+
+def test_mh_block_size():
+    target = Distributions.Normal().log_pdf
+    x = MetropolisHastings(dimension=2, log_pdf_target=lambda z: target(z[:, 0]) + target(z[:, 1]), n_chains=50,
+                           burn_length=10, jump=2, random_state=123, save_log_pdf=True, block_size=16)
+    x.run(nsamples_per_chain=100)
+    assert x.samples.shape == (5000, 2)
+    assert x.iterations_number == 210
+    assert np.allclose(x.log_pdf_values, target(x.samples[:, 0]) + target(x.samples[:, 1]))
+
+
+def test_storage_resume_matches_in_memory_run(tmp_path):
+    target = Distributions.Normal().log_pdf
+    x = MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=3, burn_length=5, jump=2, random_state=1,
+                           save_log_pdf=True)
+    x.run(nsamples_per_chain=10)
+    x.run(nsamples_per_chain=20)
+    y = MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=3, burn_length=5, jump=2, random_state=1,
+                           save_log_pdf=True, storage=str(tmp_path), nsamples_per_chain=10)
+    assert isinstance(y.samples, np.memmap)
+    del y
+    z = MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=3, burn_length=5, jump=2,
+                           save_log_pdf=True, storage=str(tmp_path))
+    assert z.samples.shape == (30, 1)
+    z.run(nsamples_per_chain=20)
+    assert np.array_equal(x.samples, z.samples)
+    assert np.array_equal(x.log_pdf_values, z.log_pdf_values)
+    samples, log_pdf_values = MCMC.load_storage(str(tmp_path), concatenate_chains=False)
+    assert samples.shape == (30, 3, 1) and log_pdf_values.shape == (30, 3)
+    assert np.array_equal(samples.reshape((-1, 1)), x.samples)
+
+
+@pytest.mark.parametrize("sampler, kwargs", [
+    (DRAM, {"save_covariance": True}),
+    (DREAM, {"crossover_adaptation": (200, 10)}),
+])
+def test_storage_resume_adaptive_sampler(tmp_path, sampler, kwargs):
+    # the proposal covariance of DRAM is adapted every 100 iterations, the crossover probabilities of DREAM every 10
+    target = Distributions.MultivariateNormal(mean=np.zeros(2), cov=np.array([[1., 0.5], [0.5, 2.]])).log_pdf
+    seed = np.random.RandomState(0).randn(4, 2).tolist()
+    x = sampler(log_pdf_target=target, seed=seed, random_state=1, save_log_pdf=True, **kwargs)
+    x.run(nsamples_per_chain=120)
+    x.run(nsamples_per_chain=120)
+    sampler(log_pdf_target=target, seed=seed, random_state=1, save_log_pdf=True, storage=str(tmp_path),
+            nsamples_per_chain=120, **kwargs)
+    z = sampler(log_pdf_target=target, seed=seed, save_log_pdf=True, storage=str(tmp_path), **kwargs)
+    z.run(nsamples_per_chain=120)
+    assert np.array_equal(x.samples, z.samples)
+    assert np.array_equal(x.log_pdf_values, z.log_pdf_values)
+
+
+def test_storage_inconsistent_chains(tmp_path):
+    target = Distributions.Normal().log_pdf
+    MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=3, storage=str(tmp_path), nsamples=30)
+    with pytest.raises(ValueError):
+        MetropolisHastings(dimension=1, log_pdf_target=target, n_chains=2, storage=str(tmp_path))
+
+
+def test_chain_diagnostics_moments():
+    samples = np.random.RandomState(0).randn(1000, 3, 2)
+    diagnostics = ChainDiagnostics(n_chains=3, dimension=2, n_batches=4)
+    for block in np.array_split(samples, 7):
+        diagnostics.update(block)
+    assert diagnostics.batch_size == 128
+    assert np.allclose(diagnostics.mean, np.mean(samples, axis=0))
+    assert np.allclose(diagnostics.variance, np.var(samples, axis=0, ddof=1))
+
+
+def test_mcmc_run_until():
+    x = MetropolisHastings(dimension=2, log_pdf_target=lambda x: -0.5 * np.sum(x ** 2, axis=1), n_chains=4,
+                           random_state=123)
+    assert x.run_until(rhat=1.01, min_ess=400, check_interval=250)
+    assert np.all(x.diagnostics.split_rhat() < 1.01)
+    assert np.all(x.diagnostics.bulk_ess() >= 400)
+    assert x.nsamples_per_chain % 250 == 0
+    assert x.diagnostics.nsamples_per_chain == x.nsamples_per_chain == len(x.samples) // 4
+
+
+def test_mcmc_run_until_max_nsamples():
+    x = MetropolisHastings(dimension=1, log_pdf_target=lambda x: -0.5 * np.sum(x ** 2, axis=1), n_chains=2,
+                           random_state=123)
+    assert not x.run_until(rhat=1.0, max_nsamples_per_chain=150, check_interval=100)
+    assert x.nsamples_per_chain == 150
+
+
+def noisy_log_target(x):
+    return -0.5 * np.sum(x ** 2, axis=1) + 0.1 * np.random.randn(len(x))
+
+
+def test_mcmc_workers_same_as_serial():
+    target = Distributions.Normal().log_pdf
+    x = DREAM(dimension=1, log_pdf_target=target, n_chains=6, random_state=123, nsamples=120)
+    y = DREAM(dimension=1, log_pdf_target=target, n_chains=6, random_state=123, nsamples=120, n_workers=2)
+    assert np.allclose(x.samples, y.samples)
+
+
+def test_mcmc_workers_reproducible():
+    samples = []
+    for n_workers in [1, 3]:
+        x = MetropolisHastings(dimension=2, log_pdf_target=noisy_log_target, n_chains=5, random_state=123,
+                               nsamples_per_chain=20, n_workers=n_workers)
+        samples.append(x.samples)
+    assert np.array_equal(samples[0], samples[1])
+
+
+def batched_log_target(x):
+    if len(x) < 3:
+        raise ValueError("expected a chunk of 3 chains")
+    return -0.5 * np.sum(x ** 2, axis=1)
+
+
+def test_mcmc_workers_evaluate_chunks():
+    x = MetropolisHastings(dimension=2, log_pdf_target=batched_log_target, n_chains=6, random_state=123,
+                           nsamples_per_chain=20, n_workers=2)
+    assert x.samples.shape == (120, 2)
+
+
+def test_mcmc_workers_shut_down_after_run():
+    from UQpy.utilities.WorkerPool import _pool_payloads
+    x = MetropolisHastings(dimension=2, log_pdf_target=noisy_log_target, n_chains=4, random_state=123,
+                           nsamples_per_chain=10, n_workers=2)
+    assert x._worker_pool is None and not _pool_payloads
+    x.run_until(rhat=1.0, max_nsamples_per_chain=30, check_interval=10)
+    assert x._worker_pool is None and not _pool_payloads
+    with x:
+        x.run(nsamples_per_chain=10)
+        pool = x._worker_pool
+        x.run(nsamples_per_chain=10)
+        assert x._worker_pool is pool and len(_pool_payloads) == 1
+    assert x._worker_pool is None and not _pool_payloads
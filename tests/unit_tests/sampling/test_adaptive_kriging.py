@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 from UQpy import GaussianProcessRegression, LinearRegression
 from UQpy.utilities.kernels.euclidean_kernels.RBF import RBF
@@ -165,3 +166,22 @@ def test_akmcs_u_run_from_init():
 
     assert a.samples[23, 0] == -3.781937137406927
     assert a.samples[20, 1] == 0.17610325620498946
+
+
+def test_akmcs_refit_interval():
+    marginals = [Normal(loc=0., scale=4.), Normal(loc=0., scale=4.)]
+    x = MonteCarloSampling(distributions=marginals, nsamples=20, random_state=1)
+    rmodel = RunModel(model=PythonModel(model_script='series.py', model_object_name="series"))
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 10 ** (-3), 10 ** (-2)],
+                                    optimizer=MinimizeOptimizer(method='L-BFGS-B'), optimizations_number=5,
+                                    regression_model=LinearRegression(), random_state=0)
+    fits = []
+    fit = gpr.fit
+    gpr.fit = lambda samples, values, **kwargs: fits.append(len(samples)) or fit(samples, values, **kwargs)
+    a = AdaptiveKriging(distributions=marginals, runmodel_object=rmodel, surrogate=gpr, learning_nsamples=10 ** 3,
+                        n_add=1, learning_function=UFunction(u_stop=2), random_state=2, refit_interval=3)
+    a.run(nsamples=30, samples=x.samples)
+
+    assert fits == [20, 23, 26, 29]
+    assert gpr.samples.shape == (30, 2)
+    assert np.array_equal(gpr.samples, a.samples)
@@ -91,6 +91,29 @@ def test_rect_gerss():
                                             [0.54595797, 0.30005026]]))
 
 
+def test_rect_gerss_refit_interval():
+    marginals = [Uniform(loc=0., scale=2.), Uniform(loc=0., scale=1.)]
+    strata = RectangularStrata(strata_number=[2, 2], random_state=1)
+    x = TrueStratifiedSampling(distributions=marginals, strata_object=strata, nsamples_per_stratum=1)
+    rmodel = RunModel(model=PythonModel(model_script='python_model_function.py', model_object_name="y_func"))
+    bounds = [[10 ** (-4), 10 ** 3], [10 ** (-3), 10 ** 2], [10 ** (-3), 10 ** 2]]
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=[1, 10 ** (-3), 10 ** (-2)],
+                                    optimizer=MinimizeOptimizer(method='L-BFGS-B', bounds=bounds),
+                                    optimizations_number=10, noise=False, regression_model=LinearRegression(),
+                                    random_state=0)
+    fits, updates = [], []
+    fit, update = gpr.fit, gpr.update
+    gpr.fit = lambda samples, values, **kwargs: fits.append(len(samples)) or fit(samples, values, **kwargs)
+    gpr.update = lambda samples, values, **kwargs: updates.append(len(samples)) or update(samples, values, **kwargs)
+    refinement = GradientEnhancedRefinement(strata=x.strata_object, runmodel_object=rmodel, surrogate=gpr,
+                                            refit_interval=3)
+    z = RefinedStratifiedSampling(stratified_sampling=x, random_state=2, refinement_algorithm=refinement)
+    z.run(nsamples=10)
+    assert fits == [4, 7]
+    assert updates == [1, 1, 1, 1]
+    assert gpr.samples.shape == (9, 2)
+
+
 def test_vor_rss():
     """
     Test the 6 samples generated by RSS using voronoi stratification
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from scipy.stats import multivariate_normal, uniform
 from UQpy.distributions import Uniform, JointIndependent, MultivariateNormal
 from UQpy.sampling import MetropolisHastings, ParallelTemperingMCMC
@@ -52,7 +53,32 @@ def test_thermodynamic_integration():
                                  samplers=samplers)
     mcmc.run(nsamples_per_chain=100)
     log_ev = mcmc.evaluate_normalization_constant(compute_potential=compute_potential, log_Z0=0.)
-    assert np.round(log_ev, 4) == 0.203
+    assert np.round(log_ev, 4) == 0.2169
+
+
+def test_parallel_target_evaluated_once_per_iteration():
+    calls = []
+
+    def counted_log_intermediate(x, beta):
+        calls.append(len(x))
+        return log_intermediate(x, beta)
+
+    samplers = [MetropolisHastings(burn_length=10, jump=2, seed=list(seed), dimension=2) for _ in range(len(betas))]
+    mcmc = ParallelTemperingMCMC(log_pdf_intermediate=counted_log_intermediate,
+                                 distribution_reference=prior_distribution,
+                                 n_iterations_between_sweeps=4,
+                                 tempering_parameters=betas,
+                                 random_state=3456,
+                                 save_log_pdf=True, samplers=samplers)
+    calls.clear()
+    mcmc.run(nsamples_per_chain=100)
+    # one evaluation of the initial states of the samplers per level, then one stacked call per iteration
+    n_iterations = mcmc.mcmc_samplers[-1].iterations_number
+    assert len(calls) == len(betas) + 1 + n_iterations
+    assert all(n == len(betas) * len(seed) for n in calls[len(betas):])
+    for sampler, beta in zip(mcmc.mcmc_samplers, betas):
+        assert np.allclose(sampler.log_pdf_values, prior_distribution.log_pdf(sampler.samples)
+                           + log_intermediate(sampler.samples, beta))
 
 
 def likelihood(x, b):
@@ -79,7 +105,7 @@ def test_sequential():
                                    random_state=960242069,
                                    sampler=sampler,
                                    nsamples=100)
-    assert np.round(test.evidence, 4) == 0.0437
+    assert np.round(test.evidence, 4) == 0.0583
 
 
 def test_sequential_recalculated_weights():
@@ -104,7 +130,7 @@ def test_sequential_evaluate_normalization_constant_method_check():
                                    sampler=sampler,
                                    nsamples=100,
                                    random_state=960242069)
-    assert np.round(test.evaluate_normalization_constant(), 4) == 0.0437
+    assert np.round(test.evaluate_normalization_constant(), 4) == 0.0583
 
 
 def test_sequential_proposal_given():
@@ -117,7 +143,7 @@ def test_sequential_proposal_given():
                                    sampler=sampler,
                                    nsamples=100,
                                    random_state=960242069)
-    assert np.round(test.evaluate_normalization_constant(), 4) == 0.0437
+    assert np.round(test.evaluate_normalization_constant(), 4) == 0.0583
 
 
 def test_sequential_seed_given():
@@ -133,5 +159,58 @@ def test_sequential_seed_given():
                                    sampler=sampler,
                                    nsamples=100,
                                    random_state=960242069)
-    assert np.round(test.evaluate_normalization_constant(), 4) == 0.0489
+    assert np.round(test.evaluate_normalization_constant(), 4) == 0.0379
 
+
+
+def test_sequential_evaluates_likelihood_once_per_sample_and_level():
+    prior = JointIndependent(marginals=[Uniform(loc=-2.0, scale=4.0), Uniform(loc=-2.0, scale=4.0)])
+    sampler = MetropolisHastings(dimension=2, n_chains=20)
+    calls = []
+
+    def counted_likelihood(x, b):
+        calls.append((len(x), b))
+        return likelihood(x, b)
+
+    test = SequentialTemperingMCMC(pdf_intermediate=counted_likelihood,
+                                   distribution_reference=prior,
+                                   percentage_resampling=10,
+                                   sampler=sampler,
+                                   nsamples=100,
+                                   random_state=960242069)
+    assert np.round(test.evidence, 4) == 0.0583
+    # Calls outside of the MCMC moves: one for the reference level and one per tempering level, for all samples
+    batch_calls = [c for c in calls if c[0] == 100]
+    assert len(batch_calls) == len(test.tempering_parameters)
+
+
+def test_sequential_resampling_methods():
+    prior = JointIndependent(marginals=[Uniform(loc=-2.0, scale=4.0), Uniform(loc=-2.0, scale=4.0)])
+    for resampling_method in SequentialTemperingMCMC.RESAMPLING_METHODS:
+        sampler = MetropolisHastings(dimension=2, n_chains=20)
+        test = SequentialTemperingMCMC(pdf_intermediate=likelihood,
+                                       distribution_reference=prior,
+                                       percentage_resampling=50,
+                                       resampling_burn_length=2,
+                                       resampling_method=resampling_method,
+                                       sampler=sampler,
+                                       nsamples=100,
+                                       random_state=960242069)
+        assert test.samples.shape == (100, 2)
+        assert test.tempering_parameters[-1] == 1
+
+
+def test_systematic_and_residual_resampling():
+    random_state = np.random.RandomState(0)
+    weight_probabilities = np.array([0.5, 0.25, 0.125, 0.125])
+    for resampling in (SequentialTemperingMCMC._systematic_resampling, SequentialTemperingMCMC._residual_resampling):
+        indices = resampling(weight_probabilities, 8, random_state)
+        assert np.bincount(indices, minlength=4).tolist() == [4, 2, 1, 1]
+
+
+def test_sequential_wrong_resampling_method():
+    prior = JointIndependent(marginals=[Uniform(loc=-2.0, scale=4.0), Uniform(loc=-2.0, scale=4.0)])
+    with pytest.raises(ValueError):
+        SequentialTemperingMCMC(pdf_intermediate=likelihood, distribution_reference=prior,
+                                sampler=MetropolisHastings(dimension=2, n_chains=20), nsamples=100,
+                                resampling_method="stratified")
@@ -440,3 +440,118 @@ def test_hyperparameters_length():
 #     ax.legend(loc='center left', bbox_to_anchor=(1, 0.5))
 #     plt.grid()
 #     plt.show()
+
+
+def test_kernel_blocks():
+    """
+    Test that kernel matrices computed by blocks of rows match the direct computation
+    """
+    from scipy.spatial.distance import cdist
+    x, s = np.random.RandomState(1).normal(size=(50, 3)) + 10, np.random.RandomState(2).normal(size=(40, 3)) + 10
+    lengthscales = np.array([0.5, 1, 2])
+    distances = cdist(x / lengthscales, s / lengthscales)
+    for kernel, expected in [(RBF(memory_budget=1000), np.exp(-distances ** 2 / 2)),
+                             (Matern(nu=1.5, memory_budget=1000),
+                              (1 + np.sqrt(3) * distances) * np.exp(-np.sqrt(3) * distances))]:
+        kernel.kernel_parameter = lengthscales
+        assert np.allclose(kernel.calculate_kernel_matrix(x, s), expected, rtol=0, atol=1e-12)
+        assert np.all(np.diag(kernel.calculate_kernel_matrix(x, x)) == 1)
+
+    kernel = RBF(kernel_parameter=lengthscales, dtype=np.float32)
+    assert kernel.calculate_kernel_matrix(x, s).dtype == np.float32
+    out = np.empty((50, 40))
+    assert RBF(kernel_parameter=lengthscales).calculate_kernel_matrix(x, s, out=out) is out
+    assert np.allclose(out, np.exp(-distances ** 2 / 2), rtol=0, atol=1e-12)
+
+
+def test_predict_covariance():
+    """
+    Test that the standard deviation computed by chunks matches the diagonal of the full predictive covariance
+    """
+    points = np.linspace(-1, 6, 200).reshape(-1, 1)
+    prediction, std = gpr2.predict(points, True)
+    gpr2.kernel.memory_budget = 2000
+    prediction_chunks, std_chunks = gpr2.predict(points, True)
+    gpr2.kernel.memory_budget = 2 ** 28
+    prediction_cov, covariance = gpr2.predict(points, return_cov=True)
+    assert covariance.shape == (200, 200)
+    assert np.allclose(prediction, prediction_chunks) and np.allclose(prediction, prediction_cov)
+    assert np.allclose(std, std_chunks)
+    assert np.allclose(std ** 2, np.diagonal(covariance))
+
+
+def test_fitted_state_cache():
+    """
+    Test that the factorization is computed once per hyperparameters and that the least recently used ones are
+    discarded
+    """
+    gpr6 = GaussianProcessRegression(regression_model=linear_reg, kernel=RBF(), hyperparameters=[2.852, 2.959],
+                                     cache_size=2)
+    gpr6.fit(samples=samples, values=values)
+    points = [[1], [2 * np.pi], [np.pi]]
+    expected = gpr6.predict(points, True)
+    assert np.allclose(gpr6.predict(points, True, hyperparameters=gpr6.hyperparameters), expected)
+    assert len(gpr6._fitted_states) == 1
+
+    calls = []
+    compute_state = gpr6._compute_state
+    gpr6._compute_state = lambda hyperparameters: calls.append(1) or compute_state(hyperparameters)
+    gpr6.predict(points, hyperparameters=[1.0, 2.0])
+    gpr6.predict(points, hyperparameters=[1.0, 2.0])
+    assert len(calls) == 1
+    gpr6.predict(points, hyperparameters=[1.5, 2.0])
+    assert len(gpr6._fitted_states) == 2
+    assert np.allclose(gpr6.predict(points, True), expected)
+    assert len(calls) == 3
+
+
+def test_update():
+    """
+    Test that adding points with a block update of the Cholesky factor gives the same model as fitting on all points
+    """
+    for kwargs in [{"hyperparameters": [2.852, 2.959]},
+                   {"hyperparameters": [2.852, 2.959, 0.001], "noise": True, "regression_model": linear_reg}]:
+        gpr_fit = GaussianProcessRegression(kernel=RBF(), **kwargs)
+        gpr_fit.fit(samples=samples, values=values)
+        gpr_update = GaussianProcessRegression(kernel=RBF(), **kwargs)
+        gpr_update.fit(samples=samples[:12], values=values[:12])
+        gpr_update.update(samples[12:13], values[12:13])
+        gpr_update.update(samples[13:], values[13:])
+        points = np.linspace(-1, 6, 15).reshape(-1, 1)
+        assert np.allclose(gpr_update.predict(points, True), gpr_fit.predict(points, True), atol=1e-6)
+        assert np.allclose(gpr_update.cc, gpr_fit.cc, atol=1e-6)
+        assert np.array_equal(gpr_update.samples, gpr_fit.samples)
+
+
+def test_log_likelihood_gradient():
+    """
+    Test the analytic gradient of the log-likelihood against central differences
+    """
+    x = np.random.RandomState(0).uniform(size=(30, 3))
+    y = np.sin(3 * x).sum(axis=1).reshape(-1, 1)
+    for kernel in [RBF(), Matern(nu=0.5), Matern(nu=1.5), Matern(nu=2.5)]:
+        for noise, fx, p0 in [(False, None, np.log10([0.4, 0.5, 0.6, 1.2])),
+                              (True, linear_reg.r(x), np.log10([0.4, 0.5, 0.6, 1.2, 0.05]))]:
+            value, gradient = GaussianProcessRegression.log_likelihood(p0, kernel, x, y, noise, fx, True)
+            assert value == GaussianProcessRegression.log_likelihood(p0, kernel, x, y, noise, fx)
+            steps = 1e-6 * np.eye(len(p0))
+            finite_differences = [(GaussianProcessRegression.log_likelihood(p0 + step, kernel, x, y, noise, fx)
+                                   - GaussianProcessRegression.log_likelihood(p0 - step, kernel, x, y, noise, fx))
+                                  / 2e-6 for step in steps]
+            assert np.allclose(gradient, finite_differences, rtol=1e-5, atol=1e-6)
+    assert not Matern(nu=2).has_gradient
+
+
+def test_mle_workers():
+    np.random.seed(3)
+    gpr_serial = GaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=[1, 1],
+                                           optimizer=MinimizeOptimizer(method="L-BFGS-B"),
+                                           bounds=[[0.01, 100], [0.1, 10]], optimizations_number=4)
+    gpr_serial.fit(samples=samples, values=values)
+    np.random.seed(3)
+    gpr_workers = GaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=[1, 1],
+                                            optimizer=MinimizeOptimizer(method="L-BFGS-B"),
+                                            bounds=[[0.01, 100], [0.1, 10]], optimizations_number=4, n_workers=2)
+    gpr_workers.fit(samples=samples, values=values)
+    assert gpr_serial.jac
+    assert np.array_equal(gpr_serial.hyperparameters, gpr_workers.hyperparameters)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from UQpy.utilities.kernels.euclidean_kernels import RBF, Matern
+from UQpy.utilities.MinimizeOptimizer import MinimizeOptimizer
+from UQpy.surrogates.gaussian_process.GaussianProcessRegression import GaussianProcessRegression
+from UQpy.surrogates.gaussian_process.SparseGaussianProcessRegression import SparseGaussianProcessRegression
+from UQpy.surrogates.gaussian_process.regression_models import LinearRegression
+
+random_state = np.random.RandomState(0)
+samples = random_state.uniform(0, 5, (40, 2))
+values = np.sin(samples[:, 0]) + np.cos(samples[:, 1])
+points = random_state.uniform(0, 5, (7, 2))
+hyperparameters = [1.0, 1.2, 1.5, 0.01]
+
+
+@pytest.mark.parametrize("approximation", ["FITC", "VFE"])
+def test_all_inducing_points(approximation):
+    # With the training points as inducing points, the sparse approximation is exact
+    gpr = GaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters, noise=True,
+                                    regression_model=LinearRegression())
+    gpr.fit(samples=samples, values=values)
+    sparse_gpr = SparseGaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters,
+                                                 inducing_points=samples, approximation=approximation,
+                                                 regression_model=LinearRegression())
+    sparse_gpr.fit(samples=samples, values=values)
+    prediction, std = gpr.predict(points, return_std=True)
+    sparse_prediction, sparse_std = sparse_gpr.predict(points, return_std=True)
+    assert np.allclose(sparse_prediction, prediction, atol=1e-4)
+    assert np.allclose(sparse_std, std, atol=1e-3)
+
+
+@pytest.mark.parametrize("method", ["kmeans", "greedy"])
+def test_inducing_points_selection(method):
+    x = random_state.uniform(0, 5, (1000, 2))
+    y = np.sin(x[:, 0]) + np.cos(x[:, 1]) + 0.05 * random_state.randn(1000)
+    sparse_gpr = SparseGaussianProcessRegression(kernel=Matern(nu=2.5), hyperparameters=[1, 1, 1, 0.1],
+                                                 inducing_points_number=30, inducing_points_method=method,
+                                                 optimizer=MinimizeOptimizer(method="L-BFGS-B"), random_state=1)
+    sparse_gpr.fit(samples=x, values=y)
+    prediction, std = sparse_gpr.predict(points, return_std=True)
+    assert sparse_gpr.inducing_points.shape[0] <= 30
+    assert np.allclose(prediction.flatten(), np.sin(points[:, 0]) + np.cos(points[:, 1]), atol=0.1)
+    assert np.all(std >= 0) and np.all(std < 0.1)
+    assert np.isclose(sparse_gpr.hyperparameters[-1], 0.05, rtol=0.3)
+
+
+def test_invalid_approximation():
+    with pytest.raises(ValueError):
+        SparseGaussianProcessRegression(kernel=RBF(), hyperparameters=hyperparameters, approximation="SoR")